@@ -0,0 +1,99 @@
+"""Katalog arama maliyeti: eski doğrusal tarama vs. CatalogStore indeksleri.
+
+diziler.json içindeki dizileri çoğaltarak 1k..100k bölümlük sentetik
+kataloglar üretir ve her boyutta bir liste sayfasındaki dizi + bölüm
+kontrollerinin ortalama süresini ölçer.
+
+Kullanım:  python benchmarks/bench_catalog.py [--sizes 1000,10000,100000]
+"""
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_format  # noqa: E402
+from catalog_store import CatalogStore  # noqa: E402
+
+
+def synth_catalog(seed_series, total_episodes):
+    """seed_series'i URL'leri değiştirerek total_episodes bölüme ulaşana kadar çoğaltır."""
+    out = []
+    count = 0
+    i = 0
+    while count < total_episodes:
+        base = seed_series[i % len(seed_series)]
+        s = copy.deepcopy(base)
+        s['url'] = f"{base['url'].rstrip('/')}-{i}/"
+        for ep in s.get('episodes', []):
+            ep['url'] = f"{ep['url'].rstrip('/')}-{i}/"
+        count += len(s.get('episodes', []))
+        out.append(s)
+        i += 1
+    return out
+
+
+def legacy_lookup(all_series, s_url, ep_urls):
+    existing = next((s for s in all_series if s['url'] == s_url), None)
+    if not existing:
+        return 0
+    known_urls = [ep['url'] for ep in existing.get('episodes', []) if 'url' in ep]
+    return sum(1 for u in ep_urls if u in known_urls)
+
+
+def store_lookup(store, s_url, ep_urls):
+    if store.get(s_url) is None:
+        return 0
+    known_urls = store.known_episode_urls(s_url)
+    return sum(1 for u in ep_urls if u in known_urls)
+
+
+def timed(fn, probes):
+    start = time.perf_counter()
+    for s_url, ep_urls in probes:
+        fn(s_url, ep_urls)
+    return (time.perf_counter() - start) / len(probes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--probes', type=int, default=200)
+    parser.add_argument('--seed-file', help="Varsayılan: diziler.jsonl, yoksa diziler.json")
+    args = parser.parse_args()
+    if not args.seed_file:
+        args.seed_file = os.path.join(ROOT, 'diziler.jsonl')
+        if not os.path.exists(args.seed_file):
+            args.seed_file = os.path.join(ROOT, 'diziler.json')
+
+    seed = [s for s in catalog_format.load(args.seed_file) if s.get('episodes')]
+
+    rnd = random.Random(42)
+    print(f"{'bölüm':>8} {'dizi':>7} {'eski (µs)':>12} {'store (µs)':>12} {'yükleme (ms)':>13}")
+    for size in [int(x) for x in args.sizes.split(',')]:
+        catalog = synth_catalog(seed, size)
+
+        start = time.perf_counter()
+        store = CatalogStore.from_records(catalog)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        # Yarısı bilinen, yarısı yeni diziler (liste sayfasındaki karışım gibi)
+        probes = []
+        for _ in range(args.probes):
+            if rnd.random() < 0.5:
+                s = rnd.choice(catalog)
+                probes.append((s['url'], [ep['url'] for ep in s['episodes']]))
+            else:
+                probes.append((f"https://dizipal.cx/dizi/yok-{rnd.random()}/", []))
+
+        legacy = timed(lambda u, e: legacy_lookup(catalog, u, e), probes) * 1e6
+        indexed = timed(lambda u, e: store_lookup(store, u, e), probes) * 1e6
+        print(f"{size:>8} {len(catalog):>7} {legacy:>12.1f} {indexed:>12.1f} {index_ms:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
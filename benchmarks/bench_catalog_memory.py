@@ -0,0 +1,115 @@
+"""Katalog yükleme belleği: eski json.load + sözlükler vs CatalogStore (akış + CompactRecord).
+
+diziler.json'daki dizileri URL'lerini değiştirerek --scale katına çoğaltır,
+kataloğu eski (girintili JSON) ve kanonik JSONL biçimlerinde yazar. Her yöntem
+ayrı alt süreçlerde yüklenir; süreç tepe belleği (VmHWM), yüklemenin
+Python yığınında ayırdığı tepe bellek (tracemalloc, ayrı çalıştırmada),
+yükleme süresi ve tüm dizilerin bölüm kümelerini sorgulama süresi raporlanır:
+  - eski: json.load + URL indeksi + bölüm URL kümeleri (önceki CatalogStore)
+  - store (JSON): CatalogStore'un eski dosyayı parça parça okuması (taşıma)
+  - store (JSONL): CatalogStore'un kanonik dosyayı satır satır okuması
+
+Kullanım:  python benchmarks/bench_catalog_memory.py [--seed diziler.json] [--scale 10]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_format  # noqa: E402
+from bench_catalog import synth_catalog  # noqa: E402
+from catalog_store import CatalogStore  # noqa: E402
+
+MODES = ('legacy', 'store-json', 'store-jsonl')
+
+
+def peak_rss_kb():
+    """Sürecin tepe RSS'i. ru_maxrss fork edilen üst sürecin tepesini taşıyabildiğinden önce VmHWM denenir."""
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(mode, path, traced):
+    """Alt süreçte çalışır: tek bir yöntemle yükler, sonucu JSON olarak yazar."""
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    if mode == 'legacy':
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        index = {r['url']: i for i, r in enumerate(records)}
+        episodes = {r['url']: {ep['url'] for ep in r.get('episodes', []) if 'url' in ep} for r in records}
+        load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        found = sum(len(episodes.get(url, ())) for url in index)
+    else:
+        store = CatalogStore(None)
+        store._read(path)
+        store._reindex()
+        load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        found = sum(len(store.known_episode_urls(r.url)) for r in store.records)
+    lookup_s = time.perf_counter() - start
+    result = {'load_s': load_s, 'lookup_s': lookup_s, 'episodes': found,
+              'rss_kb': peak_rss_kb()}
+    if traced:
+        result['heap_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+    print(json.dumps(result))
+
+
+def run(mode, path, traced=False):
+    cmd = [sys.executable, os.path.abspath(__file__), '--measure', mode, path] + (['--traced'] if traced else [])
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seed', default=os.path.join(ROOT, 'diziler.json'))
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--measure', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    parser.add_argument('--traced', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        measure(*args.measure, args.traced)
+        return
+
+    seed = catalog_format.load(args.seed)
+    total = sum(len(r.get('episodes', [])) for r in seed)
+    records = synth_catalog(seed, total * args.scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, 'diziler.json')
+        canon_path = os.path.join(tmp, 'diziler.jsonl')
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        with open(canon_path, 'w', encoding='utf-8') as f:
+            f.write(catalog_format.dumps(records))
+        print(f"{len(records)} dizi, {sum(len(r.get('episodes', [])) for r in records)} bölüm (x{args.scale}) | "
+              f"JSON {os.path.getsize(legacy_path) / 1024:.0f} KB, JSONL {os.path.getsize(canon_path) / 1024:.0f} KB")
+        print(f"{'yöntem':<12} {'süreç MB':>9} {'yığın MB':>9} {'yükleme ms':>11} {'bölüm sorgu ms':>15}")
+        base = None
+        for mode in MODES:
+            path = canon_path if mode == 'store-jsonl' else legacy_path
+            r = run(mode, path)
+            heap = run(mode, path, traced=True)['heap_kb']
+            base = base or heap
+            print(f"{mode:<12} {r['rss_kb'] / 1024:>9.1f} {heap / 1024:>9.1f} {r['load_s'] * 1000:>11.0f} "
+                  f"{r['lookup_s'] * 1000:>15.1f}   (yığın %{100 * heap / base:.0f}, {r['episodes']} bölüm)")
+
+
+if __name__ == '__main__':
+    main()
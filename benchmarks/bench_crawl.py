@@ -0,0 +1,127 @@
+"""Kayıtlı derlem üzerinde uçtan uca tarama kıyaslaması.
+
+replay_server.py'yi aynı süreçte başlatır, botu (main / main2 / original)
+BASE_DOMAIN=localhost ve SKIP_BROWSER=1 ile geçici bir klasörde çalıştırır,
+duvar saati süresi, istek/sn, ayrıştırılan sayfa sayısı ve botun run report'undaki
+aşama toplam sürelerini raporlar.
+
+Derlem kayıtlı bir site ya da synth_site.py ile üretilmiş sentetik site olabilir;
+birden çok bot / commit için bkz. bench_suite.py.
+
+Kullanım:  python benchmarks/bench_crawl.py --corpus fixtures/site --bot main2 [--latency 30]
+"""
+import argparse
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_format  # noqa: E402
+from fixtures import FixtureCorpus  # noqa: E402
+from replay_server import ReplayConfig, ReplayServer  # noqa: E402
+
+BOTS = {'main': 'main', 'main2': 'main2', 'original': 'original_main_dizi'}
+
+
+def _catalog_size(path):
+    """Kaydedilen katalogdaki kayıt ve bölüm sayısı (hata enjeksiyonunda kayıp olup olmadığını gösterir)."""
+    if not os.path.exists(path):
+        return 0, 0
+    records = catalog_format.load(path)
+    return len(records), sum(len(r.get('episodes', [])) for r in records)
+
+
+def run_crawl(bot, corpus_dir, config, keep_output=None, workdir=None, port=0, bot_args=None):
+    server = ReplayServer(FixtureCorpus(corpus_dir), config, port=port)
+    server.start_background()
+
+    # Modüller ayarlarını içe aktarılırken okur, bu yüzden önce ortam hazırlanır
+    os.environ['BASE_DOMAIN'] = server.base_url
+    os.environ['SKIP_BROWSER'] = '1'
+    # Önbellek kapalı ölçülür; önbellek + ayrıştırma işçileri birlikte bench_suite --cache ile sınanır
+    os.environ['HTTP_CACHE'] = '0'
+    # Sabit bir --workdir (ve --port) ile arka arkaya çalıştırmalar durum dosyalarını paylaşır
+    keep_workdir = workdir is not None
+    workdir = workdir or tempfile.mkdtemp(prefix='bench_crawl_')
+    os.makedirs(workdir, exist_ok=True)
+    old_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import html_backend
+        from metrics import metrics
+        module = importlib.import_module(BOTS[bot])
+        parsed_before = html_backend.pages_parsed
+        start = time.perf_counter()
+        module.main(**(bot_args or {}))
+        wall = time.perf_counter() - start
+        # Rapor, çalışma klasörü silinmeden burada yazılır (atexit'e bırakılmaz)
+        report = metrics.finish() or {}
+        parsed = html_backend.pages_parsed - parsed_before
+        records, episodes = _catalog_size(module.DATA_FILE)
+        if keep_output:
+            shutil.copy(module.DATA_FILE, keep_output)
+    finally:
+        os.chdir(old_cwd)
+        server.shutdown()
+        if not keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'bot': bot,
+        'wall_s': round(wall, 3),
+        'requests': server.stats['requests'],
+        'requests_per_s': round(server.stats['requests'] / wall, 1) if wall else 0,
+        'pages_parsed': parsed,
+        'bytes_sent': server.bytes_sent,
+        'statuses': {str(k): v for k, v in server.stats.items() if k != 'requests'},
+        'records': records,
+        'episodes': episodes,
+        'stage_ms': {name: stage['total_ms'] for name, stage in report.get('stages', {}).items()},
+        'startup': report.get('startup', {}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', required=True)
+    parser.add_argument('--bot', choices=sorted(BOTS), default='main2')
+    parser.add_argument('--latency', type=float, default=0, help="ms")
+    parser.add_argument('--jitter', type=float, default=0, help="ms")
+    parser.add_argument('--error-403', type=float, default=0.0)
+    parser.add_argument('--error-404', type=float, default=0.0)
+    parser.add_argument('--error-429', type=float, default=0.0)
+    parser.add_argument('--error-503', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=1, help="sn")
+    parser.add_argument('--max-rps', type=float, default=0, help="Sunucu tarafı istek/sn sınırı")
+    parser.add_argument('--timeouts', type=float, default=0.0)
+    parser.add_argument('--timeout-s', type=float, default=20, help="Zaman aşımı enjeksiyonunda bekleme (sn)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="Botun ürettiği katalog buraya kopyalanır")
+    parser.add_argument('--workdir', help="Silinmeyen çalışma klasörü (artımlı çalışmalar için)")
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--full', action='store_true', help="Dizi botlarında tam tarama")
+    parser.add_argument('--shard', help="Parça tanımı (pages:1-2 / hash:0/2); birleştirme: merge_shards.py")
+    parser.add_argument('--mode', help="Film botu modu (detail / two-phase / discover / enrich)")
+    args = parser.parse_args()
+
+    config = ReplayConfig(args.latency, args.jitter, args.error_403, args.error_404, args.timeouts, args.timeout_s,
+                          seed=args.seed, error_429=args.error_429, error_503=args.error_503,
+                          retry_after_s=args.retry_after, max_rps=args.max_rps)
+    bot_args = {'full_sweep': True} if args.full else {}
+    if args.shard:
+        bot_args['shard'] = args.shard
+    if args.mode:
+        bot_args['mode'] = args.mode
+    result = run_crawl(args.bot, args.corpus, config, args.output, args.workdir, args.port, bot_args)
+    print("\n📊 Sonuç")
+    for key, value in result.items():
+        print(f"   {key:<16} {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Tek geçişli çıkarıcı vs. eski çok taramalı çıkarıcı (film ve dizi detay sayfaları).
+
+Kayıtlı derlemdeki movie/ ve series/ sayfalarını bir kez ayrıştırır, sonra her
+iki çıkarıcıyı aynı soup'lar üzerinde çalıştırır; sonuçların aynı olduğunu
+doğrular ve sayfa başına süreyi raporlar.
+
+Kullanım:  python benchmarks/bench_extract.py --corpus fixtures/pages [--backend lxml]
+"""
+import argparse
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import html_backend  # noqa: E402
+from bench_parse import load_corpus  # noqa: E402
+from extractors import extract_movie_details, extract_series_details  # noqa: E402
+
+BASE_DOMAIN = "https://dizipal.cx"
+
+
+# --- Eski sürüm (karşılaştırma için birebir kopya) ---
+def legacy_video_source(soup):
+    try:
+        player_area = soup.find('div', class_='video-player-area')
+        if player_area and player_area.find('iframe'): return player_area.find('iframe').get('src')
+        iframes = soup.find_all('iframe')
+        for frame in iframes:
+            if 'embed' in frame.get('src', '') or 'player' in frame.get('src', ''): return frame['src']
+    except: pass
+    return ""
+
+
+def legacy_movie_details(soup, url):
+    details = {
+        "url": url, "videoUrl": "", "description": "Açıklama yok.",
+        "imdb": "0.0", "genres": [], "cast": [], "year": "",
+        "poster": "", "cover_image": "", "platform": "Platform Dışı", "added_date": ""
+    }
+    try:
+        poster_div = soup.find('div', class_='poster')
+        if poster_div and poster_div.find('img'): details['poster'] = poster_div.find('img').get('src')
+        head_div = soup.find('div', id='head')
+        if head_div and "url('" in head_div.get('style', ''):
+            details['cover_image'] = head_div['style'].split("url('")[1].split("')")[0]
+        details["videoUrl"] = legacy_video_source(soup)
+        platform_link = soup.find('a', href=lambda x: x and '/platform/' in x)
+        if platform_link: details['platform'] = platform_link.get_text(strip=True)
+        upload_icon = soup.find('img', src=lambda x: x and 'Upload.svg' in x)
+        if upload_icon: details['added_date'] = upload_icon.parent.get_text(strip=True)
+        calendar_icon = soup.find('img', src=lambda x: x and 'Calendar.svg' in x)
+        if calendar_icon: details['year'] = calendar_icon.parent.get_text(strip=True)
+        summ = soup.find('p', class_='summary-text')
+        if summ: details["description"] = summ.get_text(strip=True)
+        info_boxes = soup.find_all('div', class_=lambda x: x and 'bg-white/[4%]' in x)
+        for box in info_boxes:
+            txt = box.get_text()
+            if "IMDB" in txt: details["imdb"] = box.find_next('div').get_text(strip=True)
+            elif "Tür" in txt: details["genres"] = [a.get_text(strip=True) for a in box.find_all('a')]
+            elif "Oyuncular" in txt: details["cast"] = [a.get_text(strip=True) for a in box.find_all('a')]
+            elif "Yapım Yılı" in txt and not details["year"]: details["year"] = box.find_next('div').get_text(strip=True)
+    except: pass
+    return details
+
+
+def legacy_series_details(soup, url):
+    meta = {"url": url, "title": "", "year": "", "description": "", "poster": "",
+            "cover_image": "", "imdb": "0", "genres": [], "episodes": []}
+    season_links = []
+    h1 = soup.find('h1')
+    if h1:
+        full_text = h1.get_text(" ", strip=True)
+        if '(' in full_text:
+            parts = full_text.split('(')
+            meta['title'] = parts[0].strip()
+            meta['year'] = parts[-1].replace(')', '').strip()
+        else:
+            meta['title'] = full_text
+    summary = soup.find('p', class_='summary-text')
+    if summary: meta['description'] = summary.get_text(strip=True)
+    poster_div = soup.find('div', class_='poster')
+    if poster_div and poster_div.find('img'):
+        meta['poster'] = poster_div.find('img').get('src')
+    head_div = soup.find('div', id='head', class_='cover-image')
+    if head_div and head_div.has_attr('style') and "url('" in head_div['style']:
+        meta['cover_image'] = head_div['style'].split("url('")[1].split("')")[0]
+    imdb_span = soup.find('span', string=lambda t: t and "IMDB Puanı" in t)
+    if imdb_span:
+        parent = imdb_span.find_parent('div')
+        score = parent.find('h4') if parent else None
+        if score: meta['imdb'] = score.get_text(strip=True)
+    genre_links = soup.find_all('a', href=lambda h: h and 'dizi-kategori' in h)
+    meta['genres'] = list(set([g.get_text(strip=True) for g in genre_links]))
+    season_div = soup.find('div', id='season-options-list')
+    if season_div:
+        for l in season_div.find_all('a', href=True):
+            full_link = urljoin(BASE_DOMAIN, l['href'])
+            if full_link not in season_links:
+                season_links.append(full_link)
+    return meta, season_links
+
+
+def run(fn, soups, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url, soup in soups:
+            fn(soup, url)
+    return (time.perf_counter() - start) / (rounds * len(soups))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', required=True)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--backend', default=html_backend.get_backend())
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    cases = [
+        ('movie', legacy_movie_details, extract_movie_details),
+        ('series', legacy_series_details, lambda soup, url: extract_series_details(soup, url, BASE_DOMAIN)),
+    ]
+    print(f"{'tür':<8} {'sayfa':>6} {'eski (ms)':>10} {'tek geçiş (ms)':>15} {'hızlanma':>9}  sonuç")
+    for kind, legacy, single in cases:
+        soups = [(f"corpus://{kind}/{name}", html_backend.make_soup(content, args.backend))
+                 for k, name, content in pages if k == kind]
+        if not soups:
+            continue
+        same = all(legacy(soup, url) == single(soup, url) for url, soup in soups)
+        old_ms = run(legacy, soups, args.rounds) * 1000
+        new_ms = run(single, soups, args.rounds) * 1000
+        print(f"{kind:<8} {len(soups):>6} {old_ms:>10.2f} {new_ms:>15.2f} {old_ms / new_ms:>8.1f}x  "
+              f"{'AYNI' if same else 'FARKLI!'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""index.html ilk yükleme boyutu: tam katalog vs özet + arama indeksi + parçalar.
+
+Verilen katalog JSON'undan catalog_export ile geçici bir klasöre özet ve
+parçaları üretir; ilk açılışta indirilen bayt (ham ve gzip) ile bir detay
+penceresinin ek yükünü karşılaştırır.
+
+Kullanım:  python benchmarks/bench_frontend_load.py diziler.json [--kind series]
+"""
+import argparse
+import glob
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from catalog_export import export_catalog, output_paths  # noqa: E402
+
+
+def sizes(data):
+    return len(data), len(gzip.compress(data, 6))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('data_file')
+    parser.add_argument('--kind', choices=('movies', 'series'))
+    args = parser.parse_args()
+
+    with open(args.data_file, 'rb') as f:
+        full = f.read()
+    records = json.loads(full)
+    kind = args.kind or ('series' if any('episodes' in r for r in records) else 'movies')
+
+    workdir = tempfile.mkdtemp(prefix='bench_frontend_')
+    try:
+        target = os.path.join(workdir, os.path.basename(args.data_file))
+        export_catalog(records, target, kind)
+        summary_path, shard_dir, index_path = output_paths(target)
+        with open(summary_path, 'rb') as f:
+            summary = f.read()
+        with open(index_path, 'rb') as f:
+            index = f.read()
+        shards = []
+        for path in glob.glob(os.path.join(shard_dir, '*.json')):
+            with open(path, 'rb') as f:
+                shards.append(sizes(f.read()))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    full_raw, full_gz = sizes(full)
+    sum_raw, sum_gz = sizes(summary)
+    idx_raw, idx_gz = sizes(index)
+    avg_raw = sum(s[0] for s in shards) // max(len(shards), 1)
+    avg_gz = sum(s[1] for s in shards) // max(len(shards), 1)
+    max_raw = max((s[0] for s in shards), default=0)
+
+    print(f"{len(records)} kayıt ({kind}), {len(shards)} parça")
+    print(f"{'':<28} {'ham KB':>9} {'gzip KB':>9}")
+    print(f"{'önce: tam katalog':<28} {full_raw / 1024:>9.1f} {full_gz / 1024:>9.1f}")
+    print(f"{'sonra: özet':<28} {sum_raw / 1024:>9.1f} {sum_gz / 1024:>9.1f}")
+    print(f"{'sonra: arama indeksi':<28} {idx_raw / 1024:>9.1f} {idx_gz / 1024:>9.1f}")
+    sum_raw, sum_gz = sum_raw + idx_raw, sum_gz + idx_gz
+    print(f"{'sonra: ilk açılış toplam':<28} {sum_raw / 1024:>9.1f} {sum_gz / 1024:>9.1f}")
+    print(f"{'detay penceresi (ort. parça)':<28} {avg_raw / 1024:>9.1f} {avg_gz / 1024:>9.1f}")
+    print(f"{'en büyük parça':<28} {max_raw / 1024:>9.1f}")
+    print(f"İlk açılış: %{100 * (1 - sum_raw / full_raw):.1f} daha az (gzip: %{100 * (1 - sum_gz / full_gz):.1f})")
+
+
+if __name__ == '__main__':
+    main()
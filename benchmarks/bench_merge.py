@@ -0,0 +1,149 @@
+"""Parça birleştirme (merge_shards) doğruluk ve hız kıyaslaması.
+
+diziler.json'daki dizileri --scale katına çoğaltıp ana katalog yapar, ardından
+--shards parçalık bir çalışmayı CatalogStore'un parça moduyla (base_path)
+taklit eder: her parça hash'ine düşen dizilerin bir kısmına yeni bölüm ekler,
+bir alanı değiştirir, yeni dizi ekler. Sayfa parçalarında olduğu gibi bazı
+diziler iki parçada birden (farklı bölüm ve alanlarla) güncellenir.
+Birleştirme sonucu bağımsız hesaplanan beklenen katalogla karşılaştırılır,
+girdiler ters sırayla verildiğinde çıktının bayt bayt aynı olduğu doğrulanır
+ve birleştirme süresi raporlanır.
+
+Kullanım:  python benchmarks/bench_merge.py [--scale 10] [--shards 4] [--overlap 0.05]
+"""
+import argparse
+import copy
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_format  # noqa: E402
+import merge_shards  # noqa: E402
+from bench_catalog import synth_catalog  # noqa: E402
+from catalog_store import CatalogStore  # noqa: E402
+from journal import atomic_write_json  # noqa: E402
+from shard import MANIFEST_SUFFIX, ShardSpec  # noqa: E402
+
+
+def new_episode(record, tag):
+    ep = copy.deepcopy(record['episodes'][-1]) if record.get('episodes') else {'title': ''}
+    ep['url'] = f"{record['url'].rstrip('/')}/yeni-{tag}/"
+    ep['title'] = f"{ep.get('title', '')} ({tag})"
+    return ep
+
+
+def plan(records, shards, overlap, seed):
+    """Her parçanın yapacağı değişiklikler: [(parça, [(işlem, url, değer)])]"""
+    rng = random.Random(seed)
+    work = []
+    for k in range(shards):
+        spec = ShardSpec(index=k, count=shards)
+        owned = [r for r in records if spec.owns(r['url'])]
+        # Komşu parçanın dizilerinden bir kısmı: aynı dizi iki parçada (sayfa kayması)
+        other = ShardSpec(index=(k + 1) % shards, count=shards)
+        extra = [r for r in records if other.owns(r['url']) and rng.random() < overlap]
+        ops = []
+        for r in rng.sample(owned, max(1, len(owned) // 10)) + extra:
+            ops.append(('episode', r['url'], new_episode(r, f"s{k}")))
+        for r in rng.sample(owned, max(1, len(owned) // 20)) + extra:
+            # Tabanda bulunmayan bir değer: tabana eşit yazım 'değişiklik yok' sayılır
+            ops.append(('field', r['url'], {'imdb': f"{rng.randint(0, 9)}.{rng.randint(0, 9)} (p{k})"}))
+        fresh = copy.deepcopy(rng.choice(records))
+        fresh['url'] = f"{fresh['url'].rstrip('/')}-parca-{k}/"
+        for ep in fresh.get('episodes', []):
+            ep['url'] = f"{ep['url'].rstrip('/')}-parca-{k}/"
+        ops.append(('upsert', fresh['url'], fresh))
+        work.append((spec, ops))
+    return work
+
+
+def run_shards(workdir, data_file, work):
+    """Parçaları CatalogStore parça moduyla çalıştırır; bitiş zamanları parça sırasıyla artar."""
+    paths = []
+    for order, (spec, ops) in enumerate(work):
+        partial = os.path.join(workdir, 'shards', os.path.basename(spec.path(data_file)))
+        store = CatalogStore(partial, base_path=data_file).load()
+        for op, url, value in ops:
+            if op == 'episode':
+                store.add_episodes(url, [copy.deepcopy(value)])
+            elif op == 'field':
+                store.update_fields(url, value)
+            else:
+                store.upsert(copy.deepcopy(value))
+        store.compact()
+        atomic_write_json(partial + MANIFEST_SUFFIX, {'shard': str(spec), 'kind': 'series',
+                                                      'finished_at': 1000 + order, 'records': store.touched_count()})
+        paths.append(partial)
+    return paths
+
+
+def expected(records, work):
+    """Aynı değişikliklerin basit sözlüklerle, parça sırasıyla uygulanmış hali."""
+    by_url = {r['url']: copy.deepcopy(r) for r in records}
+    for _, ops in work:
+        for op, url, value in ops:
+            if op == 'episode':
+                eps = by_url[url].setdefault('episodes', [])
+                if value['url'] not in {ep['url'] for ep in eps}:
+                    eps.append(copy.deepcopy(value))
+            elif op == 'field':
+                by_url[url].update(value)
+            else:
+                by_url[url] = copy.deepcopy(value)
+    return by_url
+
+
+def strip_hashes(record):
+    record = {k: v for k, v in record.items() if k != 'hash'}
+    if 'episodes' in record:
+        record['episodes'] = [{k: v for k, v in ep.items() if k != 'hash'} for ep in record['episodes']]
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seed-file', default=os.path.join(ROOT, 'diziler.json'))
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--overlap', type=float, default=0.05, help="İki parçada birden güncellenen dizi oranı")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    seed = catalog_format.load(args.seed_file)
+    records = synth_catalog(seed, sum(len(r.get('episodes', [])) for r in seed) * args.scale)
+    work = plan(records, args.shards, args.overlap, args.seed)
+    want = expected(records, work)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = []
+        for label, reverse in (('sıralı', False), ('ters', True)):
+            workdir = os.path.join(tmp, label)
+            os.makedirs(os.path.join(workdir, 'shards'))
+            data_file = os.path.join(workdir, 'diziler.jsonl')
+            CatalogStore.from_records(records, data_file).compact()
+            partials = run_shards(workdir, data_file, work)
+            start = time.perf_counter()
+            summary = merge_shards.merge(data_file, partials[::-1] if reverse else partials, 'series', export=False)
+            elapsed = time.perf_counter() - start
+            with open(data_file, 'rb') as f:
+                outputs.append(f.read())
+            got = {r['url']: strip_hashes(r) for r in catalog_format.load(data_file)}
+            ok = got == {url: strip_hashes(r) for url, r in want.items()}
+            print(f"{label:<6} {summary['partials']} parça, {summary['records']} kayıt "
+                  f"(+{summary['added']} / ~{summary['updated']} / ={summary['unchanged']}) "
+                  f"{elapsed * 1000:.0f} ms | beklenenle {'AYNI' if ok else 'FARKLI'}")
+            shutil.rmtree(workdir)
+        overlap = sum(1 for _, ops in work for op, url, _ in ops if op == 'episode') - len(
+            {url for _, ops in work for op, url, _ in ops if op == 'episode'})
+        print(f"{len(records)} dizi, {overlap} dizi birden çok parçada | girdi sırasından bağımsız: "
+              f"{'EVET' if outputs[0] == outputs[1] else 'HAYIR'}")
+
+
+if __name__ == '__main__':
+    main()
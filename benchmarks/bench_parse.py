@@ -0,0 +1,145 @@
+"""HTML ayrıştırıcı arka uçlarının karşılaştırması.
+
+Kayıtlı sayfa derlemini (corpus) her arka uçla ayrı bir süreçte ayrıştırır ve
+sayfa/sn ile tepe bellek (peak RSS) değerlerini raporlar. --check verilirse
+get_full_movie_details / get_full_series_details / get_video_source
+sonuçlarının tüm arka uçlarda birebir aynı olduğunu da doğrular.
+
+Derlem düzeni:  <corpus>/{listing,movie,series,episode}/*.html
+                ya da replay_server.py'nin kullandığı kayıt derlemi (index.json)
+
+Kullanım:  python benchmarks/bench_parse.py --corpus fixtures/pages [--check]
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import html_backend  # noqa: E402
+
+KINDS = ('listing', 'movie', 'series', 'episode')
+
+
+def load_corpus(corpus_dir):
+    if os.path.exists(os.path.join(corpus_dir, 'index.json')):
+        return load_fixture_corpus(corpus_dir)
+    pages = []
+    for kind in KINDS:
+        for path in sorted(glob.glob(os.path.join(corpus_dir, kind, '*.html'))):
+            with open(path, 'rb') as f:
+                pages.append((kind, os.path.basename(path), f.read()))
+    return pages
+
+
+def load_fixture_corpus(corpus_dir):
+    """fixtures.py kayıtlarını URL sınıfına göre türlere ayırır (sezon sayfaları 'series' sayılır)."""
+    from fixtures import FixtureCorpus
+    from http_cache import url_class
+
+    corpus = FixtureCorpus(corpus_dir)
+    pages = []
+    for key, entry in sorted(corpus.pages.items()):
+        if entry['status'] != 200 or not entry.get('file'):
+            continue
+        kind = url_class(key)
+        kind = 'series' if kind == 'season' else kind
+        pages.append((kind, key.strip('/').replace('/', '_') or 'index', corpus.body(key)))
+    return pages
+
+
+def _bench_worker(backend, corpus_dir, rounds, queue):
+    pages = load_corpus(corpus_dir)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, _, content in pages:
+            html_backend.make_soup(content, backend)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((len(pages) * rounds, elapsed, peak_kb))
+
+
+def bench_backend(backend, corpus_dir, rounds):
+    # Her arka uç temiz bir süreçte ölçülür ki tepe bellek birbirine karışmasın
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_bench_worker, args=(backend, corpus_dir, rounds, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def extract_all(backend, pages):
+    """Derlemdeki sayfaları botların çıkarıcılarıyla işler (ağ istekleri derlemden cevaplanır)."""
+    import main
+    import main2
+
+    by_url = {f"corpus://{kind}/{name}": content for kind, name, content in pages}
+
+    def fake_soup(url, cookies, user_agent):
+        content = by_url.get(url)
+        return html_backend.make_soup(content, backend) if content is not None else "404"
+
+    def fake_fetch(urls, cookies, user_agent, referer, **kwargs):
+        return [fake_soup(url, cookies, user_agent) for url in urls]
+
+    def fake_extracted(urls, kind, cookies, user_agent, referer, base_domain='', **kwargs):
+        from parse_pool import EXTRACTORS
+        results = []
+        for url in urls:
+            soup = fake_soup(url, cookies, user_agent)
+            results.append(soup if isinstance(soup, str) else EXTRACTORS[kind](soup, url, base_domain))
+        return results
+
+    main.get_soup_fast = main2.get_soup_fast = fake_soup
+    main2.fetch_soups = fake_fetch
+    main2.fetch_extracted = fake_extracted
+
+    results = {}
+    for kind, name, content in pages:
+        url = f"corpus://{kind}/{name}"
+        if kind == 'movie':
+            results[url] = main.get_full_movie_details(url, {}, '')
+        elif kind == 'series':
+            results[url] = main2.get_full_series_details(url, {}, '')
+        elif kind == 'episode':
+            results[url] = main2.get_video_source(html_backend.make_soup(content, backend))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', required=True)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--backends', default=','.join(html_backend.BACKENDS))
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        sys.exit(f"Derlem boş: {args.corpus}")
+    backends = args.backends.split(',')
+
+    print(f"{len(pages)} sayfa, {args.rounds} tur")
+    print(f"{'arka uç':<12} {'sayfa/sn':>10} {'tepe RSS (MB)':>14}")
+    for backend in backends:
+        count, elapsed, peak_kb = bench_backend(backend, args.corpus, args.rounds)
+        print(f"{backend:<12} {count / elapsed:>10.1f} {peak_kb / 1024:>14.1f}")
+
+    if args.check:
+        reference = extract_all(backends[0], pages)
+        for backend in backends[1:]:
+            other = extract_all(backend, pages)
+            diffs = [url for url in reference if reference[url] != other.get(url)]
+            status = "AYNI" if not diffs else f"{len(diffs)} FARK: {diffs[:5]}"
+            print(f"🔎 {backends[0]} vs {backend}: {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""parse_pool işçi sayısına göre ayrıştırma + çıkarım ölçeklenmesi.
+
+Kayıtlı derlemdeki film / dizi / bölüm sayfalarını parse_pool.run_extractor ile
+1, 2, 4 ... işçide işler; sayfa/sn, tek işçiye göre hızlanma ve sonuçların
+işçisiz çalışmayla birebir aynı olup olmadığını raporlar. Ağ yoktur, yalnızca
+CPU tarafı ölçülür.
+
+Kullanım:  python benchmarks/bench_parse_pool.py --corpus fixtures/site [--workers 1,2,4] [--rounds 5]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_parse import load_corpus  # noqa: E402
+from parse_pool import run_extractor  # noqa: E402
+
+# bench_parse türü -> parse_pool çıkarıcısı
+EXTRACTOR_KIND = {'movie': 'movie', 'series': 'series', 'episode': 'video'}
+
+
+def build_jobs(pages):
+    return [(EXTRACTOR_KIND[kind], f"corpus://{kind}/{name}", content)
+            for kind, name, content in pages if kind in EXTRACTOR_KIND]
+
+
+def _run_job(job):
+    kind, url, content = job
+    return run_extractor(kind, url, content, 'https://dizipal.cx')[0]
+
+
+def run(jobs, workers, rounds):
+    """(sayfa/sn, sonuçlar) döner. workers=1 ana süreçte, havuzsuz çalışır."""
+    work = jobs * rounds
+    if workers <= 1:
+        start = time.perf_counter()
+        results = [_run_job(job) for job in work]
+        return len(work) / (time.perf_counter() - start), results[:len(jobs)]
+
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        list(pool.map(_run_job, jobs[:workers]))  # işçileri ısıt (import maliyeti ölçülmesin)
+        chunk = max(1, len(work) // (workers * 8))
+        start = time.perf_counter()
+        results = list(pool.map(_run_job, work, chunksize=chunk))
+        return len(work) / (time.perf_counter() - start), results[:len(jobs)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', required=True)
+    parser.add_argument('--workers', help="Virgülle ayrılmış işçi sayıları (varsayılan: 1, 2, 4 ... çekirdek sayısı)")
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    jobs = build_jobs(load_corpus(args.corpus))
+    if not jobs:
+        sys.exit(f"Derlemde film / dizi / bölüm sayfası yok: {args.corpus}")
+
+    cores = os.cpu_count() or 1
+    if args.workers:
+        counts = [int(w) for w in args.workers.split(',')]
+    else:
+        counts = sorted({1, cores} | {2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores})
+
+    print(f"{len(jobs)} sayfa x {args.rounds} tur, {cores} çekirdek")
+    print(f"{'işçi':>5} {'sayfa/sn':>10} {'hızlanma':>9}  sonuç")
+    base_rate = reference = None
+    for workers in counts:
+        rate, results = run(jobs, workers, args.rounds)
+        if reference is None:
+            base_rate, reference = rate, results
+        same = "AYNI" if results == reference else "FARKLI"
+        print(f"{workers:>5} {rate:>10.1f} {rate / base_rate:>8.2f}x  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Öncelikli yenileme (refresh_scheduler) simülasyonu.
+
+Ağ yoktur: N dizilik sentetik bir katalog (az sayıda yayında olan, çoğu bitmiş
+dizi) günde iki çalışmayla D gün boyunca simüle edilir. Her stratejinin
+çalışma başına istek sayısı, bulduğu yeni bölüm oranı ve bölüm çıktıktan
+sonra bulunana kadar geçen ortalama süre raporlanır:
+  - tam tarama: her çalışmada tüm diziler açılır (eski davranış)
+  - öncelikli: refresh_scheduler.plan_refresh (vadesi dolanlar + bütçe)
+  - rastgele: öncelikliyle aynı çalışma başına istekle rastgele seçilen diziler
+
+Kullanım:  python benchmarks/bench_refresh.py [--series 2000] [--days 60] [--budget 120]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from crawl_state import NEW_EPISODE_HISTORY, estimated_visit_cost  # noqa: E402
+from refresh_scheduler import DAY, REFRESH_MIN_DAYS, plan_refresh  # noqa: E402
+
+RUN_EVERY = DAY / 2
+PAGE_SIZE = 24
+
+
+def synthetic_series(n, start, days, seed):
+    """Her dizi için kayıt ve simülasyon süresince çıkacak bölüm zamanları."""
+    rng = random.Random(seed)
+    year = time.gmtime(start).tm_year
+    series = []
+    for i in range(n):
+        kind = rng.random()
+        if kind < 0.08:      # haftalık yayında
+            cadence, rec_year = 7 + rng.uniform(-0.5, 0.5), year
+        elif kind < 0.10:    # günlük yayında
+            cadence, rec_year = 1 + rng.uniform(-0.2, 0.2), year
+        elif kind < 0.15:    # ara verip dönen (düzensiz)
+            cadence, rec_year = rng.uniform(20, 60), year - rng.randint(0, 2)
+        else:                # bitmiş
+            cadence, rec_year = None, year - rng.randint(1, 15)
+        releases = []
+        if cadence:
+            t = start - rng.uniform(0, cadence) * DAY
+            # Geçmiş bölümler: zamanlayıcının sıklık geçmişi boş başlamasın diye dahil
+            history = [t - k * cadence * DAY for k in range(NEW_EPISODE_HISTORY, 0, -1)]
+            while t < start + days * DAY:
+                releases.append(t)
+                t += cadence * DAY * rng.uniform(0.9, 1.1)
+        else:
+            history = []
+        record = {'url': f"https://example.test/dizi/s{i}/", 'year': str(rec_year),
+                  'episodes': [{'url': f"https://example.test/bolum/s{i}-1-sezon-1-bolum-izle/"}]}
+        series.append({'record': record, 'releases': releases, 'history': history})
+    return series
+
+
+def simulate(series, start, days, strategy, budget, seed):
+    rng = random.Random(seed)
+    state = {}
+    for s in series:
+        # Başlangıçta her dizi son tam taramada (son 7 gün içinde) kontrol edilmiş sayılır
+        state[s['record']['url']] = {'checked_at': start - rng.uniform(0, REFRESH_MIN_DAYS) * DAY,
+                                     'new_at': [int(t) for t in s['history']]}
+    # Bulunan bölüm sayısı; başlangıçtan önce çıkanlar zaten katalogda
+    known = {s['record']['url']: len([t for t in s['releases'] if t < start]) for s in series}
+    by_url = {s['record']['url']: s for s in series}
+    requests = found = 0
+    delays = []
+    runs = int(days * DAY / RUN_EVERY)
+    for run in range(runs):
+        now = start + run * RUN_EVERY
+        # 1. sayfa: en son bölüm çıkan PAGE_SIZE dizi
+        latest = sorted(((max([t for t in s['releases'] if t <= now], default=0), s['record']['url'])
+                         for s in series), reverse=True)[:PAGE_SIZE]
+        for t, url in latest:
+            if t:
+                state[url]['page1_at'] = now
+        if strategy == 'full':
+            queue = list(by_url)
+        elif strategy == 'random':
+            queue = rng.sample(list(by_url), len(by_url))
+        else:
+            mandatory, optional = plan_refresh([s['record'] for s in series], state, now=now)
+            queue = mandatory + optional
+            mandatory = set(mandatory)
+        spent = budget_spent = 0
+        for url in queue:
+            cost = estimated_visit_cost(by_url[url]['record'])
+            if strategy == 'priority' and url in mandatory:
+                spent += cost  # vadesi dolanlar bütçe dışı
+            elif strategy != 'full' and budget_spent + cost > budget:
+                break
+            else:
+                budget_spent += cost
+                spent += cost
+            released = [t for t in by_url[url]['releases'] if t <= now]
+            fresh = released[known[url]:]
+            entry = state[url]
+            entry['checked_at'] = now
+            if fresh:
+                found += len(fresh)
+                delays.extend(now - t for t in fresh)
+                known[url] = len(released)
+                entry['new_at'] = (entry.get('new_at', []) + [int(now)])[-NEW_EPISODE_HISTORY:]
+        requests += spent
+    end = start + (runs - 1) * RUN_EVERY
+    total = sum(len([t for t in s['releases'] if start <= t <= end]) for s in series)
+    return {
+        'requests_per_run': requests / runs,
+        'found_pct': 100 * found / total if total else 0,
+        'delay_h': sum(delays) / len(delays) / 3600 if delays else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--series', type=int, default=2000)
+    parser.add_argument('--days', type=float, default=60)
+    parser.add_argument('--budget', type=int, default=120, help="Çalışma başına istek bütçesi")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.time()
+    series = synthetic_series(args.series, start, args.days, args.seed)
+    print(f"{args.series} dizi, {args.days:.0f} gün, günde 2 çalışma, bütçe {args.budget} istek")
+    print(f"{'strateji':<12} {'istek/çalışma':>14} {'bulunan %':>10} {'ort. gecikme (sa)':>18}")
+    base = None
+    budget = args.budget
+    for strategy in ('full', 'priority', 'random'):
+        r = simulate(series, start, args.days, strategy, budget, args.seed)
+        base = base or r['requests_per_run']
+        if strategy == 'priority':
+            budget = r['requests_per_run']
+        print(f"{strategy:<12} {r['requests_per_run']:>14.0f} {r['found_pct']:>10.1f} {r['delay_h']:>18.1f}"
+              f"   (%{100 * r['requests_per_run'] / base:.0f} istek)")
+
+
+if __name__ == '__main__':
+    main()
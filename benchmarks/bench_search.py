@@ -0,0 +1,105 @@
+"""Arama / filtre indeksi kıyaslaması (sentetik katalog).
+
+Rastgele Türkçe kelimelerle N başlıklı (varsayılan 50.000) bir katalog üretir,
+search_index.build_index ile indeksler; indeks boyutunu (ham / gzip) ve bir
+sorgu kümesinin gecikmesini eski yöntemle (her kayıtta küçük harf + içerir
+taraması, index.html'deki eski filterFilms) karşılaştırır. İndeks sonuçları
+kelime başı eşleşmesi yapan düz bir taramayla birebir doğrulanır.
+
+Kullanım:  python benchmarks/bench_search.py [--titles 50000] [--seed 1]
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from search_index import build_index, search, tokenize  # noqa: E402
+
+WORDS = ("aşk ışık İstanbul kırmızı gölge şehir yıldız deniz gece sonsuz kayıp dünya "
+         "yol zaman ölüm hayat kalp son ilk büyük küçük sır savaş barış çocuk anne baba "
+         "kardeş kral kraliçe orman dağ rüzgar ateş su toprak gökyüzü umut korku yalan "
+         "gerçek rüya masal efsane kahraman dost düşman Şahin Güneş Ilgaz Çağlar Öykü").split()
+GENRES = ("Aile Aksiyon Animasyon Belgesel Bilimkurgu Dram Fantastik Gerilim Gizem "
+          "Komedi Korku Macera Romantik Suç Tarih Yerli").split()
+PLATFORMS = ("Netflix", "Disney+", "Amazon", "BluTV", "Exxen", "Platform Dışı")
+SYLLABLES = "ka le mi ro su da ne ya tı gü şe ça bo dü ri an el on ur iz ay öz".split()
+QUERIES = ("aşk", "ist", "istanbul", "isik", "IŞIK", "gece yıldız", "sahin", "ç", "kırmızı gölge", "yokboyle")
+
+
+def synthetic_catalog(n, seed):
+    rng = random.Random(seed)
+    # Gerçek kataloglar gibi geniş bir kelime dağarcığı: sık kelimeler + uydurma kelimeler
+    vocab = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(n // 5)]
+    records = []
+    for i in range(n):
+        words = [rng.choice(WORDS) if rng.random() < 0.4 else rng.choice(vocab) for _ in range(rng.randint(1, 4))]
+        title = ' '.join(words).capitalize()
+        records.append({
+            'url': f"https://example.test/film-{i}/",
+            'title': f"{title} {rng.randint(1, 3) if rng.random() < 0.2 else ''}".strip(),
+            'year': str(rng.randint(1970, 2026)),
+            'genres': rng.sample(GENRES, rng.randint(1, 3)),
+            'platform': rng.choice(PLATFORMS),
+        })
+    return records
+
+
+def naive_scan(records, query, genre=''):
+    """Eski index.html: her tuşta tüm başlıkları küçük harfe çevirip 'içerir' taraması."""
+    q = query.lower()
+    return [i for i, r in enumerate(records)
+            if (not genre or genre in r['genres']) and r['title'].lower().find(q) != -1]
+
+
+def prefix_scan(records, query, genre=''):
+    """İndeksle aynı anlam (kelime başı eşleşmesi), indekssiz: doğrulama için."""
+    words = tokenize(query)
+    out = []
+    for i, r in enumerate(records):
+        if genre and genre not in r['genres']:
+            continue
+        tokens = tokenize(r['title'])
+        if all(any(t.startswith(w) for t in tokens) for w in words):
+            out.append(i)
+    return out
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--titles', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    records = synthetic_catalog(args.titles, args.seed)
+    start = time.perf_counter()
+    index = build_index(records)
+    build_s = time.perf_counter() - start
+    raw = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    print(f"{len(records)} başlık, {len(index['tokens'])} kelime | indeks {build_s:.2f} sn'de, "
+          f"{len(raw) / 1024:.0f} KB ham / {len(gzip.compress(raw, 6)) / 1024:.0f} KB gzip")
+
+    print(f"{'sorgu':<16} {'tür':<8} {'tarama ms':>10} {'indeks ms':>10} {'sonuç':>7}  doğrulama")
+    for query in QUERIES:
+        for genre in ('', 'Dram'):
+            scan_ms, _ = timed(lambda: naive_scan(records, query, genre), args.repeat)
+            index_ms, hits = timed(lambda: search(index, query, genres=genre), args.repeat)
+            ok = "OK" if hits == prefix_scan(records, query, genre) else "HATALI"
+            print(f"{query:<16} {genre or '-':<8} {scan_ms:>10.2f} {index_ms:>10.2f} {len(hits):>7}  {ok}")
+
+
+if __name__ == '__main__':
+    main()
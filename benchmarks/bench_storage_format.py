@@ -0,0 +1,88 @@
+"""Katalog saklama biçimi: eski girintili JSON vs kanonik JSONL (catalog_format).
+
+Verilen katalogu iki biçimde yazar; dosya boyutunu (ham / gzip), yazma ve
+okuma süresini ve tipik bir çalışmanın (birkaç diziye yeni bölüm, bir yeni
+kayıt, bir alan değişikliği) git'e gidecek fark (diff) boyutunu karşılaştırır.
+Kanonik biçimden geri çevrilen kayıtların birebir aynı olduğu da doğrulanır.
+
+Kullanım:  python benchmarks/bench_storage_format.py diziler.json [--changes 3]
+"""
+import argparse
+import copy
+import difflib
+import gzip
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_format  # noqa: E402
+
+
+def simulate_run(records, changes):
+    """Bir botun tipik çalışması: yeni bölümler, yeni kayıt (sona eklenir), alan değişikliği."""
+    records = copy.deepcopy(records)
+    series = [r for r in records if r.get('episodes')]
+    for i, record in enumerate(series[:changes]):
+        last = copy.deepcopy(record['episodes'][-1])
+        last['url'] = last['url'].rstrip('/') + f"-yeni-{i}/"
+        last['title'] = f"{last.get('title', '')} (yeni)"
+        record['episodes'].append(last)
+    fresh = copy.deepcopy(records[len(records) // 2])
+    fresh['url'] = fresh['url'].rstrip('/') + '-2/'
+    fresh['title'] = f"{fresh.get('title', '')} 2"
+    records.append(fresh)
+    if records:
+        records[-2]['imdb'] = '7.1'
+    return records
+
+
+def diff_size(before, after):
+    """Değişen (+/-) satır sayısı ve bayt; bağlam satırları sayılmaz."""
+    lines = [line for line in difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm='', n=0)
+             if line[:1] in '+-' and line[:3] not in ('+++', '---')]
+    return len(lines), sum(len(line.encode('utf-8')) + 1 for line in lines)
+
+
+def timed(func, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('data_file')
+    parser.add_argument('--changes', type=int, default=3, help="Yeni bölüm eklenen dizi sayısı")
+    args = parser.parse_args()
+
+    records = catalog_format.load(args.data_file)
+    legacy_ms, legacy = timed(lambda: catalog_format.dumps_legacy(records))
+    canon_ms, canon = timed(lambda: catalog_format.dumps(records))
+    legacy_load_ms, _ = timed(lambda: catalog_format.loads(legacy))
+    canon_load_ms, decoded = timed(lambda: catalog_format.loads(canon))
+    ok = decoded == sorted(records, key=lambda r: r.get('url') or '')
+
+    updated = simulate_run(records, args.changes)
+    legacy_after = catalog_format.dumps_legacy(updated)
+    # Bot, mevcut dosyanın önek tablosunu koruyarak yazar (CatalogStore.compact)
+    canon_after = catalog_format.dumps(updated, prefixes=catalog_format.header_prefixes(canon.split('\n', 1)[0]))
+
+    print(f"{len(records)} kayıt, {sum(len(r.get('episodes', [])) for r in records)} bölüm | "
+          f"geri çevirme: {'AYNI' if ok else 'FARKLI'}")
+    print(f"{'':<18} {'ham KB':>8} {'gzip KB':>8} {'yazma ms':>9} {'okuma ms':>9} "
+          f"{'fark satır':>11} {'fark KB':>8}")
+    for name, before, after, write_ms, load_ms in (
+            ('eski JSON', legacy, legacy_after, legacy_ms, legacy_load_ms),
+            ('kanonik JSONL', canon, canon_after, canon_ms, canon_load_ms)):
+        data = before.encode('utf-8')
+        lines, size = diff_size(before, after)
+        print(f"{name:<18} {len(data) / 1024:>8.1f} {len(gzip.compress(data, 6)) / 1024:>8.1f} "
+              f"{write_ms:>9.1f} {load_ms:>9.1f} {lines:>11} {size / 1024:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
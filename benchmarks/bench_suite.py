@@ -0,0 +1,359 @@
+"""Tarama kıyaslama takımı: sentetik sitede botları çalıştırır, sonuçları commit'ler arasında karşılaştırır.
+
+synth_site ile (ya da --corpus ile verilen derlemde) her botu (main / main2)
+ayrı bir alt süreçte, yerel replay sunucusuna karşı çalıştırır ve şunları
+raporlar: duvar saati süresi, istek sayısı, CPU süresi (alt süreç ve
+beklediği işçi süreçleri, wait4), tepe bellek (VmHWM), dosyalara yazılan bayt
+(/proc/self/io wchar, bot çıktısı hariç), katalogdaki kayıt / bölüm sayısı.
+--incremental ile aynı klasörde sitenin bir sonraki revizyonu ikinci kez
+taranır (artımlı çalışma).
+--cache ile her bot bir de HTTP önbelleği ve ayrıştırma işçileri açıkken
+çalıştırılır (aşamalar aynı önbellek klasörünü kullanır; ilk aşamadan sonra
+önbellek TTL'i geçmiş sayılır, sayfalar koşullu istekle sorulur). Son aşama,
+site değişmeden bir kez daha ('tekrar', 304 yolu) taranır. Kayıt / bölüm
+sayıları önbelleksiz çalışmayla aynı değilse ya da önbellek indeksinde gövde
+dosyası olmayan kayıt kalırsa çıkış kodu 1'dir.
+
+--commits verilen her commit 'git worktree' ile geçici bir klasöre açılır ve
+botlar o ağacın koduyla çalıştırılır (bu dosya ve sunucu çalışma ağacından);
+sütunlar commit'lerdir, ilk sütuna göre yüzde fark yazılır. --save sonuçları
+JSON'a yazar, --compare önceki bir kaydı da tabloya ekler.
+
+Kullanım:  python benchmarks/bench_suite.py [--bots main main2] [--series 100] [--seasons 3]
+           [--episodes 10] [--movies 300] [--incremental] [--repeat 1] [--commits HEAD~3 HEAD]
+           [--corpus DIR] [--bot-arg mode=two-phase] [--cache] [--save sonuc.json] [--compare eski.json]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BOTS = {'main': 'main', 'main2': 'main2', 'original': 'original_main_dizi'}
+# İlk (tam) taramada verilen argümanlar; botun main() imzasında olmayanlar atlanır
+FULL_ARGS = {'full_sweep': True}
+# --cache satırlarının etiket eki
+CACHE_SUFFIX = '+önbellek'
+METRICS = (
+    ('wall_s', 'süre (sn)'),
+    ('requests', 'istek'),
+    ('cpu_s', 'CPU (sn)'),
+    ('peak_rss_mb', 'tepe bellek (MB)'),
+    ('written_mb', 'yazılan (MB)'),
+    ('records', 'kayıt'),
+    ('episodes', 'bölüm'),
+    ('cache_lost', 'kayıp gövde'),
+)
+
+
+# --- Alt süreç ---
+# Yalnızca standart kütüphane kullanılır: bot modülleri, ölçülen ağaçtan
+# (commit'in worktree'si) içe aktarılmalı, bu dosyanın ağacından değil.
+
+def _proc_value(path, key):
+    try:
+        with open(path, encoding='ascii') as f:
+            for line in f:
+                if line.startswith(key):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def child(tree, module_name, kwargs_json, result_path):
+    """Alt süreçte çalışır: botu çalıştırır, çıkışta (botun atexit kayıtlarından sonra) ölçümleri yazar."""
+    import atexit
+    import importlib
+    import inspect
+
+    sys.path.insert(0, tree)
+    state = {}
+
+    def report():
+        sys.stdout.flush()
+        with open(result_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'data_file': state.get('data_file'),
+                'peak_rss_kb': _proc_value('/proc/self/status', 'VmHWM:'),
+                'wchar': _proc_value('/proc/self/io', 'wchar:'),
+            }, f)
+
+    # İlk kaydedilen atexit en son çalışır: rapor / önbellek yazımları da sayılır
+    atexit.register(report)
+    module = importlib.import_module(module_name)
+    state['data_file'] = os.path.abspath(getattr(module, 'DATA_FILE', ''))
+    params = inspect.signature(module.main).parameters
+    module.main(**{k: v for k, v in json.loads(kwargs_json).items() if k in params})
+
+
+# --- Ana süreç ---
+
+def run_bot(tree, bot, corpus_dir, workdir, port, bot_args, latency, cache=False):
+    """Botu tree'nin koduyla bir kez çalıştırır; ölçüm sözlüğü döner. Aynı port, aynı alan adı demektir.
+    cache: HTTP önbelleği (workdir/.http_cache) ve en az iki ayrıştırma işçisi açık."""
+    import catalog_format
+    from fixtures import FixtureCorpus
+    from replay_server import ReplayConfig, ReplayServer
+
+    server = ReplayServer(FixtureCorpus(corpus_dir), ReplayConfig(latency_ms=latency), port=port)
+    server.start_background()
+    env = dict(os.environ, BASE_DOMAIN=server.base_url, SKIP_BROWSER='1', HTTP_CACHE='1' if cache else '0')
+    if cache:
+        env.pop('HTTP_CACHE_DIR', None)
+        env['PARSE_WORKERS'] = str(max(2, int(env.get('PARSE_WORKERS') or 2)))
+    result_path = os.path.join(workdir, '.bench_result.json')
+    log_path = os.path.join(workdir, '.bench_log.txt')
+    try:
+        with open(log_path, 'wb') as log:
+            start = time.perf_counter()
+            proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--child', tree, BOTS[bot],
+                                     json.dumps(bot_args), result_path],
+                                    cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            wall = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+    if proc.returncode != 0:
+        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+            tail = f.read()[-2000:]
+        raise RuntimeError(f"{bot} çıkış kodu {proc.returncode}:\n{tail}")
+
+    with open(result_path, 'r', encoding='utf-8') as f:
+        measured = json.load(f)
+    records = episodes = 0
+    if measured.get('data_file') and os.path.exists(measured['data_file']):
+        catalog = catalog_format.load(measured['data_file'])
+        records, episodes = len(catalog), sum(len(r.get('episodes', [])) for r in catalog)
+    written = None
+    if measured.get('wchar') is not None:
+        written = max(0, measured['wchar'] - os.path.getsize(log_path))
+    peak_kb = measured.get('peak_rss_kb') or usage.ru_maxrss
+    cache_lost = lost_cache_bodies(os.path.join(workdir, '.http_cache')) if cache else None
+    return {
+        'wall_s': round(wall, 3),
+        'requests': server.stats['requests'],
+        'cpu_s': round(usage.ru_utime + usage.ru_stime, 3),
+        'peak_rss_mb': round(peak_kb / 1024, 1),
+        'written_mb': round(written / 1024 / 1024, 2) if written is not None else None,
+        'records': records,
+        'episodes': episodes,
+        'cache_lost': cache_lost,
+    }
+
+
+def lost_cache_bodies(cache_dir):
+    """Önbellek indeksinde olup gövde dosyası diskte olmayan kayıt sayısı."""
+    index_path = os.path.join(cache_dir, 'index.json')
+    if not os.path.exists(index_path):
+        return 0
+    with open(index_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return sum(1 for entry in entries.values() if not os.path.exists(os.path.join(cache_dir, entry['file'])))
+
+
+def free_port():
+    import socket
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def expire_cache(workdir):
+    """Sonraki çalışma için önbellekteki tüm sayfaların TTL'i geçmiş sayılır (koşullu istek / 304 yolu)."""
+    index_path = os.path.join(workdir, '.http_cache', 'index.json')
+    if not os.path.exists(index_path):
+        return
+    with open(index_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    for entry in entries.values():
+        entry['stored_at'] = 0
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f)
+
+
+def run_tree(tree, bots, corpora, repeat, extra_args, latency, cache=False):
+    """Bir ağaç için {'<bot>/<aşama>': ölçümler}; tekrarlarda her ölçümün medyanı."""
+    results = {}
+    for bot in bots:
+        runs = {}
+        for _ in range(repeat):
+            workdir = tempfile.mkdtemp(prefix=f'bench_suite_{bot}_')
+            port = free_port()
+            try:
+                for i, (phase, corpus_dir) in enumerate(corpora):
+                    args = dict(extra_args, **(FULL_ARGS if phase == 'tam' else {}))
+                    if cache and i:
+                        expire_cache(workdir)
+                    runs.setdefault(phase, []).append(
+                        run_bot(tree, bot, corpus_dir, workdir, port, args, latency, cache))
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+        for phase, measurements in runs.items():
+            results[f"{bot}/{phase}{CACHE_SUFFIX if cache else ''}"] = {
+                key: statistics.median(m[key] for m in measurements) if measurements[0][key] is not None else None
+                for key, _ in METRICS}
+    return results
+
+
+def cache_mismatches(result):
+    """Önbellekli satırların kayıt / bölüm sayıları önbelleksiz karşılığından farklıysa
+    ya da gövdesi kaybolmuş önbellek kaydı varsa açıklamalar."""
+    problems = []
+    for row, measured in result.items():
+        if not row.endswith(CACHE_SUFFIX):
+            continue
+        if measured.get('cache_lost'):
+            problems.append(f"{row}: {measured['cache_lost']} önbellek kaydının gövdesi yok")
+        plain = result.get(row[:-len(CACHE_SUFFIX)], {})
+        for key in ('records', 'episodes'):
+            if measured.get(key) != plain.get(key):
+                problems.append(f"{row}: {key} {measured.get(key)} != önbelleksiz {plain.get(key)}")
+    return problems
+
+
+def git(*args):
+    return subprocess.run(['git', *args], cwd=ROOT, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def run_commits(commits, run):
+    """Her commit'i geçici worktree'de açıp run(tree) çalıştırır. {kısa hash: sonuç}"""
+    results = {}
+    base = tempfile.mkdtemp(prefix='bench_suite_trees_')
+    try:
+        for rev in commits:
+            label = git('rev-parse', '--short', rev)
+            tree = os.path.join(base, label)
+            git('worktree', 'add', '--detach', tree, rev)
+            try:
+                print(f"⏱️ {label} ({rev}) ölçülüyor...", flush=True)
+                results[label] = run(tree)
+            finally:
+                git('worktree', 'remove', '--force', tree)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    return results
+
+
+def print_table(results):
+    labels = list(results)
+    rows = list(dict.fromkeys(row for result in results.values() for row in result))
+    width = max(12, *(len(label) + 10 for label in labels))
+    row_width = max(22, *(len(row) + 2 for row in rows))
+    print(f"\n{'':<{row_width}}{'':<18}" + ''.join(f"{label:>{width}}" for label in labels))
+    for row in rows:
+        for key, title in METRICS:
+            cells = []
+            first = results[labels[0]].get(row, {}).get(key)
+            for label in labels:
+                value = results[label].get(row, {}).get(key)
+                cell = '-' if value is None else f"{value:g}"
+                if label != labels[0] and value is not None and first:
+                    cell += f" ({(value - first) / first * 100:+.0f}%)"
+                cells.append(f"{cell:>{width}}")
+            print(f"{row:<{row_width}}{title:<18}" + ''.join(cells))
+        print()
+
+
+def parse_bot_args(pairs):
+    args = {}
+    for pair in pairs or ():
+        key, _, value = pair.partition('=')
+        try:
+            args[key] = json.loads(value)
+        except ValueError:
+            args[key] = value
+    return args
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        return child(*sys.argv[2:6])
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, BENCH_DIR)
+    import synth_site
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bots', nargs='+', choices=sorted(BOTS), default=['main', 'main2'])
+    parser.add_argument('--corpus', help="Hazır derlem (verilmezse sentetik site üretilir)")
+    parser.add_argument('--series', type=int, default=100)
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--episodes', type=int, default=10)
+    parser.add_argument('--movies', type=int, default=300)
+    parser.add_argument('--per-page', type=int, default=24)
+    parser.add_argument('--padding-kb', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--incremental', action='store_true', help="Sitenin sonraki revizyonunu aynı klasörde yeniden tara")
+    parser.add_argument('--latency', type=float, default=0, help="Sunucu gecikmesi (ms)")
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--bot-arg', action='append', help="Botun main() argümanı, ör. mode=two-phase")
+    parser.add_argument('--cache', action='store_true',
+                        help="Önbellek + ayrıştırma işçileri açıkken de çalıştır, sayıları önbelleksizle karşılaştır")
+    parser.add_argument('--commits', nargs='+', help="Karşılaştırılacak commit'ler (varsayılan: çalışma ağacı)")
+    parser.add_argument('--save', help="Sonuçları JSON olarak yaz")
+    parser.add_argument('--compare', nargs='+', default=[], help="Önceki --save çıktıları")
+    args = parser.parse_args()
+
+    site_dir = tempfile.mkdtemp(prefix='bench_suite_site_')
+    try:
+        if args.corpus:
+            corpora = [('tam', args.corpus)] + ([('artımlı', args.corpus)] if args.incremental else [])
+        else:
+            corpora = []
+            for revision in range(2 if args.incremental else 1):
+                out = os.path.join(site_dir, f"r{revision}")
+                summary = synth_site.generate(out, args.series, args.seasons, args.episodes, args.movies,
+                                              args.per_page, args.padding_kb, revision, seed=args.seed)
+                corpora.append(('tam' if revision == 0 else 'artımlı', out))
+            print(f"🏗️ Sentetik site: {summary['pages']} sayfa | {summary['series']} dizi, "
+                  f"{summary['episodes']} bölüm, {summary['movies']} film", flush=True)
+
+        if args.cache:
+            # Değişmeyen sitede artımlı geçiş: sayfalar 304 ile önbellekten gelmeli
+            corpora.append(('tekrar', corpora[-1][1]))
+
+        def run(tree):
+            result = run_tree(tree, args.bots, corpora, args.repeat, parse_bot_args(args.bot_arg), args.latency)
+            if args.cache:
+                result.update(run_tree(tree, args.bots, corpora, args.repeat, parse_bot_args(args.bot_arg),
+                                       args.latency, cache=True))
+            return result
+
+        if args.commits:
+            results = run_commits(args.commits, run)
+        else:
+            print("⏱️ Çalışma ağacı ölçülüyor...", flush=True)
+            results = {'çalışma ağacı': run(ROOT)}
+    finally:
+        shutil.rmtree(site_dir, ignore_errors=True)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'args': {k: v for k, v in vars(args).items() if k not in ('save', 'compare')},
+                       'results': results}, f, ensure_ascii=False, indent=2)
+    previous = {}
+    for path in args.compare:
+        with open(path, 'r', encoding='utf-8') as f:
+            for label, result in json.load(f)['results'].items():
+                previous[f"{os.path.basename(path)}:{label}"] = result
+    print_table({**previous, **results})
+    if args.cache:
+        problems = [f"{label}: {p}" for label, result in results.items() for p in cache_mismatches(result)]
+        for problem in problems:
+            print(f"❌ {problem}", flush=True)
+        if problems:
+            sys.exit(1)
+        print("✅ Önbellekli çalışmalar önbelleksizle aynı kayıt / bölüm sayısını verdi, gövde kaybı yok.", flush=True)
+
+
+if __name__ == '__main__':
+    main()
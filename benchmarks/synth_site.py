@@ -0,0 +1,212 @@
+"""Sentetik site üreteci: istenen ölçekte sahte bir dizi / film sitesi derlemi yazar.
+
+Çıktı, kayıtlı derlemle aynı düzendedir (bkz. fixtures.FixtureCorpus):
+replay_server.py ve bench_crawl.py doğrudan kullanır. Sayfalar çıkarıcıların
+beklediği işaretlemeyi taşır ('post-item', 'episode-item',
+'season-options-list', 'video-player-area', 'summary-text', bilgi kutuları);
+gerçek sayfalardaki gibi menü, altbilgi ve betik yükü de eklenir
+(--padding-kb). Aynı --seed ile her zaman bayt bayt aynı derlem üretilir.
+
+--revision R, sitenin R adım sonraki halini üretir: ilk --churn dizinin son
+sezonuna R yeni bölüm eklenir (bu diziler listenin başına çıkar) ve film
+listesinin başına R * --churn yeni film gelir. Revizyon 0 ile tarayıp aynı
+klasörde revizyon 1'i taramak artımlı çalışmayı ölçer.
+
+Kullanım:  python benchmarks/synth_site.py fixtures/synth [--series 200] [--seasons 3] [--episodes 10]
+           [--movies 500] [--per-page 24] [--padding-kb 20] [--revision 0] [--churn 5] [--seed 1]
+"""
+import argparse
+import hashlib
+import os
+import random
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fixtures import FixtureCorpus  # noqa: E402
+
+ORIGIN = 'https://dizipal.cx'
+HEADERS = {'Content-Type': 'text/html; charset=utf-8'}
+PLAYER_HOST = 'https://x.cfd'
+
+WORDS = ('gece', 'yol', 'sır', 'deniz', 'ateş', 'kuzey', 'aşk', 'şehir', 'gölge', 'vadi', 'son', 'ilk',
+         'kayıp', 'masum', 'yabancı', 'miras', 'kader', 'sahil', 'kış', 'yaz', 'dağ', 'ırmak')
+GENRES = ('Dram', 'Komedi', 'Aksiyon', 'Gerilim', 'Bilim Kurgu', 'Romantik', 'Suç', 'Belgesel')
+PLATFORMS = ('Netflix', 'Exxen', 'BluTV', 'Disney+', 'Prime Video', 'Gain')
+ACTORS = ('Ada', 'Deniz', 'Ece', 'Kaan', 'Mert', 'Selin', 'Umut', 'Zeynep', 'Barış', 'Elif')
+
+
+# --- Sayfa iskeleti ---
+
+def chrome(rng, padding_kb):
+    """Menü, altbilgi ve betik yükü: çıkarıcıların aradığı hiçbir işaretlemeyi içermez."""
+    links = ''.join(f'<li><a href="/kategori/{w}/">{w.title()}</a></li>' for w in WORDS)
+    header = f'<header class="site-header"><nav><ul>{links}</ul></nav><form class="search"><input name="s"></form></header>'
+    footer = '<footer class="site-footer"><p>© Dizipal</p><a href="/iletisim/">İletişim</a></footer>'
+    if padding_kb <= 0:
+        return header, footer
+    blob = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(padding_kb * 1024))
+    return header, footer + f'<script>var __d="{blob}";</script>'
+
+
+def page(title, body, padding):
+    header, footer = padding
+    return (f'<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8"><title>{title}</title>'
+            f'<link rel="stylesheet" href="/assets/app.css"></head><body>{header}'
+            f'<main>{body}</main>{footer}</body></html>').encode('utf-8')
+
+
+def name(rng, words=2):
+    return ' '.join(rng.choice(WORDS).title() for _ in range(words))
+
+
+# --- Site modeli ---
+
+def build_site(series_count, seasons, episodes, movies, revision=0, churn=5, seed=1):
+    """Dizi ve film kayıtları (liste sırasıyla; en yeni önce)."""
+    rng = random.Random(seed)
+    series = []
+    for i in range(series_count):
+        title = f"{name(rng)} {i}"
+        season_counts = [episodes] * seasons
+        if i < churn and revision:
+            season_counts[-1] += revision
+        series.append({
+            'slug': f"dizi-{i}", 'title': title, 'year': str(rng.randint(1995, 2025)),
+            'imdb': f"{rng.randint(40, 95) / 10:.1f}", 'genres': rng.sample(GENRES, 2),
+            'seasons': season_counts, 'summary': f"{title} hakkında özet. " * rng.randint(2, 6),
+        })
+    films = []
+    for i in range(movies + revision * churn):
+        title = f"{name(rng, 3)} {i}"
+        films.append({
+            'slug': f"film-{i}", 'title': title, 'year': str(rng.randint(1980, 2025)),
+            'imdb': f"{rng.randint(30, 95) / 10:.1f}", 'genres': rng.sample(GENRES, 2),
+            'cast': rng.sample(ACTORS, 3), 'platform': rng.choice(PLATFORMS + ('',)),
+            'summary': f"{title} filminin özeti. " * rng.randint(2, 6),
+        })
+    # Yeni bölüm çıkan diziler (ilk churn dizi) ve yeni filmler listenin başında
+    films = films[movies:][::-1] + films[:movies]
+    return series, films
+
+
+def episode_url(s, season, ep):
+    return f"{ORIGIN}/bolum/{s['slug']}-{season}-sezon-{ep}-bolum-izle/"
+
+
+def episode_items(s, season):
+    return ''.join(
+        f'<div class="episode-item"><a href="{episode_url(s, season, ep)}" title="{s["title"]} {season}x{ep}">'
+        f'<img src="{ORIGIN}/wp-content/uploads/{s["slug"]}-{season}-{ep}.jpg"></a>'
+        f'<h4 class="font-eudoxus">{ep}. Bölüm</h4></div>'
+        for ep in range(1, s['seasons'][season - 1] + 1))
+
+
+def series_card(s):
+    last = len(s['seasons'])
+    return (f'<div class="post-item"><a href="{ORIGIN}/dizi/{s["slug"]}/" title="{s["title"]}">'
+            f'<img src="{ORIGIN}/wp-content/uploads/{s["slug"]}.jpg"><span class="title">{s["title"]}</span>'
+            f'<span class="episode">{last}. Sezon {s["seasons"][-1]}. Bölüm</span></a></div>')
+
+
+def series_page(s, padding):
+    seasons = ''.join(f'<a href="/dizi/{s["slug"]}/sezon-{n}/">{n}. Sezon</a>' for n in range(1, len(s['seasons']) + 1))
+    genres = ''.join(f'<a href="/dizi-kategori/{g.lower()}/">{g}</a>' for g in s['genres'])
+    body = (f'<div id="head" class="cover-image" style="background-image:url(\'{ORIGIN}/wp-content/uploads/{s["slug"]}-c.jpg\')"></div>'
+            f'<h1>{s["title"]} <span>({s["year"]})</span></h1>'
+            f'<div class="poster"><img src="{ORIGIN}/wp-content/uploads/{s["slug"]}.jpg"></div>'
+            f'<p class="summary-text">{s["summary"]}</p>'
+            f'<div class="imdb"><span>IMDB Puanı</span><h4>{s["imdb"]}</h4></div>'
+            f'<div class="genres">{genres}</div>'
+            f'<div id="season-options-list">{seasons}</div>'
+            f'<div class="episodes">{episode_items(s, len(s["seasons"]))}</div>')
+    return page(s['title'], body, padding)
+
+
+def movie_card(f):
+    return (f'<div class="post-item"><a href="{ORIGIN}/{f["slug"]}/" title="{f["title"]}">'
+            f'<img data-src="{ORIGIN}/wp-content/uploads/{f["slug"]}.jpg" src="data:image/gif;base64,R0lGOD">'
+            f'<span class="title">{f["title"]}</span><span class="year">{f["year"]}</span></a></div>')
+
+
+def movie_page(f, padding):
+    platform = f'<a href="/platform/{f["platform"].lower()}/">{f["platform"]}</a>' if f['platform'] else ''
+    genres = ''.join(f'<a href="/tur/{g.lower()}/">{g}</a>' for g in f['genres'])
+    cast = ''.join(f'<a href="/oyuncu/{a.lower()}/">{a}</a>' for a in f['cast'])
+    body = (f'<div id="head" style="background-image:url(\'{ORIGIN}/wp-content/uploads/{f["slug"]}-c.jpg\')"></div>'
+            f'<div class="poster"><img src="{ORIGIN}/wp-content/uploads/{f["slug"]}.jpg"></div>'
+            f'<h1>{f["title"]}</h1>{platform}'
+            f'<div><img src="/assets/Upload.svg">01.01.2025</div>'
+            f'<div><img src="/assets/Calendar.svg">{f["year"]}</div>'
+            f'<p class="summary-text">{f["summary"]}</p>'
+            f'<div class="bg-white/[4%]">IMDB</div><div>{f["imdb"]}</div>'
+            f'<div class="bg-white/[4%]">Tür {genres}</div>'
+            f'<div class="bg-white/[4%]">Oyuncular {cast}</div>'
+            f'<div class="video-player-area"><iframe src="{PLAYER_HOST}/embed-{f["slug"]}.html"></iframe></div>')
+    return page(f['title'], body, padding)
+
+
+def listing_pages(cards, per_page):
+    return [cards[i:i + per_page] for i in range(0, len(cards), per_page)] or [[]]
+
+
+# --- Derlem ---
+
+def generate(out_dir, series=200, seasons=3, episodes=10, movies=500, per_page=24, padding_kb=20,
+             revision=0, churn=5, seed=1):
+    """Derlemi out_dir'e yazar (varsa silinir). Sayfa sayılarını döner."""
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    rng = random.Random(seed)
+    padding = chrome(rng, padding_kb)
+    corpus = FixtureCorpus(out_dir)
+    corpus.origin = ORIGIN
+
+    def add(path, body):
+        # ETag içerikten: revizyonlar arasında değişmeyen sayfa 304 alabilir
+        headers = dict(HEADERS, ETag=f'"{hashlib.sha1(body).hexdigest()[:16]}"')
+        corpus.add(ORIGIN + path, 200, headers, body)
+
+    all_series, films = build_site(series, seasons, episodes, movies, revision, churn, seed)
+    for n, cards in enumerate(listing_pages([series_card(s) for s in all_series], per_page), 1):
+        path = '/diziler/' if n == 1 else f'/diziler/page/{n}/'
+        add(path, page('Diziler', ''.join(cards), padding))
+    for s in all_series:
+        add(f"/dizi/{s['slug']}/", series_page(s, padding))
+        for season in range(1, len(s['seasons']) + 1):
+            add(f"/dizi/{s['slug']}/sezon-{season}/", page(s['title'], episode_items(s, season), padding))
+            for ep in range(1, s['seasons'][season - 1] + 1):
+                player = f'<div class="video-player-area"><iframe src="{PLAYER_HOST}/embed-{s["slug"]}-{season}-{ep}.html"></iframe></div>'
+                add(episode_url(s, season, ep)[len(ORIGIN):], page(s['title'], player, padding))
+    for n, cards in enumerate(listing_pages([movie_card(f) for f in films], per_page), 1):
+        add(f'/filmler/page/{n}/', page('Filmler', ''.join(cards), padding))
+    for f in films:
+        add(f"/{f['slug']}/", movie_page(f, padding))
+    corpus.save()
+    episodes_total = sum(sum(s['seasons']) for s in all_series)
+    return {'pages': len(corpus.pages), 'series': len(all_series), 'episodes': episodes_total, 'movies': len(films)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('out_dir')
+    parser.add_argument('--series', type=int, default=200)
+    parser.add_argument('--seasons', type=int, default=3, help="Dizi başına sezon")
+    parser.add_argument('--episodes', type=int, default=10, help="Sezon başına bölüm")
+    parser.add_argument('--movies', type=int, default=500)
+    parser.add_argument('--per-page', type=int, default=24, help="Liste sayfası başına kart")
+    parser.add_argument('--padding-kb', type=int, default=20, help="Sayfa başına menü / betik yükü")
+    parser.add_argument('--revision', type=int, default=0)
+    parser.add_argument('--churn', type=int, default=5, help="Revizyon başına güncellenen dizi sayısı")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    summary = generate(args.out_dir, args.series, args.seasons, args.episodes, args.movies, args.per_page,
+                       args.padding_kb, args.revision, args.churn, args.seed)
+    print(f"🏗️ {args.out_dir}: {summary['pages']} sayfa | {summary['series']} dizi, {summary['episodes']} bölüm, "
+          f"{summary['movies']} film (revizyon {args.revision})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import hashlib
+import json
+import os
+
+import catalog_format
+from journal import atomic_write_text
+from mirrors import slug_key
+from search_index import build_index
+
+# --- ÖN YÜZ ÇIKTISI ---
+# index.html tüm kataloğu indirmek yerine '<katalog>.summary.json' özetini
+# (id, başlık, yıl, türler, poster, IMDB) yükler. Açıklama, video adresi ve
+# bölüm listesi gibi ağır alanlar '<katalog>.shards/' altındaki parçalarda
+# durur ve ancak detay penceresi açılınca istenir. Dizilerde her dizi kendi
+# parçasıdır; filmlerde parçalar id'nin ilk SHARD_CHARS karakterine göre
+# gruplanır (binlerce küçük dosya olmasın). Yalnızca içeriği değişen parçalar
+# yeniden yazılır, böylece her çalışmanın commit'i küçük kalır. Arama / filtre
+# indeksi '<katalog>.index.json' da burada üretilir (bkz. search_index).
+
+SUMMARY_FIELDS = ('title', 'year', 'genres', 'poster', 'imdb')
+# Ön yüze gitmeyen iç alanlar (sezon parmak izleri, içerik özeti, film taslağı sırası)
+INTERNAL_FIELDS = ('seasons', 'hash', 'discovered_at', 'listing_pos')
+SHARD_CHARS = {'movies': 2, 'series': 0}
+
+
+def record_id(url):
+    """Alan adından bağımsız id (bkz. mirrors.slug_key): ayna değişince ön yüz id'leri ve parçaları aynı kalır."""
+    return hashlib.sha1(slug_key(url).encode('utf-8')).hexdigest()[:12]
+
+
+def _dumps(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def summarize(record):
+    entry = {'id': record_id(record['url'])}
+    for field in SUMMARY_FIELDS:
+        value = record.get(field)
+        if field == 'poster' and not value:
+            value = record.get('image')  # eski film kayıtları
+        if value:
+            entry[field] = value
+    return entry
+
+
+def public(record):
+    """Kaydın iç alanları (kayıt ve bölüm düzeyinde) atılmış kopyası."""
+    out = {k: v for k, v in record.items() if k not in INTERNAL_FIELDS}
+    if isinstance(out.get('episodes'), list):
+        out['episodes'] = [{k: v for k, v in ep.items() if k not in INTERNAL_FIELDS} for ep in out['episodes']]
+    return out
+
+
+def details(record):
+    return {k: v for k, v in public(record).items() if k not in SUMMARY_FIELDS and k != 'image'}
+
+
+def shard_name(record_id_, kind):
+    chars = SHARD_CHARS[kind]
+    return record_id_[:chars] if chars else record_id_
+
+
+def output_paths(data_file):
+    """(özet, parça klasörü, indeks) yolları."""
+    base = os.path.splitext(data_file)[0]
+    return f"{base}.summary.json", f"{base}.shards", f"{base}.index.json"
+
+
+def _write_if_changed(path, text):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    atomic_write_text(path, text)
+    return True
+
+
+def export_catalog(records, data_file, kind):
+    """Özet + parça dosyalarını yazar. Boyut istatistiklerini döner."""
+    summary_path, shard_dir, index_path = output_paths(data_file)
+    records = [r for r in records if r.get('url')]
+    items = []
+    shards = {}
+    for record in records:
+        entry = summarize(record)
+        items.append(entry)
+        shards.setdefault(shard_name(entry['id'], kind), {})[entry['id']] = details(record)
+
+    os.makedirs(shard_dir, exist_ok=True)
+    written = 0
+    shard_bytes = 0
+    for name, content in shards.items():
+        text = _dumps(content)
+        shard_bytes += len(text.encode('utf-8'))
+        written += _write_if_changed(os.path.join(shard_dir, f"{name}.json"), text)
+    # Katalogdan çıkan kayıtların parçaları
+    for filename in os.listdir(shard_dir):
+        if filename.endswith('.json') and filename[:-5] not in shards:
+            os.remove(os.path.join(shard_dir, filename))
+
+    summary = {
+        'kind': kind,
+        'shards': os.path.basename(shard_dir),
+        'shard_chars': SHARD_CHARS[kind],
+        'items': items,
+    }
+    summary_text = _dumps(summary)
+    _write_if_changed(summary_path, summary_text)
+    index_text = _dumps(build_index(records))
+    _write_if_changed(index_path, index_text)
+
+    stats = {
+        'records': len(items),
+        'summary_bytes': len(summary_text.encode('utf-8')),
+        'index_bytes': len(index_text.encode('utf-8')),
+        'shards': len(shards),
+        'shards_written': written,
+        'avg_shard_bytes': shard_bytes // len(shards) if shards else 0,
+    }
+    print(f"🗂️ Ön yüz: özet {stats['summary_bytes'] // 1024} KB ({len(items)} kayıt), "
+          f"indeks {stats['index_bytes'] // 1024} KB, {written}/{len(shards)} parça güncellendi -> {summary_path}",
+          flush=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Katalogdan (.jsonl ya da eski .json) index.html özet ve parçalarını üretir")
+    parser.add_argument('data_file')
+    parser.add_argument('--kind', choices=sorted(SHARD_CHARS), help="Varsayılan: bölüm alanı varsa 'series'")
+    args = parser.parse_args()
+
+    records = catalog_format.load(args.data_file)
+    kind = args.kind or ('series' if any('episodes' in r for r in records) else 'movies')
+    export_catalog(records, args.data_file, kind)
+
+
+if __name__ == '__main__':
+    main()
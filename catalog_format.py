@@ -0,0 +1,309 @@
+import argparse
+import io
+import json
+import os
+from collections import Counter
+
+from journal import atomic_write_text
+
+# --- KANONİK KATALOG BİÇİMİ (JSONL) ---
+# Katalog git'e her çalışmada eklendiği için dosya küçük ve fark (diff) dostu
+# olmalı. Kanonik biçim:
+#  - 1. satır başlık: {"format": "catalog-jsonl", "version": 1, "key": "url", "prefixes": [...]}
+#  - sonraki her satır tek kayıt, URL'ye göre sıralı (tarama sırasından bağımsız).
+#    Bir kayıt değişince yalnızca kendi satırı değişir; yeni kayıt araya girer.
+#  - Dizilerin bölümleri de birer satırdır: kayıt satırında "episodes": []
+#    yazar, bölümler hemen ardından kendi sıralarıyla, iki boşluk girintili
+#    satırlar olarak gelir. Yeni bölüm eklenince dizinin satırı değişmez,
+#    yalnızca bölümün satırı eklenir.
+#  - 'https://dizipal.cx/wp-content/uploads/' gibi ortak URL önekleri başlıktaki
+#    tabloya alınır ve değerlerde "~<sıra>~<kalan>" olarak yazılır. '~' ile
+#    başlayan gerçek değerler "~~" ile kaçırılır.
+# Önek tablosu kararlıdır: mevcut dosyanın tablosu korunur, yeni önekler sona
+# eklenir; böylece bir önek eklenince bütün satırlar değişmez.
+# Eski biçim (girintili tek JSON dizisi) load() ile okunmaya devam eder.
+
+FORMAT_NAME = 'catalog-jsonl'
+FORMAT_VERSION = 1
+PREFIX_MARK = '~'
+# Kendi satırlarına bölünen iç liste
+NESTED_FIELD = 'episodes'
+NESTED_INDENT = '  '
+# Aday önekler: alan adı + en fazla bu kadar klasör (yıl/ay klasörleri tabloyu şişirmesin)
+MAX_PREFIX_DEPTH = 2
+MIN_PREFIX_USES = 8
+MAX_PREFIXES = 64
+
+
+def is_canonical_path(path):
+    return path.endswith('.jsonl')
+
+
+# --- Önek tablosu ---
+def _candidates(value):
+    """URL değerinin '/' ile biten önekleri (alan kökü + MAX_PREFIX_DEPTH klasör)."""
+    scheme = value.find('://')
+    if scheme == -1:
+        return []
+    out = []
+    pos = value.find('/', scheme + 3)
+    depth = 0
+    while pos != -1 and depth <= MAX_PREFIX_DEPTH:
+        out.append(value[:pos + 1])
+        pos = value.find('/', pos + 1)
+        depth += 1
+    return out
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+
+
+def choose_prefixes(records, existing=()):
+    """Mevcut tabloyu koruyup, yeterince tekrar eden yeni URL öneklerini sona ekler."""
+    counts = Counter()
+    for record in records:
+        for value in _strings(record):
+            counts.update(_candidates(value))
+    prefixes = list(existing)
+    known = set(prefixes)
+    # Kazanç: tekrar sayısı x kısalma. Eşitlikte alfabetik (deterministik)
+    ranked = sorted(counts.items(), key=lambda item: (-item[1] * len(item[0]), item[0]))
+    for prefix, uses in ranked:
+        if len(prefixes) >= MAX_PREFIXES:
+            break
+        if prefix in known or len(prefix) <= 8:
+            continue
+        # Seçilmiş daha uzun öneklerin zaten kapsadığı değerler sayılmaz
+        uses -= sum(counts[p] for p in known if len(p) > len(prefix) and p.startswith(prefix))
+        if uses >= MIN_PREFIX_USES:
+            prefixes.append(prefix)
+            known.add(prefix)
+    return prefixes
+
+
+class PrefixCodec:
+    """Değerlerdeki URL öneklerini başlık tablosundaki sıraya çevirir (ve geri)."""
+
+    def __init__(self, prefixes=()):
+        self.prefixes = []
+        self._by_length = []
+        self.extend(prefixes)
+
+    def extend(self, prefixes):
+        """Tabloya yeni önekleri sona ekler; mevcut sıralar (ve onlarla yazılmış satırlar) geçerli kalır."""
+        for prefix in prefixes:
+            if prefix not in self.prefixes:
+                self.prefixes.append(prefix)
+        # En uzun önek önce denenir
+        self._by_length = sorted(enumerate(self.prefixes), key=lambda item: -len(item[1]))
+
+    def encode(self, value):
+        if isinstance(value, str):
+            for i, prefix in self._by_length:
+                if value.startswith(prefix):
+                    return f"{PREFIX_MARK}{i}{PREFIX_MARK}{value[len(prefix):]}"
+            return PREFIX_MARK + value if value.startswith(PREFIX_MARK) else value
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            return {k: self.encode(v) for k, v in value.items()}
+        return value
+
+    def decode(self, value):
+        if isinstance(value, str):
+            if not value.startswith(PREFIX_MARK):
+                return value
+            if value.startswith(PREFIX_MARK * 2):
+                return value[1:]
+            end = value.index(PREFIX_MARK, 1)
+            return self.prefixes[int(value[1:end])] + value[end + 1:]
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if isinstance(value, dict):
+            return {k: self.decode(v) for k, v in value.items()}
+        return value
+
+
+# --- Yazma ---
+def header_line(codec, key='url'):
+    return _line({'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'key': key, 'prefixes': codec.prefixes})
+
+
+def record_lines(record, codec):
+    """Bir kaydın kanonik satırları: kayıt satırı + (varsa) girintili bölüm satırları."""
+    nested = record.get(NESTED_FIELD)
+    if not isinstance(nested, list):
+        return [_line(codec.encode(dict(record)))]
+    lines = [_line(codec.encode({**record, NESTED_FIELD: []}))]
+    lines.extend(NESTED_INDENT + _line(codec.encode(item)) for item in nested)
+    return lines
+
+
+def dumps(records, key='url', prefixes=()):
+    """Kayıtları kanonik JSONL metnine çevirir. prefixes: korunacak mevcut önek tablosu."""
+    records = sorted(records, key=lambda r: r.get(key) or '')
+    codec = PrefixCodec(choose_prefixes(records, prefixes))
+    lines = [header_line(codec, key)]
+    for record in records:
+        lines.extend(record_lines(record, codec))
+    return '\n'.join(lines) + '\n'
+
+
+def _line(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+# --- Okuma (akış halinde) ---
+# Dosya bir kerede belleğe alınmaz: kanonik biçim satır satır, eski JSON dizisi
+# JSONDecoder.raw_decode ile parça parça (her seferinde tek kayıt) çözülür.
+
+def read_header(f):
+    """Kanonik dosyanın başlığından kodlayıcı. Eski biçimse None (dosya konumu korunur)."""
+    first = f.readline()
+    if not first.strip() or first.lstrip().startswith('['):
+        f.seek(0)
+        return None
+    header = json.loads(first)
+    if header.get('format') != FORMAT_NAME:
+        raise ValueError(f"Bilinmeyen katalog biçimi: {header.get('format')}")
+    return PrefixCodec(header.get('prefixes', []))
+
+
+def iter_groups(f):
+    """Başlıktan sonraki satırları kayıt gruplarına ayırır: [kayıt satırı, bölüm satırları...]."""
+    group = []
+    for line in f:
+        line = line.rstrip('\n')
+        if not line.strip():
+            continue
+        if line.startswith(NESTED_INDENT) and group:
+            group.append(line)
+        else:
+            if group:
+                yield group
+            group = [line]
+    if group:
+        yield group
+
+
+def decode_group(lines, codec):
+    record = codec.decode(json.loads(lines[0]))
+    if len(lines) > 1 or record.get(NESTED_FIELD) == []:
+        record[NESTED_FIELD] = [codec.decode(json.loads(line)) for line in lines[1:]]
+    return record
+
+
+def iter_json_array(f, chunk_size=1 << 16):
+    """Eski biçimdeki JSON dizisinin elemanlarını tek tek döner (tüm metni okumadan)."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = '', 0, False
+
+    def fill():
+        nonlocal buf, pos, eof
+        more = f.read(max(chunk_size, len(buf) - pos))
+        eof = not more
+        buf, pos = buf[pos:] + more, 0
+
+    started = False
+    while True:
+        while pos < len(buf) and buf[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= len(buf):
+            if eof:
+                if started:
+                    raise ValueError("JSON dizisi yarım kalmış")
+                return
+            fill()
+            continue
+        if not started:
+            if buf[pos] != '[':
+                raise ValueError("JSON dizisi bekleniyordu")
+            started = True
+            pos += 1
+            continue
+        if buf[pos] == ']':
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            if eof:
+                raise
+            fill()
+            continue
+        yield item
+        pos = end
+
+
+def stream(f):
+    """Açık dosyadan (iki biçim de) kayıtları tek tek döner."""
+    codec = read_header(f)
+    if codec is None:
+        yield from iter_json_array(f)
+        return
+    for group in iter_groups(f):
+        yield decode_group(group, codec)
+
+
+def loads(text):
+    """Kanonik JSONL veya eski JSON dizisi metninden kayıt listesi."""
+    return list(stream(io.StringIO(text)))
+
+
+def load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(stream(f))
+
+
+def header_prefixes(first_line):
+    """Kanonik başlık satırındaki önek tablosu (başlık değilse boş)."""
+    try:
+        header = json.loads(first_line)
+        return header.get('prefixes', []) if header.get('format') == FORMAT_NAME else []
+    except (ValueError, AttributeError):
+        return []
+
+
+def read_prefixes(path):
+    """Mevcut kanonik dosyanın önek tablosu (yoksa boş)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return header_prefixes(f.readline())
+    except OSError:
+        return []
+
+
+def dumps_legacy(records):
+    """Eski biçim: girintili tek JSON dizisi (movies.json / diziler.json)."""
+    return json.dumps(records, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Katalog dosyasını kanonik JSONL ile eski JSON biçimi arasında çevirir")
+    parser.add_argument('source')
+    parser.add_argument('target', nargs='?', help="Varsayılan: uzantı .json <-> .jsonl değiştirilir")
+    parser.add_argument('--fresh', action='store_true', help="Hedefin önek tablosunu koruma, baştan seç")
+    args = parser.parse_args()
+
+    base, ext = os.path.splitext(args.source)
+    target = args.target or base + ('.json' if ext == '.jsonl' else '.jsonl')
+    records = load(args.source)
+    if is_canonical_path(target):
+        prefixes = () if args.fresh else read_prefixes(target)
+        text = dumps(records, prefixes=prefixes)
+    else:
+        text = dumps_legacy(records)
+    atomic_write_text(target, text)
+    print(f"🔁 {args.source} ({os.path.getsize(args.source) // 1024} KB) -> "
+          f"{target} ({len(text.encode('utf-8')) // 1024} KB), {len(records)} kayıt", flush=True)
+
+
+if __name__ == '__main__':
+    main()
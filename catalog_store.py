@@ -0,0 +1,384 @@
+import hashlib
+import json
+import os
+
+import catalog_format
+from compact_record import CompactRecord
+from journal import Journal, atomic_write_json, atomic_write_lines
+from metrics import metrics
+
+# --- KATALOG DEPOSU ---
+# Üç bot da (main.py, main2.py, original_main_dizi.py) kataloğu buradan yükler,
+# arar ve günceller. Kayıtlar liste olarak tutulur (JSON dosyasının sırası
+# korunur), aramalar ise URL anahtarlı sözlük indeksi üzerinden O(1). Dosya
+# akış halinde okunur ve her kayıt bellekte CompactRecord olarak durur (bkz.
+# compact_record); değişen kayıtlar yeniden kodlanır, kaydetmede diğerlerinin
+# satırları olduğu gibi yazılır.
+# Güncellemeler önce '<dosya>.journal' günlüğüne yazılır; kanonik JSON yalnızca
+# sıkıştırmada (çalışma sonunda veya günlük eşiği aşınca) yeniden yazılır.
+# '.jsonl' uzantılı yollar kanonik biçimde (bkz. catalog_format) yazılır; eski
+# '.json' dosyası (legacy_path) varsa ilk yüklemede kanonik dosyaya taşınır
+# (parça modunda taşınmaz, yalnızca taban olarak okunur).
+# feed verilirse (bkz. delta_feed) ekleme / güncelleme / yeni bölümler ona da bildirilir.
+#
+# Her kayıt ve bölüm 'hash' alanında içerik özetini taşır (normalize edilmiş
+# alanlar üzerinden; dizi özeti bölüm özetlerini de kapsar). Özeti değişmeyen
+# bir upsert / update_fields no-op'tur: günlüğe yazılmaz, akışa bildirilmez ve
+# kataloğu kirletmez; hiçbir şey değişmeyen çalışmada dosya yeniden yazılmaz.
+
+JOURNAL_COMPACT_BYTES = 8 * 1024 * 1024
+HASH_FIELD = 'hash'
+# Özete girmeyen alanlar: özetin kendisi, tarama iç durumu ve (ayrı özetlenen) bölümler
+UNHASHED_FIELDS = (HASH_FIELD, 'seasons', 'episodes')
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if k != HASH_FIELD}
+    return value
+
+
+def content_hash(record, episode_hashes=None):
+    """Kaydın normalize edilmiş alanlarının kararlı özeti (16 hex)."""
+    data = {k: _normalize(v) for k, v in record.items() if k not in UNHASHED_FIELDS}
+    if episode_hashes is not None:
+        data['episodes'] = episode_hashes
+    text = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def stamp(record):
+    """Kayda (ve bölümlerine) içerik özetlerini yazar, kayıt özetini döner."""
+    episode_hashes = None
+    if isinstance(record.get('episodes'), list):
+        episode_hashes = []
+        for ep in record['episodes']:
+            ep[HASH_FIELD] = content_hash(ep)
+            episode_hashes.append(ep[HASH_FIELD])
+    record[HASH_FIELD] = content_hash(record, episode_hashes)
+    return record[HASH_FIELD]
+
+
+def read_compact(path):
+    """Katalog dosyasını akış halinde okur: (kodlayıcı, CompactRecord listesi, yeniden kodlanmalı mı)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        codec = catalog_format.read_header(f)
+        if codec is not None:
+            return codec, [CompactRecord.from_lines(group, codec) for group in catalog_format.iter_groups(f)], False
+        # Eski JSON dizisi: önek tablosu ilk kaydetmede seçilir ve kayıtlar yeniden kodlanır
+        codec = catalog_format.PrefixCodec()
+        return codec, [CompactRecord.from_dict(r, codec) for r in catalog_format.iter_json_array(f)], True
+
+
+class CatalogStore:
+    """URL anahtarlı, hash indeksli katalog (film veya dizi listesi)."""
+
+    def __init__(self, path, key='url', compact_threshold=JOURNAL_COMPACT_BYTES, legacy_path=None, feed=None,
+                 base_path=None):
+        self.path = path
+        self.key = key
+        self.legacy_path = legacy_path
+        # Parça modu (bkz. shard): base_path salt okunur taban, path yalnızca değişen kayıtlar
+        self.base_path = base_path
+        self._touched = set() if base_path else None
+        self.feed = feed
+        self.compact_threshold = compact_threshold
+        self.dirty = False    # son yazımdan beri gerçek değişiklik var mı
+        self.records = []     # CompactRecord listesi
+        self._index = {}      # kayıt url -> records içindeki sıra
+        self._episode_urls = {}  # dizi url -> bölüm URL kümesi (kayıt değişince silinir)
+        self.codec = catalog_format.PrefixCodec()
+        self._changed = set() # son yazımdan beri yeniden kodlanan kayıtlar
+        self._reencode = False
+        self.journal = Journal(f"{path}.journal") if path else None
+
+    @classmethod
+    def from_records(cls, records, path=None, key='url'):
+        store = cls(path, key)
+        store.records = [CompactRecord.from_dict(r, store.codec) for r in records]
+        store._reindex()
+        store.dirty = True
+        return store
+
+    # --- Yükleme / Kaydetme ---
+    def load(self):
+        """Dosya varsa kataloğu yükler ve yarıda kalmış çalışmanın günlüğünü üstüne uygular."""
+        self.records = []
+        self._episode_urls = {}
+        migrate = (self.legacy_path and not self.base_path and not os.path.exists(self.path)
+                   and os.path.exists(self.legacy_path))
+        source = self.legacy_path if migrate else (self.base_path or self.path)
+        if self.base_path and not os.path.exists(self.base_path) and self.legacy_path:
+            # Parça modunda taban henüz taşınmamışsa eski dosya okunur; taşıma merge_shards'ta
+            source = self.legacy_path
+        if os.path.exists(source):
+            try:
+                self._read(source)
+            except Exception:
+                self.records = []
+        self._reindex()
+        if self.base_path and os.path.exists(self.path):
+            self._overlay(self.path)
+
+        journals = [self.journal] if self.journal else []
+        if migrate:
+            journals.insert(0, Journal(f"{self.legacy_path}.journal"))
+        replayed = 0
+        for journal in journals:
+            for entry in journal.replay():
+                self._apply(entry)
+                replayed += 1
+        if replayed:
+            print(f"♻️ Günlükten {replayed} güncelleme geri yüklendi.", flush=True)
+        self.dirty = bool(replayed) or migrate
+        if migrate:
+            self.compact()
+            journals[0].clear()
+            os.remove(self.legacy_path)
+            print(f"🔁 {self.legacy_path} -> {self.path} (kanonik JSONL) taşındı.", flush=True)
+        elif self.journal and self.journal.size():
+            # Kurtarılan durumu hemen kalıcı yap; yarım son satırın arkasına yazılmasın
+            self.compact()
+        return self
+
+    def _read(self, path):
+        self.codec, self.records, self._reencode = read_compact(path)
+        self._episode_urls = {}
+
+    def _overlay(self, path):
+        """Parça dosyasındaki kayıtları tabanın üstüne koyar (bu parçanın önceki yazımı)."""
+        for record in read_compact(path)[1]:
+            idx = self._index.get(record.url)
+            if idx is None:
+                self.records.append(record)
+                self._index[record.url] = len(self.records) - 1
+            else:
+                self.records[idx] = record
+                self._episode_urls.pop(record.url, None)
+            self._touched.add(record.url)
+
+    def touched_count(self):
+        """Parça modunda dosyaya yazılacak (bu parçanın değiştirdiği) kayıt sayısı."""
+        return len(self._touched) if self._touched is not None else len(self.records)
+
+    def materialized(self):
+        """Kayıtların tam sözlük halleri (tek tek üretilir; ön yüz çıktısı vb. için)."""
+        for record in self.records:
+            yield record.materialize()
+
+    def _apply(self, entry):
+        op = entry.get('op')
+        if op == 'upsert':
+            self._upsert(entry['record'])
+        elif op == 'episodes':
+            self._add_episodes(entry['url'], entry['episodes'])
+        elif op == 'fields':
+            self._update_fields(entry['url'], entry['fields'])
+        elif op == 'rename':
+            self._rename(entry['url'], entry['record'])
+
+    def _log(self, entry):
+        if self.journal:
+            self.journal.append(entry)
+
+    def checkpoint(self):
+        """Günlük eşiği aştıysa kanonik dosyayı sıkıştırır. Her kayıttan sonra çağrılabilir."""
+        if self.journal and self.journal.size() >= self.compact_threshold:
+            self.compact()
+
+    def compact(self):
+        """Değişiklik varsa kataloğu atomik olarak kanonik dosyaya yazar ve günlüğü temizler."""
+        if not self.dirty and os.path.exists(self.path):
+            if self.journal:
+                self.journal.clear()
+            return
+        if catalog_format.is_canonical_path(self.path):
+            self._write_canonical()
+        else:
+            touched = self._touched
+            atomic_write_json(self.path, [r.materialize() for r in self.records if touched is None or r.url in touched])
+        self.dirty = False
+        if self.journal:
+            self.journal.clear()
+
+    def save(self):
+        self.compact()
+
+    def _write_canonical(self):
+        """Önek tablosunu değişen kayıtlara göre genişletir, kayıtları URL sırasıyla yazar."""
+        if self._reencode:
+            reencode = self.records
+        else:
+            # Değişenler + başka tabloyla kodlanmış (parça dosyasından gelen) kayıtlar
+            reencode = [self.get(url) for url in self._changed]
+            reencode += [r for r in self.records if r.codec is not self.codec and r.url not in self._changed]
+            reencode = [r for r in reencode if r is not None]
+        before = len(self.codec.prefixes)
+        self.codec.extend(catalog_format.choose_prefixes((r.materialize() for r in reencode), self.codec.prefixes))
+        grown = len(self.codec.prefixes) != before
+        for record in reencode:
+            if self._reencode or grown or record.codec is not self.codec:
+                self.records[self._index[record.url]] = CompactRecord.from_dict(record.materialize(), self.codec)
+        self._reencode = False
+        self._changed = set()
+        self.records.sort(key=lambda r: r.url or '')
+        self._reindex()
+        touched = self._touched
+
+        def lines():
+            yield catalog_format.header_line(self.codec, self.key)
+            for record in self.records:
+                if touched is None or record.url in touched:
+                    yield record.raw.decode('utf-8')
+        atomic_write_lines(self.path, lines())
+
+    def _reindex(self):
+        self._index = {record.url: i for i, record in enumerate(self.records) if record.url is not None}
+
+    # --- Arama ---
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __contains__(self, url):
+        return url in self._index
+
+    def get(self, url):
+        idx = self._index.get(url)
+        return self.records[idx] if idx is not None else None
+
+    def known_episode_urls(self, series_url):
+        """Dizinin kayıtlı bölüm URL'leri. Küme kayıt değişene kadar önbellekte kalır; değiştirilmemeli."""
+        known = self._episode_urls.get(series_url)
+        if known is None:
+            record = self.get(series_url)
+            if record is None:
+                return set()
+            known = self._episode_urls[series_url] = record.episode_urls()
+        return known
+
+    # --- Güncelleme ---
+    def upsert(self, record):
+        """Kaydı ekler ya da aynı URL'deki kaydın yerine koyar. 'added' / 'updated' / 'unchanged' döner."""
+        existing = self.get(record[self.key])
+        new_hash = stamp(record)
+        if existing is not None and self._hash_of(existing) == new_hash:
+            metrics.count('records_unchanged')
+            return 'unchanged'
+        status = self._upsert(record)
+        self._log({'op': 'upsert', 'record': record})
+        metrics.count(f"records_{status}")
+        if self.feed:
+            self.feed.note(status, record[self.key])
+        return status
+
+    @staticmethod
+    def _hash_of(record):
+        return record.get(HASH_FIELD) or stamp(record.materialize())
+
+    def add_episodes(self, series_url, episodes):
+        """Diziye yalnızca bilinmeyen bölümleri ekler. Eklenen bölüm sayısını döner."""
+        known = self.known_episode_urls(series_url)
+        fresh = [ep for ep in episodes if ep.get('url') and ep['url'] not in known]
+        added = self._add_episodes(series_url, fresh)
+        if added:
+            self._log({'op': 'episodes', 'url': series_url, 'episodes': fresh})
+            metrics.count('episodes_added', added)
+            if self.feed:
+                self.feed.note('episodes', series_url, [ep['url'] for ep in fresh])
+        return added
+
+    def update_fields(self, url, fields):
+        """Kaydın yalnızca verilen alanlarını günceller (ör. sezon parmak izleri)."""
+        record = self.get(url)
+        if record is not None and all(record.get(k) == v for k, v in fields.items()):
+            metrics.count('fields_unchanged')
+            return
+        if self._update_fields(url, fields):
+            self._log({'op': 'fields', 'url': url, 'fields': fields})
+            if self.feed:
+                self.feed.note('fields', url, list(fields))
+
+    def rename(self, old_url, record):
+        """Kaydı yeni URL'siyle değiştirir (alan adı taşıma; bkz. mirrors). Yeni URL zaten varsa onun yerine geçer."""
+        if old_url not in self._index:
+            return
+        stamp(record)
+        self._rename(old_url, record)
+        self._log({'op': 'rename', 'url': old_url, 'record': record})
+        if self.feed:
+            self.feed.note('removed', old_url)
+            self.feed.note('added', record[self.key])
+
+    def _rename(self, old_url, record):
+        url = record[self.key]
+        idx = self._index.pop(old_url, None)
+        if idx is None:
+            return
+        self._episode_urls.pop(old_url, None)
+        if self._touched is not None:
+            self._touched.discard(old_url)
+        if url in self._index:
+            del self.records[idx]
+            self._reindex()
+        else:
+            self._index[url] = idx
+        self._replace(url, record)
+
+    def _update_fields(self, url, fields):
+        record = self.get(url)
+        if record is None:
+            return False
+        full = record.materialize()
+        full.update(fields)
+        if any(k not in UNHASHED_FIELDS for k in fields):
+            stamp(full)
+        self._replace(url, full)
+        return True
+
+    def _upsert(self, record):
+        url = record[self.key]
+        status = 'updated' if url in self._index else 'added'
+        if status == 'added':
+            self.records.append(None)
+            self._index[url] = len(self.records) - 1
+        self._replace(url, record)
+        return status
+
+    def _replace(self, url, full):
+        """Kaydın tam halini sıkışık kayda çevirip yerine koyar."""
+        self.records[self._index[url]] = CompactRecord.from_dict(full, self.codec)
+        self._episode_urls.pop(url, None)
+        self._changed.add(url)
+        if self._touched is not None:
+            self._touched.add(url)
+        self.dirty = True
+
+    def _add_episodes(self, series_url, episodes):
+        series = self.get(series_url)
+        if series is None:
+            return 0
+        known = self.known_episode_urls(series_url)
+        full = series.materialize()
+        target = full.setdefault('episodes', [])
+        added = 0
+        for ep in episodes:
+            ep_url = ep.get('url')
+            if not ep_url or ep_url in known:
+                continue
+            ep[HASH_FIELD] = content_hash(ep)
+            target.append(ep)
+            known.add(ep_url)
+            added += 1
+        if added:
+            stamp(full)
+            self._replace(series_url, full)
+            # Küme yerinde güncellendi; yeniden kurmaya gerek yok
+            self._episode_urls[series_url] = known
+        return added
@@ -0,0 +1,66 @@
+import json
+import os
+
+from journal import atomic_write_json
+
+# --- KALDIĞI YERDEN DEVAM (CHECKPOINT) ---
+# Tarama sırasında o anki liste sayfası, o sayfadaki kuyruk ve tamamlanan
+# kayıtlar '<katalog>.checkpoint.json' dosyasına atomik olarak yazılır. İş
+# yarıda kalırsa sonraki çalışma --resume ile aynı sayfadan, tamamlananları
+# atlayarak devam eder. Bölüm düzeyindeki ilerleme katalog günlüğündedir
+# (journal): eklenmiş bölümler zaten bilinen bölüm sayılır. Temiz bitişte
+# dosya silinir.
+
+
+class Checkpoint:
+    def __init__(self, path):
+        self.path = path
+        self.data = {'page': 1, 'queue': [], 'done': [], 'extra': {}}
+        self._done = set()
+
+    def load(self):
+        """Önceki yarım çalışmanın kaydını okur. Kayıt varsa True döner."""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data.update(json.load(f))
+        except Exception:
+            return False
+        self._done = set(self.data['done'])
+        print(f"⏯️ Kaldığı yerden devam: sayfa {self.data['page']}, "
+              f"{len(self._done)}/{len(self.data['queue'])} kayıt tamamlanmış.", flush=True)
+        return True
+
+    @property
+    def page(self):
+        return self.data['page']
+
+    @property
+    def extra(self):
+        return self.data['extra']
+
+    def start_page(self, page_num, queue):
+        """Yeni liste sayfasına geçildi; aynı sayfaya devam ediliyorsa tamamlananlar korunur."""
+        if page_num != self.data['page'] or not self.data['queue']:
+            self._done = set()
+        self.data['page'] = page_num
+        self.data['queue'] = list(queue)
+        self.data['done'] = [url for url in queue if url in self._done]
+        self._save()
+
+    def is_done(self, url):
+        return url in self._done
+
+    def mark_done(self, url):
+        if url not in self._done:
+            self._done.add(url)
+            self.data['done'].append(url)
+            self._save()
+
+    def _save(self):
+        atomic_write_json(self.path, self.data, indent=None)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,101 @@
+import json
+from collections.abc import Mapping
+
+from catalog_format import NESTED_FIELD, decode_group, record_lines
+
+# --- BELLEKTE SIKIŞIK KAYIT ---
+# CatalogStore kayıtları iç içe sözlükler yerine CompactRecord olarak tutar:
+#  - taramanın aradığı alanlar (LOOKUP_FIELDS) çözülmüş halde bir sözlükte,
+#  - bölüm URL'leri önek kodlu ("~3~dizi-1-sezon-1-bolum/") tek bir metinde,
+#  - kaydın tamamı kanonik satırlar halinde UTF-8 bayt olarak (raw).
+# Her bölümde tekrarlanan anahtarlar ve uzun URL önekleri bellekte tutulmaz.
+# Diğer alanlar istendiğinde raw'dan çözülür (materialize); kaydetmede raw
+# satırlar değiştirilmeden dosyaya yazılır.
+
+LOOKUP_FIELDS = ('hash', 'title', 'year', 'platform', 'seasons')
+_EPISODE_SEP = '\n'
+
+
+class CompactRecord(Mapping):
+    """Salt okunur, sözlük gibi davranan sıkışık kayıt. Değiştirmek için yeni kayıt oluşturulur."""
+
+    __slots__ = ('url', 'fields', 'episode_keys', 'raw', 'codec')
+
+    def __init__(self, url, fields, episode_keys, raw, codec):
+        self.url = url
+        self.fields = fields
+        self.episode_keys = episode_keys  # None: kayıtta bölüm alanı yok
+        self.raw = raw
+        self.codec = codec
+
+    @classmethod
+    def from_lines(cls, lines, codec):
+        """Kanonik satırlardan (dosyadan okunduğu gibi) kayıt."""
+        head = json.loads(lines[0])
+        decode = codec.decode
+        fields = {k: decode(head[k]) for k in LOOKUP_FIELDS if k in head}
+        episode_keys = None
+        if NESTED_FIELD in head and isinstance(head[NESTED_FIELD], list):
+            episode_keys = _EPISODE_SEP.join(json.loads(line).get('url') or '' for line in lines[1:])
+        return cls(decode(head.get('url')), fields, episode_keys,
+                   '\n'.join(lines).encode('utf-8'), codec)
+
+    @classmethod
+    def from_dict(cls, record, codec):
+        return cls.from_lines(record_lines(record, codec), codec)
+
+    # --- Çözme ---
+    def lines(self):
+        return self.raw.decode('utf-8').split('\n')
+
+    def materialize(self):
+        """Kaydın tam sözlük hali (her çağrıda yeni kopya)."""
+        return decode_group(self.lines(), self.codec)
+
+    def episode_urls(self):
+        """Bölüm URL kümesi (çağıran tarafta üyelik kontrolü için)."""
+        if not self.episode_keys:
+            return set()
+        decode = self.codec.decode
+        return {decode(key) for key in self.episode_keys.split(_EPISODE_SEP) if key}
+
+    # --- Mapping ---
+    def __getitem__(self, key):
+        if key == 'url':
+            return self.url
+        if key in LOOKUP_FIELDS:
+            return self.fields[key]
+        return self.materialize()[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if key == 'url':
+            return True
+        if key in LOOKUP_FIELDS:
+            return key in self.fields
+        if key == NESTED_FIELD:
+            return self.episode_keys is not None
+        return key in self.materialize()
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def keys(self):
+        return self.materialize().keys()
+
+    def items(self):
+        return self.materialize().items()
+
+    def values(self):
+        return self.materialize().values()
+
+    def __repr__(self):
+        return f"CompactRecord({self.url!r}, {len(self.raw)} B)"
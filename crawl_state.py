@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import re
+import time
+
+from journal import atomic_write_json
+from metrics import metrics
+
+# --- ARTIMLI TARAMA DURUMU ---
+# Dizi botları her çalışmada liste sayfalarındaki dizi kartlarının parmak izini
+# ve her dizinin kontrol / yeni bölüm zamanlarını '<katalog>.state.json' dosyasına yazar.
+# Sonraki çalışmada kartı değişmemiş diziler açılmaz; art arda
+# UNCHANGED_PAGE_LIMIT sayfada hiçbir değişiklik yoksa liste taraması durur.
+# Son tam taramadan FULL_SWEEP_DAYS gün sonra (veya --full ile) tam tarama yapılır.
+# Dosya yalnızca içeriği değiştiyse yazılır (workflow boş çalışmada commit atmasın):
+# kontrol zamanları TIMESTAMP_STEP'ten sık ilerletilmez.
+UNCHANGED_PAGE_LIMIT = int(os.environ.get('UNCHANGED_PAGE_LIMIT', '2'))
+FULL_SWEEP_DAYS = float(os.environ.get('FULL_SWEEP_DAYS', '7'))
+TIMESTAMP_STEP = 24 * 3600
+# Eski 'runs_since_full' sayacını zamana çevirirken varsayılan çalışma aralığı (12 saatte bir)
+LEGACY_RUN_INTERVAL = 12 * 3600
+
+# Dizi başına saklanan 'yeni bölüm bulundu' zamanı sayısı
+NEW_EPISODE_HISTORY = 8
+
+SEASON_RE = re.compile(r'(\d+)-sezon')
+SEASON_LINK_RES = (re.compile(r'sezon-(\d+)'), SEASON_RE)
+
+
+def fingerprint(parts):
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def card_text(link):
+    """Liste sayfasındaki bir dizi linkinin kart metni (son bölüm bilgisi vb. dahil)."""
+    card = link.find_parent('div', class_='post-item') or link
+    return f"{link.get('title', '')}|{card.get_text(' ', strip=True)}"
+
+
+def estimated_visit_cost(record):
+    """Bir diziyi açmanın yaklaşık istek sayısı: dizi sayfası + sezon sayfaları."""
+    seasons = {m.group(1) for ep in record.get('episodes', []) for m in [SEASON_RE.search(ep.get('url') or '')] if m}
+    return 1 + len(seasons)
+
+
+# --- Sezon parmak izleri ---
+# Katalogdaki her dizi kaydı 'seasons' altında {sezon url: {"count", "hash"}}
+# tutar. Güncellemede yalnızca en yeni sezon ve parmak izi bilinmeyen sezonlar
+# çekilir; parmak izi değişmeyen sezonun bölümleri karşılaştırılmaz.
+
+def season_fingerprint(episode_urls):
+    return {'count': len(episode_urls), 'hash': fingerprint(episode_urls)}
+
+
+def newest_season(season_links):
+    """Sezon numarası en büyük link (numara yoksa listedeki son link)."""
+    def number(link):
+        for pattern in SEASON_LINK_RES:
+            m = pattern.search(link)
+            if m: return int(m.group(1))
+        return -1
+    return max(reversed(season_links), key=number)
+
+
+def seasons_to_fetch(season_links, known_seasons):
+    """known_seasons None ise (yeni dizi / tam tarama) hepsi, değilse en yeni + bilinmeyenler."""
+    if known_seasons is None:
+        return list(season_links)
+    newest = newest_season(season_links)
+    return [s for s in season_links if s == newest or s not in known_seasons]
+
+
+def drop_failed_seasons(fingerprints, season_of, fetched):
+    """season_of: aday bölüm url -> sezon url. Bölümü çekilemeyen sezonların yeni parmak izi
+    atılır (kayıttaki eskisi kalır ya da hiç yazılmaz); sonraki artımlı çalışma sezonu yeniden
+    açar ve eksik bölümleri dener. Atılan sezonları döner."""
+    got = {ep.get('url') for ep in fetched}
+    failed = {season_url for ep_url, season_url in season_of.items() if ep_url not in got}
+    for season_url in failed:
+        fingerprints.pop(season_url, None)
+    return failed
+
+
+def merge_state(base, shards):
+    """Parça durumlarını (eskiden yeniye sıralı) tabana uygular; her parçadan yalnızca
+    tabandan farklı liste parmak izleri ve dizi alanları alınır."""
+    merged = {**base,
+              'listing': dict(base.get('listing', {})),
+              'series': {url: dict(entry) for url, entry in base.get('series', {}).items()}}
+    for data in shards:
+        listing = base.get('listing', {})
+        for url, fp in data.get('listing', {}).items():
+            if listing.get(url) != fp:
+                merged['listing'][url] = fp
+        series = base.get('series', {})
+        for url, entry in data.get('series', {}).items():
+            old = series.get(url, {})
+            target = merged['series'].setdefault(url, {})
+            target.update({field: value for field, value in entry.items() if old.get(field) != value})
+        merged['full_at'] = data.get('full_at', merged.get('full_at'))
+    if shards:
+        merged['listing_pages'] = max(data.get('listing_pages', 0) for data in shards)
+    return merged
+
+
+class CrawlState:
+    def __init__(self, path, base_path=None):
+        """base_path: path henüz yoksa okunacak durum (parça çalışmasında ana durum dosyası)."""
+        self.path = path
+        self.data = {'full_at': None, 'listing_pages': 0, 'listing': {}, 'series': {}}
+        source = path if os.path.exists(path) or not base_path else base_path
+        if os.path.exists(source):
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+            except Exception:
+                pass
+        # Okunan hâli: finish() yalnızca bundan farklıysa yazar
+        self.loaded = json.loads(json.dumps(self.data))
+        runs = self.data.pop('runs_since_full', None)
+        if self.data['full_at'] is None and runs is not None:
+            self.data['full_at'] = int(time.time()) - runs * LEGACY_RUN_INTERVAL
+        self.report = {
+            'mode': '', 'pages_walked': 0, 'pages_saved': 0,
+            'series_visited': 0, 'series_skipped': 0, 'requests_saved': 0,
+            'series_refreshed': 0, 'refresh_requests': 0,
+        }
+
+    def should_full_sweep(self, forced=False):
+        full_at = self.data['full_at']
+        return forced or full_at is None or time.time() - full_at >= FULL_SWEEP_DAYS * 24 * 3600
+
+    def begin(self, full_sweep):
+        self.full_sweep = full_sweep
+        self.report['mode'] = 'full' if full_sweep else 'incremental'
+        self.unchanged_pages = 0
+        self.visited_now = set()
+
+    # --- Liste sayfaları ---
+    def page_done(self, page_num, changed):
+        self.report['pages_walked'] = page_num
+        self.unchanged_pages = 0 if changed else self.unchanged_pages + 1
+
+    def can_stop(self):
+        """Artımlı modda art arda değişmeyen sayfa sınırı aşıldı mı?"""
+        return not self.full_sweep and self.unchanged_pages >= UNCHANGED_PAGE_LIMIT
+
+    # --- Diziler ---
+    def card_changed(self, series_url, card_fp):
+        """Liste kartı son kaydedilen parmak izinden farklı mı (mod ne olursa olsun)?"""
+        return self.data['listing'].get(series_url) != card_fp
+
+    def is_unchanged(self, series_url, card_fp, record):
+        if self.full_sweep or record is None:
+            return False
+        return self.data['listing'].get(series_url) == card_fp
+
+    def skip(self, record):
+        self.report['series_skipped'] += 1
+        self.report['requests_saved'] += estimated_visit_cost(record)
+
+    def visited(self, series_url, card_fp, new_episodes=0, complete=True):
+        """Dizi açıldı. card_fp None ise (öncelikli yenileme) liste parmak izi değişmez.
+        complete False ise (bazı bölümler çekilemedi) parmak izi silinir: dizi sonraki çalışmada yeniden açılır."""
+        self.report['series_visited'] += 1
+        self.visited_now.add(series_url)
+        if not complete:
+            self.data['listing'].pop(series_url, None)
+        elif card_fp is not None:
+            self.data['listing'][series_url] = card_fp
+        now = int(time.time())
+        entry = self.data['series'].setdefault(series_url, {})
+        entry['checked_at'] = now
+        # İlk kontrol: yeni bölüm görülmeyen dizinin ne kadar süredir sessiz olduğu buradan bilinir
+        entry.setdefault('first_checked_at', now)
+        if new_episodes:
+            # Yeni bölüm bulunan anlar: refresh_scheduler yayın sıklığını buradan tahmin eder
+            entry['new_at'] = (entry.get('new_at', []) + [now])[-NEW_EPISODE_HISTORY:]
+
+    def seen_on_first_page(self, series_urls):
+        now = int(time.time())
+        for url in series_urls:
+            self.data['series'].setdefault(url, {})['page1_at'] = now
+
+    # --- Bitiş ---
+    def _settle_timestamps(self):
+        """checked_at / page1_at, okunan değerden TIMESTAMP_STEP'ten az ilerlediyse eski değerde kalır."""
+        loaded = self.loaded.get('series', {})
+        for url, entry in self.data['series'].items():
+            old = loaded.get(url, {})
+            for field in ('checked_at', 'page1_at'):
+                if field in entry and old.get(field) and entry[field] - old[field] < TIMESTAMP_STEP:
+                    entry[field] = old[field]
+
+    def finish(self):
+        walked = self.report['pages_walked']
+        if self.full_sweep:
+            self.data['listing_pages'] = walked
+            self.data['full_at'] = int(time.time())
+        else:
+            self.report['pages_saved'] = max(self.data['listing_pages'] - walked, 0)
+        self._settle_timestamps()
+        if self.data != self.loaded:
+            atomic_write_json(self.path, self.data, indent=None)
+        else:
+            print("💾 Tarama durumu değişmedi, dosya yazılmadı.", flush=True)
+        metrics.note('crawl', self.report)
+
+        r = self.report
+        print(f"📊 Tarama ({r['mode']}): {r['pages_walked']} sayfa gezildi, ~{r['pages_saved']} sayfa atlandı | "
+              f"{r['series_visited']} dizi açıldı, {r['series_skipped']} dizi atlandı (~{r['requests_saved']} istek tasarrufu), "
+              f"{r['series_refreshed']} dizi öncelikli yenilendi ({r['refresh_requests']} istek)",
+              flush=True)
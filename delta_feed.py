@@ -0,0 +1,161 @@
+import json
+import os
+import time
+
+from catalog_export import INTERNAL_FIELDS, public, record_id
+from journal import Journal, atomic_write_json
+
+# --- DEĞİŞİKLİK AKIŞI (DELTA FEED) ---
+# Her çalışma, katalogda neyin değiştiğini '<katalog>.deltas/<sürüm>.json'
+# dosyasına yazar; '<katalog>.manifest.json' güncel sürümü ve son
+# DELTA_HISTORY değişiklik dosyasının listesini tutar. İstemci (ön yüz, ayna)
+# bildiği sürümden sonraki değişiklik dosyalarını sırayla uygular; sürümü
+# listedeki en eski 'base'den de eskiyse (veya hiç yoksa) kataloğu baştan indirir.
+# Değişiklik dosyası: added / updated (tam kayıt), removed (URL), episodes
+# (dizi URL -> yeni bölümler; dizinin kendisi added/updated'da ise burada yer almaz).
+# Çalışma boyunca görülen değişiklikler '<katalog>.delta.journal' günlüğüne
+# yazılır; iş yarıda kesilirse bir sonraki çalışma onları da yayınlar.
+
+DELTA_HISTORY = int(os.environ.get('DELTA_HISTORY', '30'))
+
+
+class DeltaFeed:
+    """CatalogStore'un çalışma boyunca bildirdiği değişiklikleri toplar ve yayınlar."""
+
+    def __init__(self, data_file, kind, history=DELTA_HISTORY):
+        base = os.path.splitext(data_file)[0]
+        self.kind = kind
+        self.history = history
+        self.manifest_path = f"{base}.manifest.json"
+        self.delta_dir = f"{base}.deltas"
+        self.journal = Journal(f"{base}.delta.journal")
+        # Sıralı kümeler (dict) ve dizi URL -> yeni bölüm URL'leri
+        self.added = {}
+        self.updated = {}
+        self.removed = {}
+        self.episodes = {}
+        for entry in self.journal.replay():
+            self._apply(entry)
+
+    def note(self, op, url, items=None):
+        """op: 'added' | 'updated' | 'removed' | 'episodes' (items: bölüm URL'leri) | 'fields' (items: alan adları)."""
+        if op == 'fields':
+            if all(field in INTERNAL_FIELDS for field in items or ()):
+                return  # sezon parmak izi gibi iç alanlar istemciyi ilgilendirmez
+            op, items = 'updated', None
+        entry = {'op': op, 'url': url}
+        if items:
+            entry['items'] = list(items)
+        self._apply(entry)
+        self.journal.append(entry)
+
+    def _apply(self, entry):
+        op, url = entry['op'], entry['url']
+        if op == 'added':
+            self.removed.pop(url, None)
+            self.added[url] = True
+        elif op == 'updated':
+            if url not in self.added:
+                self.updated[url] = True
+        elif op == 'removed':
+            self.added.pop(url, None)
+            self.updated.pop(url, None)
+            self.episodes.pop(url, None)
+            self.removed[url] = True
+        elif op == 'episodes':
+            self.episodes.setdefault(url, {}).update(dict.fromkeys(entry.get('items', ())))
+
+    # --- Yayınlama ---
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'version': 0, 'deltas': []}
+
+    def publish(self, store):
+        """Değişiklik varsa yeni sürümün değişiklik dosyasını ve manifest'i yazar. Sürümü döner."""
+        manifest = self.load_manifest()
+        version = manifest.get('version', 0)
+        deltas = manifest.get('deltas', [])
+        delta = self._build(store)
+        if any(delta.values()):
+            version += 1
+            os.makedirs(self.delta_dir, exist_ok=True)
+            filename = f"{version}.json"
+            atomic_write_json(os.path.join(self.delta_dir, filename),
+                              {'version': version, 'base': version - 1, 'kind': self.kind,
+                               'generated_at': int(time.time()), **delta}, indent=None)
+            counts = {key: len(value) for key, value in delta.items()}
+            counts['episodes'] = sum(len(eps) for eps in delta['episodes'].values())
+            deltas = self._prune(deltas + [{
+                'version': version,
+                'base': version - 1,
+                'file': f"{os.path.basename(self.delta_dir)}/{filename}",
+                **counts,
+            }])
+            print(f"🧾 Değişiklik akışı: sürüm {version} (+{counts['added']} yeni, ~{counts['updated']} güncel, "
+                  f"-{counts['removed']} silinen, {counts['episodes']} yeni bölüm)", flush=True)
+        elif os.path.exists(self.manifest_path):
+            self._reset()
+            return version
+
+        atomic_write_json(self.manifest_path, {
+            'version': version,
+            'kind': self.kind,
+            'generated_at': int(time.time()),
+            'catalog': os.path.basename(store.path or ''),
+            'records': len(store),
+            'deltas': deltas,
+        })
+        self._reset()
+        return version
+
+    def _reset(self):
+        self.added, self.updated, self.removed, self.episodes = {}, {}, {}, {}
+        self.journal.clear()
+
+    def _build(self, store):
+        def export(url):
+            record = store.get(url)
+            if record is None:
+                return None
+            return {'id': record_id(url), **public(record)}
+
+        full = set(self.added) | set(self.updated)
+        episodes = {}
+        for url, ep_urls in self.episodes.items():
+            if url in full:
+                continue
+            record = store.get(url) or {}
+            fresh = [ep for ep in public(record).get('episodes', []) if ep.get('url') in ep_urls]
+            if fresh:
+                episodes[url] = fresh
+        return {
+            'added': [r for r in map(export, self.added) if r],
+            'updated': [r for r in map(export, self.updated) if r],
+            'removed': list(self.removed),
+            'episodes': episodes,
+        }
+
+    def _prune(self, deltas):
+        """En yeni `history` değişiklik dosyasını tutar, eskilerini siler."""
+        for old in deltas[:-self.history] if self.history else deltas:
+            try:
+                os.remove(os.path.join(os.path.dirname(self.manifest_path) or '.', old['file']))
+            except OSError:
+                pass
+        return deltas[-self.history:] if self.history else []
+
+
+def apply_delta(records, delta):
+    """İstemci tarafı: bir değişiklik dosyasını kayıt listesine uygular (aynalar için örnek)."""
+    by_url = {r['url']: r for r in records}
+    for url in delta.get('removed', ()):
+        by_url.pop(url, None)
+    for record in delta.get('added', []) + delta.get('updated', []):
+        by_url[record['url']] = record
+    for url, episodes in delta.get('episodes', {}).items():
+        if url in by_url:
+            by_url[url].setdefault('episodes', []).extend(episodes)
+    return list(by_url.values())
@@ -0,0 +1,285 @@
+import re
+from urllib.parse import urljoin
+
+# --- TEK GEÇİŞLİ ALAN ÇIKARICI ---
+# Film ve dizi detay sayfalarındaki alanlar, belge ağacında tek bir yürüyüşle
+# toplanır: her etiket adına/özniteliğine göre ilgili yakalayıcıya yönlendirilir.
+# Eski sürümdeki on ayrı soup.find / find_all taramasıyla birebir aynı sonucu
+# verir (ilk eşleşme kazanır, "find_next('div')" belge sırasındaki sonraki div'dir).
+# Bölüm / sezon sayfası çıkarıcıları da burada durur; parse_pool işçileri bot
+# modüllerini (seleniumbase vb.) içe aktarmadan hepsini çalıştırabilir.
+
+INFO_BOX_CLASS = 'bg-white/[4%]'
+
+
+def _has_class(classes, name):
+    return classes is not None and name in classes
+
+
+def _class_contains(classes, fragment):
+    return classes is not None and any(fragment in c for c in classes)
+
+
+def _style_url(style):
+    return style.split("url('")[1].split("')")[0]
+
+
+def extract_movie_details(soup, url):
+    """main.get_full_movie_details için sayfadaki tüm alanları tek geçişte doldurur."""
+    details = {
+        "url": url, "videoUrl": "", "description": "Açıklama yok.",
+        "imdb": "0.0", "genres": [], "cast": [], "year": "",
+        "poster": "", "cover_image": "", "platform": "Platform Dışı", "added_date": ""
+    }
+
+    poster_div = head_div = player_area = platform_link = None
+    upload_icon = calendar_icon = summary = None
+    iframes = []
+    divs = []
+    boxes = []  # (kutu, divs içindeki sırası)
+
+    for el in soup.descendants:
+        name = el.name
+        if name is None:
+            continue
+        if name == 'div':
+            classes = el.get('class')
+            if poster_div is None and _has_class(classes, 'poster'): poster_div = el
+            if head_div is None and el.get('id') == 'head': head_div = el
+            if player_area is None and _has_class(classes, 'video-player-area'): player_area = el
+            if _class_contains(classes, INFO_BOX_CLASS): boxes.append((el, len(divs)))
+            divs.append(el)
+        elif name == 'a':
+            if platform_link is None and '/platform/' in el.get('href', ''): platform_link = el
+        elif name == 'img':
+            src = el.get('src') or ''
+            if upload_icon is None and 'Upload.svg' in src: upload_icon = el
+            if calendar_icon is None and 'Calendar.svg' in src: calendar_icon = el
+        elif name == 'iframe':
+            iframes.append(el)
+        elif name == 'p':
+            if summary is None and _has_class(el.get('class'), 'summary-text'): summary = el
+
+    try:
+        if poster_div and poster_div.find('img'): details['poster'] = poster_div.find('img').get('src')
+
+        if head_div and "url('" in head_div.get('style', ''):
+            details['cover_image'] = _style_url(head_div['style'])
+
+        details["videoUrl"] = _movie_video_source(player_area, iframes)
+
+        if platform_link: details['platform'] = platform_link.get_text(strip=True)
+        if upload_icon: details['added_date'] = upload_icon.parent.get_text(strip=True)
+        if calendar_icon: details['year'] = calendar_icon.parent.get_text(strip=True)
+        if summary: details["description"] = summary.get_text(strip=True)
+
+        for box, pos in boxes:
+            txt = box.get_text()
+            if "IMDB" in txt: details["imdb"] = divs[pos + 1].get_text(strip=True)
+            elif "Tür" in txt: details["genres"] = [a.get_text(strip=True) for a in box.find_all('a')]
+            elif "Oyuncular" in txt: details["cast"] = [a.get_text(strip=True) for a in box.find_all('a')]
+            elif "Yapım Yılı" in txt and not details["year"]: details["year"] = divs[pos + 1].get_text(strip=True)
+    except: pass
+    return details
+
+
+def extract_movie_cards(soup):
+    """Film liste sayfasındaki 'post-item' kartlarından bilinen alanlar: [{'url', 'title', 'poster'?}].
+
+    Detay sayfası açılmadan taslak kayıt oluşturmak için (main.py iki aşamalı mod).
+    """
+    cards = []
+    for item in soup.find_all('div', class_='post-item'):
+        link = item.find('a')
+        if not link or not link.get('href'):
+            continue
+        card = {'url': link['href'], 'title': link.get('title', '').strip() or link.get_text(strip=True)}
+        img = item.find('img')
+        if img:
+            src = img.get('data-src') or img.get('src') or ''
+            if src and not src.startswith('data:'):
+                card['poster'] = src
+        cards.append(card)
+    return cards
+
+
+def _movie_video_source(player_area, iframes):
+    try:
+        if player_area and player_area.find('iframe'): return player_area.find('iframe').get('src')
+        for frame in iframes:
+            if 'embed' in frame.get('src', '') or 'player' in frame.get('src', ''): return frame['src']
+    except: pass
+    return ""
+
+
+def extract_series_details(soup, url, base_domain):
+    """main2.get_full_series_details için dizi alanlarını ve sezon linklerini tek geçişte toplar.
+
+    (meta, season_links) döner; meta'nın 'episodes' listesi boştur.
+    """
+    meta = {
+        "url": url,
+        "title": "",
+        "year": "",
+        "description": "",
+        "poster": "",
+        "cover_image": "",
+        "imdb": "0",
+        "genres": [],
+        "episodes": []
+    }
+    season_links = []
+
+    h1 = summary = poster_div = head_div = imdb_span = season_div = None
+    genre_links = []
+
+    for el in soup.descendants:
+        name = el.name
+        if name is None:
+            continue
+        if name == 'div':
+            classes = el.get('class')
+            el_id = el.get('id')
+            if poster_div is None and _has_class(classes, 'poster'): poster_div = el
+            if head_div is None and el_id == 'head' and _has_class(classes, 'cover-image'): head_div = el
+            if season_div is None and el_id == 'season-options-list': season_div = el
+        elif name == 'a':
+            if 'dizi-kategori' in el.get('href', ''): genre_links.append(el)
+        elif name == 'h1':
+            if h1 is None: h1 = el
+        elif name == 'p':
+            if summary is None and _has_class(el.get('class'), 'summary-text'): summary = el
+        elif name == 'span':
+            if imdb_span is None:
+                text = el.string
+                if text and "IMDB Puanı" in text: imdb_span = el
+
+    try:
+        if h1:
+            full_text = h1.get_text(" ", strip=True)
+            if '(' in full_text:
+                parts = full_text.split('(')
+                meta['title'] = parts[0].strip()
+                meta['year'] = parts[-1].replace(')', '').strip()
+            else:
+                meta['title'] = full_text
+
+        if summary: meta['description'] = summary.get_text(strip=True)
+
+        if poster_div and poster_div.find('img'):
+            meta['poster'] = poster_div.find('img').get('src')
+
+        if head_div and head_div.has_attr('style') and "url('" in head_div['style']:
+            meta['cover_image'] = _style_url(head_div['style'])
+
+        if imdb_span:
+            parent = imdb_span.find_parent('div')
+            score = parent.find('h4') if parent else None
+            if score: meta['imdb'] = score.get_text(strip=True)
+
+        meta['genres'] = list(set([g.get_text(strip=True) for g in genre_links]))
+
+        if season_div:
+            for l in season_div.find_all('a', href=True):
+                full_link = urljoin(base_domain, l['href'])
+                if full_link not in season_links:
+                    season_links.append(full_link)
+    except Exception as e:
+        print(f"   ❌ Hata: {e}")
+
+    return meta, season_links
+
+
+# --- Bölüm ve sezon sayfaları ---
+
+def extract_video_source(soup):
+    """main2: bölüm sayfasındaki oynatıcı iframe adresi."""
+    try:
+        player_area = soup.find('div', class_='video-player-area')
+        if player_area:
+            iframe = player_area.find('iframe')
+            if iframe: return iframe.get('src')
+        
+        iframes = soup.find_all('iframe')
+        for frame in iframes:
+            src = frame.get('src', '')
+            if 'embed' in src or '.cfd' in src or 'player' in src:
+                return src
+    except: pass
+    return ""
+
+
+def extract_video_source_1538(soup):
+    """original_main_dizi: oynatıcı iframe adresi (reklam iframe'leri elenir)."""
+    try:
+        player_area = soup.find('div', class_=lambda x: x and ('video' in x or 'player' in x))
+        if player_area:
+            iframe = player_area.find('iframe')
+            if iframe: return iframe.get('src')
+        
+        iframes = soup.find_all('iframe')
+        for frame in iframes:
+            src = frame.get('src', '')
+            fid = frame.get('id', '')
+            # Reklam filtreleri
+            if 'psContainer' in fid or 'google' in src: continue
+            if 'embed' in src or '.cfd' in src or 'player' in src or 'get_video' in src: return src
+    except: pass
+    return ""
+
+
+def extract_episode_items(soup, known_urls=frozenset()):
+    """main2: sezon sayfasındaki bölüm kutuları. (ep_data, bölüm no) listesi döner."""
+    candidates = []
+    episode_items = soup.find_all('div', class_='episode-item')
+    
+    for item in episode_items:
+        ep_data = {}
+        link_tag = item.find('a')
+        
+        if link_tag:
+            ep_url = link_tag.get('href')
+            title = link_tag.get('title')
+            
+            if ep_url in known_urls:
+                continue 
+
+            ep_data['url'] = ep_url
+            ep_data['title'] = title
+            
+            img_tag = link_tag.find('img')
+            if img_tag:
+                ep_data['thumbnail'] = img_tag.get('src')
+
+        num_tag = item.find('h4', class_='font-eudoxus')
+        episode_number = num_tag.get_text(strip=True) if num_tag else None
+        
+        if 'url' in ep_data:
+            candidates.append((ep_data, episode_number))
+
+    return candidates
+
+
+def extract_episode_links(soup, base_domain, known_urls=frozenset(), seen_urls=None):
+    """original_main_dizi: sayfadaki bölüm linkleri (sayfa içinde tekilleştirilmiş)."""
+    candidates = []
+    seen_urls = set() if seen_urls is None else seen_urls
+    all_links = soup.find_all('a', href=True)
+    
+    for link in all_links:
+        ep_url = link.get('href')
+        if '/dizi/' in ep_url and 'sezon' in ep_url and 'bolum' in ep_url:
+            full_ep_url = urljoin(base_domain, ep_url)
+            if full_ep_url in known_urls: continue
+            if full_ep_url in seen_urls: continue
+            seen_urls.add(full_ep_url)
+
+            title = link.get('title') or link.get_text(strip=True)
+            ep_data = {'url': full_ep_url, 'title': title, 'episode_number': ''}
+            
+            try:
+                match = re.search(r'(\d+)-sezon-(\d+)-bolum', full_ep_url)
+                if match: ep_data['episode_number'] = f"S{match.group(1)} E{match.group(2)}"
+            except: pass
+            candidates.append(ep_data)
+    return candidates
@@ -0,0 +1,92 @@
+import asyncio
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from curl_cffi.requests import AsyncSession
+
+from html_backend import LazySoup
+from http_cache import cache as http_cache
+from metrics import metrics
+from parse_pool import extract_page
+from request_scheduler import scheduler
+
+# --- AYARLAR ---
+# Aynı sunucuya aynı anda en fazla PER_HOST_LIMIT, toplamda MAX_IN_FLIGHT istek.
+# İstek hızı ve tekrar denemeler request_scheduler'dadır.
+PER_HOST_LIMIT = int(os.environ.get('FETCH_PER_HOST', '4'))
+MAX_IN_FLIGHT = int(os.environ.get('FETCH_MAX_IN_FLIGHT', '8'))
+
+
+@asynccontextmanager
+async def _slot(host_sem, global_sem):
+    async with host_sem, global_sem:
+        yield
+
+
+async def _fetch_one(session, url, cookies, headers, global_sem, host_sems):
+    cached = http_cache.fresh_page(url)
+    if cached is not None:
+        return cached
+    host = urlparse(url).netloc
+
+    def send(h):
+        return scheduler.get_async(
+            session, url, slot=lambda: _slot(host_sems[host], global_sem),
+            cookies=cookies, headers=h, impersonate="chrome110", timeout=15)
+    try:
+        # get_soup_fast ile aynı sözleşme: sayfa / "404" / "403" / None
+        return await http_cache.request_async(url, headers, send)
+    except Exception as e:
+        metrics.count('http_errors')
+        print(f"   ⚠️ Hızlı mod hatası: {e}", flush=True)
+        return None
+
+
+async def _fetch_and_extract(kind, base_domain, *fetch_args):
+    # Gövde gelir gelmez işçiye gider; diğer istekler bu sırada sürer.
+    # Çıkarım önbelleği yalnızca burada (ana süreçte) okunur / yazılır.
+    page = await _fetch_one(*fetch_args)
+    if isinstance(page, LazySoup) and page.not_modified:
+        hit = http_cache.get_extraction(page.url, kind)
+        if hit is not None:
+            metrics.count('extract_cache_hit')
+            return hit
+    result = await extract_page(kind, page, base_domain)
+    if isinstance(page, LazySoup):
+        http_cache.put_extraction(page.url, kind, result)
+    return result
+
+
+async def _fetch_all(urls, cookies, user_agent, referer, per_host, max_in_flight, kind=None, base_domain=''):
+    headers = {'User-Agent': user_agent, 'Referer': referer}
+    global_sem = asyncio.Semaphore(max_in_flight)
+    host_sems = defaultdict(lambda: asyncio.Semaphore(per_host))
+    async with AsyncSession() as session:
+        if kind is None:
+            tasks = [_fetch_one(session, url, cookies, headers, global_sem, host_sems) for url in urls]
+        else:
+            tasks = [_fetch_and_extract(kind, base_domain, session, url, cookies, headers, global_sem, host_sems)
+                     for url in urls]
+        return await asyncio.gather(*tasks)
+
+
+def fetch_soups(urls, cookies, user_agent, referer, per_host=PER_HOST_LIMIT, max_in_flight=MAX_IN_FLIGHT):
+    """URL listesini eşzamanlı çeker; sonuçlar URL sırasıyla, get_soup_fast dönüş değerleriyle gelir."""
+    urls = list(urls)
+    if not urls:
+        return []
+    return asyncio.run(_fetch_all(urls, cookies, user_agent, referer, per_host, max_in_flight))
+
+
+def fetch_extracted(urls, kind, cookies, user_agent, referer, base_domain='',
+                    per_host=PER_HOST_LIMIT, max_in_flight=MAX_IN_FLIGHT):
+    """fetch_soups gibi, ama sayfalar parse_pool işçilerinde 'kind' çıkarıcısıyla işlenir.
+
+    Sonuçlar URL sırasıyla: çıkarım sonucu (sözlük / liste / str) ya da "404" / "403" / None.
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    return asyncio.run(_fetch_all(urls, cookies, user_agent, referer, per_host, max_in_flight, kind, base_domain))
@@ -0,0 +1,77 @@
+import atexit
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit
+
+from journal import atomic_write_json
+
+# --- KAYIT / TEKRAR OYNATMA DERLEMİ ---
+# RECORD_FIXTURES=<klasör> ile çalıştırılan botlar aldıkları her yanıtı
+# (durum kodu, başlıklar, gövde) bu klasöre kaydeder. replay_server.py aynı
+# derlemi localhost üzerinden yeniden sunar.
+#
+# Düzen:  <klasör>/index.json            {"origin": ..., "pages": {yol: {...}}}
+#         <klasör>/bodies/<sha1>.html
+RECORD_DIR = os.environ.get('RECORD_FIXTURES', '')
+
+KEPT_HEADERS = ('content-type', 'etag', 'last-modified', 'retry-after')
+
+
+def page_key(url):
+    """Alan adından bağımsız anahtar: yol + sorgu."""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else '')
+
+
+class FixtureCorpus:
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.json')
+        self.origin = ''
+        self.pages = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.origin = data.get('origin', '')
+            self.pages = data.get('pages', {})
+
+    def body(self, key):
+        entry = self.pages.get(key)
+        if not entry or not entry.get('file'):
+            return b''
+        with open(os.path.join(self.root, 'bodies', entry['file']), 'rb') as f:
+            return f.read()
+
+    def add(self, url, status, headers, content):
+        parts = urlsplit(url)
+        if not self.origin:
+            self.origin = f"{parts.scheme}://{parts.netloc}"
+        key = page_key(url)
+        entry = {
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() in KEPT_HEADERS},
+            'file': None,
+        }
+        if content:
+            os.makedirs(os.path.join(self.root, 'bodies'), exist_ok=True)
+            entry['file'] = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.html'
+            with open(os.path.join(self.root, 'bodies', entry['file']), 'wb') as f:
+                f.write(content)
+        self.pages[key] = entry
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        atomic_write_json(self.index_path, {'origin': self.origin, 'pages': self.pages})
+
+
+_recorder = FixtureCorpus(RECORD_DIR) if RECORD_DIR else None
+if _recorder is not None:
+    atexit.register(_recorder.save)
+
+
+def record(url, response):
+    """Kayıt modu açıksa yanıtı derleme ekler."""
+    if _recorder is None:
+        return
+    _recorder.add(url, response.status_code, dict(response.headers), response.content)
@@ -0,0 +1,87 @@
+import os
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from metrics import timer
+
+# --- HTML AYRIŞTIRICI SEÇİMİ ---
+# HTML_PARSER ortam değişkeni ile seçilir: 'html.parser' (varsayılan, saf Python)
+# veya 'lxml' (C tabanlı, çok daha hızlı). Tüm çıkarıcılar BeautifulSoup API'si
+# üzerinden çalıştığı için iki arka uçta da aynı sözlükleri üretir.
+BACKENDS = ('html.parser', 'lxml')
+DEFAULT_BACKEND = 'html.parser'
+
+_backend = os.environ.get('HTML_PARSER', DEFAULT_BACKEND)
+pages_parsed = 0
+
+
+def get_backend():
+    return _backend
+
+
+def set_backend(name):
+    """Arka ucu değiştirir. Kurulu değilse varsayılana döner ve uyarır."""
+    global _backend
+    if name not in BACKENDS:
+        print(f"   ⚠️ Bilinmeyen HTML ayrıştırıcı '{name}', {DEFAULT_BACKEND} kullanılıyor.", flush=True)
+        name = DEFAULT_BACKEND
+    elif name != DEFAULT_BACKEND:
+        try:
+            BeautifulSoup("", name)
+        except FeatureNotFound:
+            print(f"   ⚠️ '{name}' kurulu değil, {DEFAULT_BACKEND} kullanılıyor.", flush=True)
+            name = DEFAULT_BACKEND
+    _backend = name
+    return name
+
+
+def count_parsed(n=1):
+    """Başka süreçte (parse_pool) ayrıştırılan sayfaları sayaca ekler."""
+    global pages_parsed
+    pages_parsed += n
+
+
+def make_soup(content, backend=None, parse_only=None):
+    global pages_parsed
+    pages_parsed += 1
+    with timer('parse'):
+        return BeautifulSoup(content, backend or _backend, parse_only=parse_only)
+
+
+def parse_partial(page, name, class_):
+    """Sayfanın yalnızca <name class=class_> öğelerini (alt ağaçlarıyla) ayrıştırır.
+
+    Liste sayfasında kartlar dışındaki menü, altbilgi, betikler ağaca hiç girmez.
+    Ağaç zaten ayrıştırılmışsa (ya da sayfa düz bir soup ise) olduğu gibi döner.
+    """
+    if isinstance(page, LazySoup) and page._soup is None:
+        return make_soup(page.content, parse_only=SoupStrainer(name, class_=class_))
+    return page
+
+
+set_backend(_backend)
+
+
+class LazySoup:
+    """200 yanıtının gövdesi; ağaç ancak ilk kullanımda ayrıştırılır.
+
+    BeautifulSoup nesnesinin yerine geçer (soup.find_all, soup.descendants ...).
+    not_modified=True ise gövde HTTP önbelleğinden gelmiştir (taze kayıt veya 304).
+    """
+
+    __slots__ = ('url', 'content', 'not_modified', '_soup')
+
+    def __init__(self, url, content, not_modified=False):
+        self.url = url
+        self.content = content
+        self.not_modified = not_modified
+        self._soup = None
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            self._soup = make_soup(self.content)
+        return self._soup
+
+    def __getattr__(self, name):
+        return getattr(self.soup, name)
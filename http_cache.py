@@ -0,0 +1,259 @@
+import atexit
+import copy
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+
+import fixtures
+from html_backend import LazySoup
+from journal import atomic_write_json
+from metrics import metrics
+
+# --- DİSK ÜZERİNDE HTTP ÖNBELLEĞİ ---
+# Gövde, ETag ve Last-Modified URL bazında saklanır. TTL içindeki sayfalar hiç
+# istenmez; TTL dolmuşsa If-None-Match / If-Modified-Since ile sorulur ve 304
+# gelirse ne indirme ne de yeniden ayrıştırma yapılır (çıkarım sonucu da
+# önbellekten döner). Toplam boyut sınırı aşılınca en az kullanılan silinir.
+CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', '.http_cache')
+# Kayıt modunda önbellek kapalıdır; her yanıt gerçekten ağdan gelmeli
+CACHE_ENABLED = os.environ.get('HTTP_CACHE', '1') != '0' and not fixtures.RECORD_DIR
+MAX_BYTES = int(float(os.environ.get('HTTP_CACHE_MAX_MB', '200')) * 1024 * 1024)
+
+HOUR = 3600
+DAY = 24 * HOUR
+TTL = {
+    'listing': 30 * 60,          # liste sayfaları her çalışmada yeniden sorulur
+    'series': HOUR,
+    'season': HOUR,
+    'finished_series': 14 * DAY,  # bitmiş diziler nadiren değişir
+    'episode': 30 * DAY,          # bölüm sayfası / video kaynağı
+    'movie': 7 * DAY,
+}
+
+
+def url_class(url):
+    path = url.split('://', 1)[-1].split('?')[0]
+    path = path[path.find('/'):] if '/' in path else '/'
+    if '/page/' in path or path.rstrip('/') in ('', '/diziler', '/filmler'):
+        return 'listing'
+    if '/bolum/' in path or ('sezon' in path and 'bolum' in path):
+        return 'episode'
+    if 'sezon' in path:
+        return 'season'
+    if '/dizi/' in path:
+        return 'series'
+    return 'movie'
+
+
+class HttpCache:
+    def __init__(self, root, max_bytes=MAX_BYTES, ttl=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = dict(TTL, **(ttl or {}))
+        self.index_path = os.path.join(root, 'index.json')
+        self.entries = {}
+        self.finished = set()
+        self._dirty = False
+        self._loaded_at = time.time()
+        self._load()
+
+    def _load(self):
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except Exception:
+                self.entries = {}
+
+    def save(self):
+        if self._dirty:
+            os.makedirs(self.root, exist_ok=True)
+            atomic_write_json(self.index_path, self.entries, indent=None)
+            self._dirty = False
+            self._sweep()
+
+    def _sweep(self):
+        """Çalışma yarıda kesildiyse indekste olmayan gövde dosyaları kalabilir; indeks yazıldıktan
+        sonra, yalnızca ana süreçte ve bu süreç başlamadan önce yazılmış olanlar silinir
+        (aynı klasörü kullanan başka bir sürecin yeni gövdelerine dokunulmaz)."""
+        if multiprocessing.parent_process() is not None:
+            return
+        known = {e['file'] for e in self.entries.values()}
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            try:
+                if name.endswith('.body') and name not in known and os.path.getmtime(path) < self._loaded_at:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    # --- Okuma ---
+    def mark_finished(self, url):
+        """Bitmiş dizinin sayfasını uzun TTL sınıfına alır (bkz. refresh_scheduler.mark_finished_series)."""
+        self.finished.add(url)
+
+    def mark_active(self, url):
+        """Liste kartı değişen (yeni bölüm / sezon gelmiş olabilir) dizi normal TTL'e döner."""
+        self.finished.discard(url)
+
+    def ttl_for(self, url):
+        if url in self.finished:
+            return self.ttl['finished_series']
+        return self.ttl[url_class(url)]
+
+    def _body(self, entry):
+        try:
+            with open(os.path.join(self.root, entry['file']), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _touch(self, entry):
+        entry['last_used'] = time.time()
+        self._dirty = True
+
+    def fresh_page(self, url):
+        """TTL içindeki kayıt varsa isteğe gerek kalmadan sayfayı döner."""
+        entry = self.entries.get(url)
+        if not entry or time.time() - entry['stored_at'] > self.ttl_for(url):
+            return None
+        body = self._body(entry)
+        if body is None:
+            return None
+        self._touch(entry)
+        metrics.count('cache_fresh')
+        return LazySoup(url, body, not_modified=True)
+
+    def conditional_headers(self, url, headers):
+        entry = self.entries.get(url)
+        if not entry:
+            return headers
+        headers = dict(headers)
+        if entry.get('etag'): headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'): headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def request(self, url, headers, send):
+        """send(headers) -> yanıt. Koşullu istek atar, yanıtı to_page ile sayfaya çevirir."""
+        response = send(self.conditional_headers(url, headers))
+        if self._lost_body(url, response):
+            response = send(headers)
+        return self.to_page(url, response)
+
+    async def request_async(self, url, headers, send):
+        """request'in eşzamansız hali (send bir coroutine döner)."""
+        response = await send(self.conditional_headers(url, headers))
+        if self._lost_body(url, response):
+            response = await send(headers)
+        return self.to_page(url, response)
+
+    def _lost_body(self, url, response):
+        """304 geldi ama gövde dosyası yok: kayıt silinir, istek koşulsuz tekrarlanmalı.
+        Aksi halde her istek aynı koşullu başlıklarla yine 304 alır ve sayfa hiç gelmez."""
+        entry = self.entries.get(url)
+        if response.status_code != 304 or entry is None or self._body(entry) is not None:
+            return False
+        metrics.response(response)
+        metrics.count('cache_lost_body')
+        del self.entries[url]
+        self._dirty = True
+        return True
+
+    # --- Yazma ---
+    def to_page(self, url, response):
+        """Yanıtı get_soup_fast sözleşmesine çevirir: sayfa / "404" / "403" / None."""
+        fixtures.record(url, response)
+        metrics.response(response)
+        status = response.status_code
+        if status == 304 and url in self.entries:
+            entry = self.entries[url]
+            body = self._body(entry)
+            if body is not None:
+                entry['stored_at'] = time.time()
+                self._touch(entry)
+                metrics.count('cache_304')
+                return LazySoup(url, body, not_modified=True)
+        if status == 200:
+            self._put(url, response.content, response.headers)
+            return LazySoup(url, response.content)
+        elif status == 404: return "404"
+        elif status == 403: return "403"
+        return None
+
+    def _put(self, url, content, headers):
+        os.makedirs(self.root, exist_ok=True)
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest() + '.body'
+        with open(os.path.join(self.root, name), 'wb') as f:
+            f.write(content)
+        self.entries[url] = {
+            'file': name,
+            'etag': headers.get('ETag') or headers.get('etag'),
+            'last_modified': headers.get('Last-Modified') or headers.get('last-modified'),
+            'stored_at': time.time(),
+            'last_used': time.time(),
+            'size': len(content),
+            'extracted': {},  # gövde değişti, eski çıkarımlar geçersiz
+        }
+        self._dirty = True
+        self._evict()
+
+    def _evict(self):
+        total = sum(e['size'] for e in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self.entries.items(), key=lambda kv: kv[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.root, entry['file']))
+            except OSError:
+                pass
+            total -= entry['size']
+            del self.entries[url]
+
+    # --- Çıkarım sonuçları ---
+    def get_extraction(self, url, kind):
+        entry = self.entries.get(url)
+        if entry and kind in entry.get('extracted', {}):
+            return copy.deepcopy(entry['extracted'][kind])
+        return None
+
+    def put_extraction(self, url, kind, result):
+        entry = self.entries.get(url)
+        if entry is not None:
+            entry.setdefault('extracted', {})[kind] = copy.deepcopy(result)
+            self._dirty = True
+
+
+class _NoCache(HttpCache):
+    """HTTP_CACHE=0 iken kullanılan, hiçbir şey saklamayan önbellek."""
+
+    def __init__(self):
+        self.entries = {}
+        self.finished = set()
+
+    def save(self): pass
+    def fresh_page(self, url): return None
+    def conditional_headers(self, url, headers): return headers
+    def _put(self, url, content, headers): pass
+    def put_extraction(self, url, kind, result): pass
+
+
+cache = HttpCache(CACHE_DIR) if CACHE_ENABLED else _NoCache()
+atexit.register(cache.save)
+
+
+def cached_extract(page, kind, extractor):
+    """Sayfa değişmediyse (taze / 304) önceki çıkarım sonucunu döner, yoksa extractor(page) çalışır."""
+    if not isinstance(page, LazySoup):
+        return extractor(page)
+    if page.not_modified:
+        hit = cache.get_extraction(page.url, kind)
+        if hit is not None:
+            metrics.count('extract_cache_hit')
+            return hit
+    result = extractor(page)
+    cache.put_extraction(page.url, kind, result)
+    return result
@@ -0,0 +1,109 @@
+import json
+import os
+
+from metrics import metrics
+
+# --- YAZMA ÖNCESİ GÜNLÜK (WAL) ---
+# Her güncelleme tek satırlık JSON olarak sona eklenir ve fsync edilir.
+# Kanonik JSON dosyası sadece sıkıştırma (compaction) sırasında, geçici dosyaya
+# yazılıp atomik rename ile değiştirilir; yarıda kesilen bir iş asla yarım
+# katalog bırakmaz.
+
+
+class Journal:
+    """Sadece sona eklenen JSONL günlüğü. Her kayıt diske fsync edilir."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = None
+
+    def _open(self):
+        if self._fh is None:
+            self._fh = open(self.path, 'a', encoding='utf-8')
+        return self._fh
+
+    def append(self, entry):
+        fh = self._open()
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with metrics.timer('journal_append'):
+            fh.write(line)
+            fh.flush()
+            os.fsync(fh.fileno())
+        metrics.written(len(line))
+
+    def replay(self):
+        """Günlükteki kayıtları sırayla döner. Yarım kalmış son satır atlanır."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # İş öldürülürken yazılan yarım satır
+                    break
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def clear(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            _fsync_dir(self.path)
+
+
+def atomic_write_json(path, data, indent=2):
+    """JSON'u aynı klasördeki geçici dosyaya yazar, fsync eder ve os.replace ile yerine koyar."""
+    _atomic_write(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=indent))
+
+
+def atomic_write_text(path, text):
+    """Hazır metni atomic_write_json ile aynı şekilde (geçici dosya + fsync + rename) yazar."""
+    _atomic_write(path, lambda f: f.write(text))
+
+
+def atomic_write_lines(path, lines):
+    """Satırları (tek tek üretilebilir) aynı atomik yolla yazar; metnin tamamı bellekte kurulmaz."""
+    def write(f):
+        for line in lines:
+            f.write(line)
+            f.write('\n')
+    _atomic_write(path, write)
+
+
+def _atomic_write(path, write):
+    tmp_path = f"{path}.tmp"
+    with metrics.timer('json_write'):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, path)
+        _fsync_dir(path)
+    metrics.written(size)
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
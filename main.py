@@ -1,21 +1,57 @@
-from seleniumbase import SB
 from curl_cffi import requests
-from bs4 import BeautifulSoup
-import json
+import argparse
 import time
 import os
-import random
-from urllib.parse import urljoin
+from catalog_store import CatalogStore
+from catalog_export import export_catalog
+from delta_feed import DeltaFeed
+from http_cache import cache as http_cache, cached_extract
+from extractors import extract_movie_cards, extract_movie_details
+from fetch_pipeline import MAX_IN_FLIGHT, fetch_extracted
+from html_backend import parse_partial
+from checkpoint import Checkpoint
+from metrics import metrics, timed
+from refresh_scheduler import RefreshBudget
+from request_scheduler import scheduler
+import shard as sharding
+from mirrors import follow_domain
 
 # --- AYARLAR ---
-BASE_DOMAIN = "https://dizipal.cx"
-DATA_FILE = 'movies.json'
+BASE_DOMAIN = os.environ.get('BASE_DOMAIN', "https://dizipal.cx")
+# Yerel tekrar oynatma sunucusuna karşı çalışırken tarayıcı açılmaz
+SKIP_BROWSER = os.environ.get('SKIP_BROWSER') == '1'
+# Tarayıcı varsayılan olarak ilk 403'te açılır; 1 ise eskisi gibi ilk istekten önce
+EAGER_BROWSER = os.environ.get('EAGER_BROWSER') == '1'
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+DATA_FILE = 'movies.jsonl'
+# Eski girintili JSON; varsa ilk çalışmada DATA_FILE'a taşınır (bkz. catalog_format)
+LEGACY_DATA_FILE = 'movies.json'
+CHECKPOINT_FILE = 'movies.checkpoint.json'
+REPORT_FILE = 'movies.run_report.json'
 CHECK_LIMIT = 50  # Limit artırıldı: Her ihtimale karşı daha geriye baksın
 
+# --- İKİ AŞAMALI MOD ---
+# 'detail' (varsayılan): her yeni film için detay sayfası liste taramasında açılır.
+# 'two-phase': 1. aşama yalnızca liste sayfalarını tarar, kartlardaki başlık / URL /
+#   posterle taslak kayıt ekler ve kataloğu hemen yazar; 2. aşama taslakların detay
+#   alanlarını (videoUrl, cast, platform ...) öncelik sırasıyla ENRICH_BUDGET istek
+#   bütçesi dahilinde doldurur. Bütçeye sığmayanlar sonraki çalışmaya kalır.
+# 'discover' / 'enrich': aşamalardan yalnızca biri.
+MODES = ('detail', 'two-phase', 'discover', 'enrich')
+MOVIE_MODE = os.environ.get('MOVIE_MODE', 'detail')
+ENRICH_BUDGET = int(os.environ.get('ENRICH_BUDGET', '300'))  # detay isteği / çalışma
+# Taslağın kuyruk sırası için iç alanlar; detaylar gelince kayıttan çıkarılır
+STUB_FIELDS = ('discovered_at', 'listing_pos')
+
 # Global Session
 session = requests.Session()
 
+@timed('browser')
 def get_cookies_and_ua_with_selenium():
+    if SKIP_BROWSER:
+        return {'skip_browser': '1'}, DEFAULT_USER_AGENT
+    # seleniumbase ağır bir içe aktarma; yalnızca tarayıcı gerçekten gerektiğinde yüklenir
+    from seleniumbase import SB
     print("🔓 Selenium ile Cloudflare kilidi açılıyor...", flush=True)
     cookies = {}
     user_agent = ""
@@ -32,97 +68,132 @@ def get_cookies_and_ua_with_selenium():
             print(f"   ❌ Selenium hatası: {e}", flush=True)
     return cookies, user_agent
 
+def initial_session():
+    """İlk istekler için çerez + User-Agent. Tarayıcı (EAGER_BROWSER değilse) ilk 403'e bırakılır."""
+    if not EAGER_BROWSER:
+        print("⚡ Tarayıcısız başlanıyor; 403 gelirse Selenium açılacak.", flush=True)
+        return {}, DEFAULT_USER_AGENT
+    cookies, user_agent = get_cookies_and_ua_with_selenium()
+    return (cookies, user_agent) if cookies else (None, None)
+
+@timed('get_soup_fast')
 def get_soup_fast(url, cookies, user_agent):
+    cached = http_cache.fresh_page(url)
+    if cached is not None: return cached
     headers = {'User-Agent': user_agent, 'Referer': BASE_DOMAIN}
     try:
-        response = session.get(url, cookies=cookies, headers=headers, impersonate="chrome110", timeout=15)
-        if response.status_code == 200: return BeautifulSoup(response.content, 'html.parser')
-        elif response.status_code == 404: return "404"
-        elif response.status_code == 403: return "403"
-    except: pass
+        return http_cache.request(url, headers, lambda h: scheduler.get(
+            session, url, cookies=cookies, headers=h, impersonate="chrome110", timeout=15))
+    except: metrics.count('http_errors')
     return None
 
-def get_video_source(soup):
-    try:
-        player_area = soup.find('div', class_='video-player-area')
-        if player_area and player_area.find('iframe'): return player_area.find('iframe').get('src')
-        iframes = soup.find_all('iframe')
-        for frame in iframes:
-            if 'embed' in frame.get('src', '') or 'player' in frame.get('src', ''): return frame['src']
-    except: pass
-    return ""
-
+@timed('get_full_movie_details')
 def get_full_movie_details(url, cookies, user_agent):
     soup = get_soup_fast(url, cookies, user_agent)
     if soup == "403": return "403"
-    
-    details = {
-        "url": url, "videoUrl": "", "description": "Açıklama yok.", 
-        "imdb": "0.0", "genres": [], "cast": [], "year": "",
-        "poster": "", "cover_image": "", "platform": "Platform Dışı", "added_date": ""
-    }
-    
     if not soup or soup == "404": return None
 
-    try:
-        # Görseller
-        poster_div = soup.find('div', class_='poster')
-        if poster_div and poster_div.find('img'): details['poster'] = poster_div.find('img').get('src')
-        
-        head_div = soup.find('div', id='head')
-        if head_div and "url('" in head_div.get('style', ''):
-            details['cover_image'] = head_div['style'].split("url('")[1].split("')")[0]
-
-        # Video
-        details["videoUrl"] = get_video_source(soup)
+    return cached_extract(soup, 'movie', lambda page: extract_movie_details(page, url))
 
-        # Yeni Alanlar
-        platform_link = soup.find('a', href=lambda x: x and '/platform/' in x)
-        if platform_link: details['platform'] = platform_link.get_text(strip=True)
-            
-        upload_icon = soup.find('img', src=lambda x: x and 'Upload.svg' in x)
-        if upload_icon: details['added_date'] = upload_icon.parent.get_text(strip=True)
+def needs_details(existing_data):
+    """Film sayfası açılmalı mı? (yeni film ya da platform bilgisi eksik)"""
+    return existing_data is None or 'platform' not in existing_data
 
-        calendar_icon = soup.find('img', src=lambda x: x and 'Calendar.svg' in x)
-        if calendar_icon: details['year'] = calendar_icon.parent.get_text(strip=True)
+def stub_record(card, discovered_at, listing_pos):
+    """Liste kartından taslak kayıt (detay alanları yok; needs_details True kalır)."""
+    return {**card, 'discovered_at': discovered_at, 'listing_pos': listing_pos}
 
-        # Açıklama
-        summ = soup.find('p', class_='summary-text')
-        if summ: details["description"] = summ.get_text(strip=True)
+def enrichment_queue(store, shard=None):
+    """Detayı eksik filmler: en son keşfedilenler, liste sırasıyla önce; eski eksik kayıtlar sonda."""
+    stubs = [r for r in store if needs_details(r) and not (shard and not shard.owns(r.url))]
+    stubs.sort(key=lambda r: (-r.get('discovered_at', 0), r.get('listing_pos', float('inf')), r.url))
+    return [r.url for r in stubs]
 
-        # Diğer Bilgiler
-        info_boxes = soup.find_all('div', class_=lambda x: x and 'bg-white/[4%]' in x)
-        for box in info_boxes:
-            txt = box.get_text()
-            if "IMDB" in txt: details["imdb"] = box.find_next('div').get_text(strip=True)
-            elif "Tür" in txt: details["genres"] = [a.get_text(strip=True) for a in box.find_all('a')]
-            elif "Oyuncular" in txt: details["cast"] = [a.get_text(strip=True) for a in box.find_all('a')]
-            elif "Yapım Yılı" in txt and not details["year"]: details["year"] = box.find_next('div').get_text(strip=True)
+def enrich_stubs(store, cookies, user_agent, shard=None, budget=ENRICH_BUDGET):
+    """2. aşama: taslakların detay sayfalarını bütçe dahilinde, eşzamanlı gruplar halinde çeker."""
+    queue = enrichment_queue(store, shard)
+    if not queue:
+        return cookies, user_agent
+    print(f"\n--- 🧩 Detay Doldurma: {len(queue)} taslak film, bütçe {budget} istek ---", flush=True)
+    spent = RefreshBudget(budget, lambda: sum(metrics.status.values()))
+    filled = 0
+    while queue:
+        batch = []
+        while queue and len(batch) < MAX_IN_FLIGHT * 4 and spent.spent + len(batch) < budget:
+            batch.append(queue.pop(0))
+        if not batch:
+            break
+        for movie_url, meta in zip(batch, fetch_extracted(batch, 'movie', cookies, user_agent, BASE_DOMAIN)):
+            if meta is None or meta == "403":
+                meta = get_full_movie_details(movie_url, cookies, user_agent)
+            if meta == "403":
+                print("      🚨 Çerez patladı, yenileniyor...", flush=True)
+                cookies, user_agent = get_cookies_and_ua_with_selenium()
+                meta = get_full_movie_details(movie_url, cookies, user_agent)
+            if not meta or meta in ("403", "404"):
+                print(f"      ❌ Veri Çekilemedi: {movie_url}", flush=True)
+                continue
+            stub = store.get(movie_url).materialize()
+            meta['title'] = stub.get('title', '')
+            meta['poster'] = meta.get('poster') or stub.get('poster', '')
+            extra = {k: v for k, v in stub.items() if k not in meta and k not in STUB_FIELDS and k != 'hash'}
+            store.upsert({**extra, **meta})
+            filled += 1
+            print(f"      ✅ DOLDURULDU: {meta['title']} | {meta.get('platform', '-')}", flush=True)
+        store.checkpoint()
+    metrics.count('movies_enriched', filled)
+    print(f"🧩 Detay doldurma: {filled} film dolduruldu, {len(queue)} taslak sonraki çalışmaya kaldı "
+          f"({spent.spent} istek).", flush=True)
+    return cookies, user_agent
 
-    except: pass
-    return details
+def save_outputs(store, feed, shard):
+    """Kataloğu yazar; parçasız çalışmada ön yüz çıktısını ve değişiklik akışını da."""
+    store.compact()
+    if shard:
+        shard.finish(store, 'movies', BASE_DOMAIN)
+    else:
+        export_catalog(store.materialized(), DATA_FILE, 'movies')
+        feed.publish(store)
 
-def main():
+def main(resume=False, shard=None, mode=None):
     print("🛡️ Güneş TV: Detaylı Tarama Modu (Geveze Mod)...", flush=True)
+    mode = mode or MOVIE_MODE
+    if mode not in MODES:
+        print(f"   ⚠️ Bilinmeyen mod '{mode}', 'detail' kullanılıyor.", flush=True)
+        mode = 'detail'
+    discover_only = mode in ('two-phase', 'discover')
+    shard = sharding.from_env(shard)
+    output = shard.path if shard else (lambda path: path)
+    metrics.begin_run('movies', output(REPORT_FILE))
 
-    cookies, user_agent = get_cookies_and_ua_with_selenium()
-    if not cookies: return
+    cookies, user_agent = initial_session()
+    if cookies is None: return
 
-    all_films = []
-    url_map = {}
+    if shard:
+        # Ana katalog salt okunur; çıktı parça dosyasına (birleştirme: merge_shards.py)
+        print(f"🧩 Parça: {shard} -> {shard.path(DATA_FILE)}", flush=True)
+        feed = None
+        store = CatalogStore(shard.path(DATA_FILE), base_path=DATA_FILE, legacy_path=LEGACY_DATA_FILE).load()
+    else:
+        feed = DeltaFeed(DATA_FILE, 'movies')
+        store = CatalogStore(DATA_FILE, legacy_path=LEGACY_DATA_FILE, feed=feed).load()
+    # Alan adı değiştiyse kayıtlı URL'ler yeni adrese taşınır; filmler yeni sanılıp yeniden çekilmez
+    follow_domain(store, BASE_DOMAIN)
+    if len(store):
+        print(f"📦 Veritabanı Yüklendi: {len(store)} film mevcut.", flush=True)
 
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                all_films = json.load(f)
-            url_map = {movie.get('url'): i for i, movie in enumerate(all_films)}
-            print(f"📦 Veritabanı Yüklendi: {len(all_films)} film mevcut.", flush=True)
-        except: pass
-
-    page_num = 1
+    page_num = shard.first_page if shard else 1
     consecutive_skip_count = 0 
+    discovered_at = int(time.time())
 
-    while True:
+    progress = Checkpoint(output(CHECKPOINT_FILE))
+    if resume and progress.load():
+        page_num = progress.page
+        consecutive_skip_count = progress.extra.get('skip_count', 0)
+    else:
+        progress.clear()
+
+    while mode != 'enrich' and (not shard or shard.has_page(page_num)):
         target_url = f"{BASE_DOMAIN}/filmler/page/{page_num}/"
         print(f"\n--- 📄 SAYFA {page_num} Taranıyor... ---", flush=True)
         
@@ -137,19 +208,27 @@ def main():
             print("🏁 Sayfa bulunamadı veya bitti.", flush=True)
             break
 
-        items = soup.find_all('div', class_='post-item')
-        if not items:
+        # Liste sayfasında yalnızca film kartları ayrıştırılır
+        cards = extract_movie_cards(parse_partial(soup, 'div', 'post-item'))
+        if not cards:
             print("⚠️ Bu sayfada hiç film kutusu bulunamadı!", flush=True)
             break
         
-        print(f"   🔍 Bu sayfada {len(items)} adet film bulundu.", flush=True)
+        print(f"   🔍 Bu sayfada {len(cards)} adet film bulundu.", flush=True)
+        page_urls = [card['url'] for card in cards]
+        if shard:
+            page_urls = [u for u in page_urls if shard.owns(u)]
+        progress.start_page(page_num, page_urls)
 
-        for item in items:
-            link = item.find('a')
-            if not link: continue
-            
-            title = link.get('title', '').strip()
-            movie_url = link.get('href', '')
+        # Açılacak film sayfaları önden eşzamanlı çekilir, ayrıştırma parse_pool işçilerinde
+        to_fetch = [] if discover_only else [u for u in page_urls if not progress.is_done(u) and needs_details(store.get(u))]
+        prefetched = dict(zip(to_fetch, fetch_extracted(to_fetch, 'movie', cookies, user_agent, BASE_DOMAIN)))
+
+        limit_reached = False
+        for pos, card in enumerate(cards):
+            title = card['title']
+            movie_url = card['url']
+            if progress.is_done(movie_url) or (shard and not shard.owns(movie_url)): continue
             
             # --- ANLIK GERİ BİLDİRİM BURADA ---
             print(f"   👀 Gözlenen: {title}", flush=True)
@@ -157,9 +236,19 @@ def main():
             should_process = True
             is_update = False
             
-            if movie_url in url_map:
-                existing_index = url_map[movie_url]
-                existing_data = all_films[existing_index]
+            existing_data = store.get(movie_url)
+            if discover_only:
+                # 1. aşama: yeni film taslak olarak hemen eklenir, detaylar 2. aşamada
+                should_process = False
+                if existing_data is None:
+                    print("      🆕 Durum: YENİ FİLM! -> TASLAK EKLENDİ", flush=True)
+                    store.upsert(stub_record(card, discovered_at, (page_num - 1) * 1000 + pos))
+                    store.checkpoint()
+                    consecutive_skip_count = 0
+                else:
+                    print("      ⏭️ Durum: Listede mevcut -> ATLANIYOR", flush=True)
+                    consecutive_skip_count += 1
+            elif existing_data is not None:
                 
                 # Platform verisi yoksa GÜNCELLE
                 if 'platform' not in existing_data or existing_data['platform'] == "Platform Dışı":
@@ -167,30 +256,34 @@ def main():
                     # Eğer son kontrolde de 'Platform Dışı' dediysek ve yeni değilse atlayabiliriz
                     # Ama kullanıcının isteği üzerine, eksik hissettiğimiz her şeye bakalım.
                     if 'platform' not in existing_data:
-                        print(f"      ♻️ Durum: Listede var ama verileri eksik -> GÜNCELLENECEK", flush=True)
+                        print("      ♻️ Durum: Listede var ama verileri eksik -> GÜNCELLENECEK", flush=True)
                         is_update = True
                         consecutive_skip_count = 0
                     else:
                         # Veriler tam görünüyor
-                        print(f"      ⏭️ Durum: Listede mevcut ve tam -> ATLANIYOR", flush=True)
+                        print("      ⏭️ Durum: Listede mevcut ve tam -> ATLANIYOR", flush=True)
                         consecutive_skip_count += 1
                         should_process = False
                 else:
-                    print(f"      ⏭️ Durum: Listede mevcut ve tam -> ATLANIYOR", flush=True)
+                    print("      ⏭️ Durum: Listede mevcut ve tam -> ATLANIYOR", flush=True)
                     consecutive_skip_count += 1
                     should_process = False
             else:
-                print(f"      🆕 Durum: YENİ FİLM! -> EKLENECEK", flush=True)
+                print("      🆕 Durum: YENİ FİLM! -> EKLENECEK", flush=True)
                 consecutive_skip_count = 0
 
             # Limit Kontrolü
             if consecutive_skip_count >= CHECK_LIMIT:
                 print(f"\n🛑 {CHECK_LIMIT} film üst üste 'Mevcut' olarak geçildi. Tarama bitiriliyor.")
-                return
+                limit_reached = True
+                break
 
             if should_process:
-                print(f"      ⏳ Veriler çekiliyor...", flush=True)
-                meta = get_full_movie_details(movie_url, cookies, user_agent)
+                print("      ⏳ Veriler çekiliyor...", flush=True)
+                meta = prefetched.get(movie_url)
+                if meta == "404": meta = None
+                elif meta is None or meta == "403":
+                    meta = get_full_movie_details(movie_url, cookies, user_agent)
                 
                 if meta == "403":
                     print("      🚨 Çerez patladı, yenileniyor...", flush=True)
@@ -200,21 +293,39 @@ def main():
                 if meta and meta != "403":
                     meta['title'] = title
                     
-                    if is_update:
-                        idx = url_map[movie_url]
-                        all_films[idx] = meta 
+                    status = store.upsert(meta)
+                    if status == 'unchanged':
+                        print(f"      💤 DEĞİŞİKLİK YOK: {title}", flush=True)
+                    elif is_update:
                         print(f"      ✅ GÜNCELLENDİ: {title} | {meta.get('platform', '-')}", flush=True)
                     else:
-                        all_films.append(meta)
-                        url_map[movie_url] = len(all_films) - 1
                         print(f"      ✅ EKLENDİ: {title} | {meta.get('platform', '-')}", flush=True)
 
-                    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(all_films, f, ensure_ascii=False, indent=2)
+                    store.checkpoint()
                 else:
-                    print(f"      ❌ Veri Çekilemedi!", flush=True)
+                    print("      ❌ Veri Çekilemedi!", flush=True)
+
+            progress.extra['skip_count'] = consecutive_skip_count
+            progress.mark_done(movie_url)
 
+        if limit_reached:
+            break
         page_num += 1
 
+    if mode == 'two-phase':
+        # Taslaklar detay doldurma bitmeden yayınlanır; doldurma yarıda kesilse de katalog günceldir
+        save_outputs(store, feed, shard)
+        progress.clear()
+    if mode in ('two-phase', 'enrich'):
+        cookies, user_agent = enrich_stubs(store, cookies, user_agent, shard)
+
+    save_outputs(store, feed, shard)
+    progress.clear()
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--resume', action='store_true', help="Yarım kalan taramaya checkpoint'ten devam et")
+    parser.add_argument('--shard', help="Parça tanımı: pages:1-20 / hash:0/4 (varsayılan: SHARD ortam değişkeni)")
+    parser.add_argument('--mode', choices=MODES, help="Tarama modu (varsayılan: MOVIE_MODE ortam değişkeni / detail)")
+    args = parser.parse_args()
+    main(resume=args.resume, shard=args.shard, mode=args.mode)
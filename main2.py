@@ -1,21 +1,49 @@
-from seleniumbase import SB
 from curl_cffi import requests
-from bs4 import BeautifulSoup
-import json
+import argparse
 import time
 import os
-import random
 from urllib.parse import urljoin
+from catalog_store import CatalogStore
+from catalog_export import export_catalog
+from delta_feed import DeltaFeed
+from http_cache import cache as http_cache, cached_extract
+from extractors import extract_episode_items, extract_series_details, extract_video_source
+from fetch_pipeline import fetch_extracted
+from checkpoint import Checkpoint
+from metrics import metrics, timed
+from request_scheduler import scheduler
+from crawl_state import (CrawlState, UNCHANGED_PAGE_LIMIT, card_text, drop_failed_seasons, fingerprint,
+                         season_fingerprint, seasons_to_fetch)
+from refresh_scheduler import REFRESH_BUDGET, RefreshBudget, mark_finished_series, plan_refresh
+import shard as sharding
+from mirrors import follow_domain
 
 # --- AYARLAR ---
-BASE_DOMAIN = "https://dizipal.cx"
-DATA_FILE = 'diziler.json'
+BASE_DOMAIN = os.environ.get('BASE_DOMAIN', "https://dizipal.cx")
+# Yerel tekrar oynatma sunucusuna karşı çalışırken tarayıcı açılmaz
+SKIP_BROWSER = os.environ.get('SKIP_BROWSER') == '1'
+# Tarayıcı varsayılan olarak ilk 403'te açılır; 1 ise eskisi gibi ilk istekten önce
+EAGER_BROWSER = os.environ.get('EAGER_BROWSER') == '1'
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+DATA_FILE = 'diziler.jsonl'
+# Eski girintili JSON; varsa ilk çalışmada DATA_FILE'a taşınır (bkz. catalog_format)
+LEGACY_DATA_FILE = 'diziler.json'
+STATE_FILE = 'diziler.state.json'
+CHECKPOINT_FILE = 'diziler.checkpoint.json'
+REPORT_FILE = 'diziler.run_report.json'
+# Checkpoint'te liste sayfası yerine öncelikli yenileme aşamasını gösterir
+REFRESH_PAGE = 'refresh'
 
 # Global Session
 session = requests.Session()
 
+@timed('browser')
 def get_cookies_and_ua_with_selenium():
     """Selenium ile siteye girip Cloudflare çerezlerini ve User-Agent'ı alır."""
+    if SKIP_BROWSER:
+        return {'skip_browser': '1'}, DEFAULT_USER_AGENT
+    # seleniumbase ağır bir içe aktarma; yalnızca tarayıcı gerçekten gerektiğinde yüklenir
+    from seleniumbase import SB
     print("🔓 Selenium ile Cloudflare kilidi açılıyor (Diziler)...")
     cookies = {}
     user_agent = ""
@@ -40,88 +68,82 @@ def get_cookies_and_ua_with_selenium():
             
     return cookies, user_agent
 
+def initial_session():
+    """İlk istekler için çerez + User-Agent. Tarayıcı (EAGER_BROWSER değilse) ilk 403'e bırakılır."""
+    if not EAGER_BROWSER:
+        print("⚡ Tarayıcısız başlanıyor; 403 gelirse Selenium açılacak.", flush=True)
+        return {}, DEFAULT_USER_AGENT
+    cookies, user_agent = get_cookies_and_ua_with_selenium()
+    return (cookies, user_agent) if cookies else (None, None)
+
+@timed('get_soup_fast')
 def get_soup_fast(url, cookies, user_agent):
-    """Curl_CFFI ile hızlı istek atar."""
+    """Curl_CFFI ile hızlı istek atar. Önbellekte taze kopya varsa istek atılmaz."""
+    cached = http_cache.fresh_page(url)
+    if cached is not None:
+        return cached
+    
     headers = {
         'User-Agent': user_agent,
         'Referer': BASE_DOMAIN,
     }
     try:
-        response = session.get(
+        # Hız sınırı, zaman aşımı / 5xx tekrarları ve Retry-After zamanlayıcıda
+        # Burası kritik: 403 dönerse string olarak "403" yolluyoruz (304 -> önbellekteki sayfa)
+        return http_cache.request(url, headers, lambda h: scheduler.get(
+            session, 
             url, 
             cookies=cookies, 
-            headers=headers, 
+            headers=h, 
             impersonate="chrome110", 
             timeout=15
-        )
-        
-        if response.status_code == 200:
-            return BeautifulSoup(response.content, 'html.parser')
-        elif response.status_code == 404:
-            return "404"
-        elif response.status_code == 403:
-            # Burası kritik: 403 dönerse string olarak "403" yolluyoruz
-            return "403"
+        ))
     except Exception as e:
+        metrics.count('http_errors')
         print(f"   ⚠️ Hızlı mod hatası: {e}")
     return None
 
+@timed('get_video_source')
 def get_video_source(soup):
-    try:
-        player_area = soup.find('div', class_='video-player-area')
-        if player_area:
-            iframe = player_area.find('iframe')
-            if iframe: return iframe.get('src')
-        
-        iframes = soup.find_all('iframe')
-        for frame in iframes:
-            src = frame.get('src', '')
-            if 'embed' in src or '.cfd' in src or 'player' in src:
-                return src
-    except: pass
-    return ""
-
-def get_episodes_from_page(soup, cookies, user_agent, known_urls=[]):
-    """Bölümleri parse eder."""
-    new_episodes = []
-    episode_items = soup.find_all('div', class_='episode-item')
-    
-    for item in episode_items:
-        ep_data = {}
-        link_tag = item.find('a')
-        
-        if link_tag:
-            ep_url = link_tag.get('href')
-            title = link_tag.get('title')
-            
-            if ep_url in known_urls:
-                continue 
+    return extract_video_source(soup)
 
-            ep_data['url'] = ep_url
-            ep_data['title'] = title
-            
-            img_tag = link_tag.find('img')
-            if img_tag:
-                ep_data['thumbnail'] = img_tag.get('src')
-            
-            if ep_url:
-                ep_soup = get_soup_fast(ep_url, cookies, user_agent)
-                if ep_soup and ep_soup not in ["404", "403"]:
-                    video_src = get_video_source(ep_soup)
-                    ep_data['video_source'] = video_src
-                    print(f"      ✅ YENİ BÖLÜM: {ep_data.get('title')} -> Kaynak Alındı", flush=True)
+def parse_episode_items(soup, known_urls=frozenset()):
+    """Sezon sayfasındaki bölüm kutularını okur (ağ isteği yok). (ep_data, bölüm no) listesi döner."""
+    return extract_episode_items(soup, known_urls)
 
-        num_tag = item.find('h4', class_='font-eudoxus')
-        if num_tag:
-            ep_data['episode_number'] = num_tag.get_text(strip=True)
-        
-        if 'url' in ep_data:
-            new_episodes.append(ep_data)
+def fetch_episode_sources(candidates, cookies, user_agent):
+    """Bölüm sayfalarını eşzamanlı çekip video kaynaklarını ekler (ayrıştırma parse_pool'da). Sıra korunur.
+    Sayfası alınamayan (ağ hatası / 403) bölümler atlanır; sonraki çalışmada yeniden denenir."""
+    fetch_urls = [ep_data['url'] for ep_data, _ in candidates if ep_data['url']]
+    results = dict(zip(fetch_urls, fetch_extracted(fetch_urls, 'video', cookies, user_agent, BASE_DOMAIN)))
 
+    new_episodes = []
+    for ep_data, episode_number in candidates:
+        video_src = results.get(ep_data['url'])
+        if ep_data['url'] and (video_src is None or video_src == "403"):
+            print(f"      ⚠️ Bölüm alınamadı (sonra denenecek): {ep_data.get('title')}", flush=True)
+            continue
+        if video_src is not None and video_src not in ["404", "403"]:
+            ep_data['video_source'] = video_src
+            print(f"      ✅ YENİ BÖLÜM: {ep_data.get('title')} -> Kaynak Alındı", flush=True)
+        if episode_number is not None:
+            ep_data['episode_number'] = episode_number
+        new_episodes.append(ep_data)
     return new_episodes
 
-def get_full_series_details(url, cookies, user_agent, existing_episodes_list=[]):
-    """Dizi detaylarını çeker."""
+def get_episodes_from_page(soup, cookies, user_agent, known_urls=frozenset()):
+    """Bölümleri parse eder."""
+    return fetch_episode_sources(parse_episode_items(soup, known_urls), cookies, user_agent)
+
+@timed('get_full_series_details')
+def get_full_series_details(url, cookies, user_agent, existing_episodes_list=frozenset(), known_seasons=None):
+    """Dizi detaylarını çeker.
+
+    known_seasons (kayıttaki sezon parmak izleri) verilirse yalnızca en yeni sezon ve
+    bilinmeyen sezonlar çekilir; parmak izi aynı kalan sezonun bölümleri karşılaştırılmaz.
+    meta['seasons'] çekilen sezonların yeni parmak izlerini taşır; bölümü çekilemeyen sezonlar
+    dahil edilmez ve meta['incomplete'] True olur.
+    """
     print(f"   ▶️ Analiz: {url}")
     soup = get_soup_fast(url, cookies, user_agent)
     
@@ -133,100 +155,152 @@ def get_full_series_details(url, cookies, user_agent, existing_episodes_list=[])
     if not soup or soup == "404":
         return None
     
-    meta = {
-        "url": url,
-        "title": "",
-        "year": "",
-        "description": "",
-        "poster": "",
-        "cover_image": "",
-        "imdb": "0",
-        "genres": [],
-        "episodes": [] 
-    }
+    meta, season_links = cached_extract(soup, 'series', lambda page: extract_series_details(page, url, BASE_DOMAIN))
     
     try:
-        h1 = soup.find('h1')
-        if h1:
-            full_text = h1.get_text(" ", strip=True)
-            if '(' in full_text:
-                parts = full_text.split('(')
-                meta['title'] = parts[0].strip()
-                meta['year'] = parts[-1].replace(')', '').strip()
-            else:
-                meta['title'] = full_text
-
-        summary = soup.find('p', class_='summary-text')
-        if summary: meta['description'] = summary.get_text(strip=True)
-
-        poster_div = soup.find('div', class_='poster')
-        if poster_div and poster_div.find('img'):
-            meta['poster'] = poster_div.find('img').get('src')
-
-        head_div = soup.find('div', id='head', class_='cover-image')
-        if head_div and head_div.has_attr('style') and "url('" in head_div['style']:
-            meta['cover_image'] = head_div['style'].split("url('")[1].split("')")[0]
-
-        imdb_span = soup.find('span', string=lambda t: t and "IMDB Puanı" in t)
-        if imdb_span:
-            parent = imdb_span.find_parent('div')
-            score = parent.find('h4') if parent else None
-            if score: meta['imdb'] = score.get_text(strip=True)
-
-        genre_links = soup.find_all('a', href=lambda h: h and 'dizi-kategori' in h)
-        meta['genres'] = list(set([g.get_text(strip=True) for g in genre_links]))
-
-        # --- SEZON TARAMA ---
-        season_links = []
-        season_div = soup.find('div', id='season-options-list')
-        
-        if season_div:
-            links = season_div.find_all('a', href=True)
-            for l in links:
-                full_link = urljoin(BASE_DOMAIN, l['href'])
-                if full_link not in season_links:
-                    season_links.append(full_link)
-        
         if not season_links:
             season_links.append(url)
         
-        for s_idx, season_url in enumerate(season_links):
+        # Sezon sayfaları eşzamanlı çekilir, bölümler sezon sırasıyla toplanır
+        target_seasons = seasons_to_fetch(season_links, known_seasons)
+        other_seasons = [s for s in target_seasons if s != url]
+        fetched = dict(zip(other_seasons, fetch_extracted(other_seasons, 'episode_items', cookies, user_agent, BASE_DOMAIN)))
+        
+        candidates = []
+        season_of = {}  # aday bölüm url -> sezon url
+        meta['seasons'] = {}
+        for season_url in target_seasons:
             if season_url == url:
-                current_season_soup = soup
+                season_items = cached_extract(soup, 'episode_items', parse_episode_items)
             else:
-                current_season_soup = get_soup_fast(season_url, cookies, user_agent)
+                season_items = fetched.get(season_url)
             
-            if current_season_soup and current_season_soup not in ["404", "403"]:
-                season_episodes = get_episodes_from_page(current_season_soup, cookies, user_agent, existing_episodes_list)
-                meta['episodes'].extend(season_episodes)
+            if season_items is not None and season_items not in ["404", "403"]:
+                season_fp = season_fingerprint([ep_data['url'] or '' for ep_data, _ in season_items])
+                meta['seasons'][season_url] = season_fp
+                if known_seasons and known_seasons.get(season_url) == season_fp:
+                    continue  # Sezon değişmemiş
+                fresh = [(ep_data, num) for ep_data, num in season_items if ep_data['url'] not in existing_episodes_list]
+                candidates.extend(fresh)
+                season_of.update((ep_data['url'], season_url) for ep_data, _ in fresh)
+        
+        episodes = fetch_episode_sources(candidates, cookies, user_agent)
+        meta['episodes'].extend(episodes)
+        # Bölümü eksik kalan sezonun parmak izi yazılmaz; yoksa sonraki çalışma sezonu atlardı
+        if drop_failed_seasons(meta['seasons'], season_of, episodes):
+            meta['incomplete'] = True  # çağıran kayda yazmadan çıkarır (bkz. CrawlState.visited)
 
     except Exception as e:
         print(f"   ❌ Hata: {e}")
 
     return meta
 
-def main():
+def update_series(store, state, s_url, card_fp, cookies, user_agent):
+    """Kayıtlı diziye yeni bölümleri ekler, sezon parmak izlerini günceller. (çerez, UA) döner."""
+    existing_series = store.get(s_url)
+    known_urls = store.known_episode_urls(s_url)
+    # Tam taramada tüm sezonlar, artımlıda en yeni + değişen sezonlar
+    known_seasons = None if state.full_sweep else existing_series.get('seasons', {})
+    
+    update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls, known_seasons=known_seasons)
+    
+    # Eğer 403 döndüyse (Çerez bitti)
+    if update_data == "403":
+        print("🚨 DİZİ İÇİNDE ÇEREZ BİTTİ! Yenilenip tekrar deneniyor...")
+        cookies, user_agent = get_cookies_and_ua_with_selenium()
+        # Aynı diziyi tekrar dene
+        update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls, known_seasons=known_seasons)
+
+    count_new = 0
+    complete = not (update_data and update_data != "403" and update_data.pop('incomplete', False))
+    if update_data and update_data != "403" and update_data['episodes']:
+        count_new = store.add_episodes(s_url, update_data['episodes'])
+        print(f"   🆙 GÜNCELLENDİ: {count_new} yeni bölüm -> {existing_series.get('title')}")
+        
+        store.checkpoint()
+    
+    if update_data and update_data != "403":
+        if update_data.get('seasons'):
+            store.update_fields(s_url, {'seasons': {**existing_series.get('seasons', {}), **update_data['seasons']}})
+        state.visited(s_url, card_fp, new_episodes=count_new, complete=complete)
+    return cookies, user_agent
+
+def refresh_known_series(store, state, progress, cookies, user_agent, shard=None):
+    """Artımlı çalışmanın sonunda açılmamış dizileri puan sırasıyla, bütçe dahilinde yeniler."""
+    skip = state.visited_now
+    refresh_budget = REFRESH_BUDGET
+    if shard:
+        # Parça yalnızca kendi dizilerini, bütçenin kendi payıyla yeniler
+        skip = skip | {r.get('url') for r in store if not shard.owns(r.get('url'))}
+        refresh_budget = shard.refresh_budget(REFRESH_BUDGET)
+    mandatory, optional = plan_refresh(store, state.data['series'], skip=skip)
+    queue = mandatory + optional
+    progress.start_page(REFRESH_PAGE, queue)
+    print(f"🎯 Öncelikli yenileme: {len(mandatory)} vadesi dolmuş + bütçe {refresh_budget} istek ({len(optional)} aday)")
+    refreshed = 0
+    budget = None
+    for i, s_url in enumerate(queue):
+        if i == len(mandatory):
+            # Bütçe yalnızca puanla seçilenlere harcanır; vadesi dolanlar her zaman açılır
+            budget = RefreshBudget(refresh_budget, lambda: sum(metrics.status.values()))
+        if progress.is_done(s_url):
+            continue
+        if budget and not budget.allows(store.get(s_url)):
+            break
+        cookies, user_agent = update_series(store, state, s_url, None, cookies, user_agent)
+        refreshed += 1
+        progress.mark_done(s_url)
+    state.report['series_refreshed'] = refreshed
+    state.report['refresh_requests'] = budget.spent if budget else 0
+    return cookies, user_agent
+
+def main(full_sweep=False, resume=False, shard=None):
     print("🛡️ Güneş TV: Dizi Botu (Hata Telafili Mod)...")
+    shard = sharding.from_env(shard)
+    output = shard.path if shard else (lambda path: path)
+    metrics.begin_run('diziler', output(REPORT_FILE))
     
-    cookies, user_agent = get_cookies_and_ua_with_selenium()
-    if not cookies:
+    cookies, user_agent = initial_session()
+    if cookies is None:
         print("❌ Çerezler alınamadı.")
         return
 
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                all_series = json.load(f)
-            print(f"📦 Mevcut veri: {len(all_series)} dizi.")
-        except:
-            all_series = []
+    if shard:
+        # Ana katalog ve durum salt okunur; çıktılar parça dosyalarına (birleştirme: merge_shards.py)
+        print(f"🧩 Parça: {shard} -> {shard.path(DATA_FILE)}")
+        feed = None
+        store = CatalogStore(shard.path(DATA_FILE), base_path=DATA_FILE, legacy_path=LEGACY_DATA_FILE).load()
+        state = CrawlState(shard.path(STATE_FILE), base_path=STATE_FILE)
     else:
-        all_series = []
+        feed = DeltaFeed(DATA_FILE, 'series')
+        store = CatalogStore(DATA_FILE, legacy_path=LEGACY_DATA_FILE, feed=feed).load()
+        state = CrawlState(STATE_FILE)
+    # Alan adı değiştiyse katalog ve liste parmak izleri yeni adrese taşınır (yeniden çekme yok)
+    follow_domain(store, BASE_DOMAIN, state.data)
+    if len(store):
+        print(f"📦 Mevcut veri: {len(store)} dizi.")
+    finished = mark_finished_series(http_cache, store, state.data['series'])
+    if finished:
+        print(f"💤 {finished} dizi bitmiş görünüyor; sayfaları önbellekte uzun süre tutulacak.")
 
-    page_num = 1
+    page_num = shard.first_page if shard else 1
     empty_page_count = 0 
 
-    while True:
+    progress = Checkpoint(output(CHECKPOINT_FILE))
+    if resume and progress.load():
+        page_num = progress.page
+        full_sweep = progress.extra.get('full_sweep', full_sweep)
+    else:
+        progress.clear()
+        full_sweep = state.should_full_sweep(full_sweep)
+    progress.extra['full_sweep'] = full_sweep
+    state.begin(full_sweep)
+    print(f"🧭 Mod: {state.report['mode']}")
+
+    while page_num != REFRESH_PAGE:
+        if shard and not shard.has_page(page_num):
+            print(f"🧩 Parçanın son sayfası ({shard.last_page}) bitti.")
+            break
         target_url = f"{BASE_DOMAIN}/diziler/page/{page_num}/" if page_num > 1 else f"{BASE_DOMAIN}/diziler/"
         print(f"\n--- 📄 SAYFA {page_num}: {target_url} ---")
         
@@ -243,16 +317,17 @@ def main():
             break
         
         links = soup.find_all('a', href=True)
-        series_urls = []
+        series_cards = {}
         for link in links:
             href = link['href']
             if '/dizi/' in href and href.count('/') > 3:
                 full_url = urljoin(BASE_DOMAIN, href)
                 clean_url = full_url.split('?')[0]
-                if clean_url not in series_urls:
-                    series_urls.append(clean_url)
+                series_cards.setdefault(clean_url, []).append(card_text(link))
         
-        series_urls = list(set(series_urls))
+        series_urls = list(series_cards)
+        if page_num == 1:
+            state.seen_on_first_page(series_urls)
         
         if not series_urls:
             print("⚠️ Dizi bulunamadı.")
@@ -263,34 +338,28 @@ def main():
         
         empty_page_count = 0
         print(f"   🔍 {len(series_urls)} dizi bulundu.")
+        page_changed = False
+        progress.start_page(page_num, series_urls)
 
         for s_url in series_urls:
+            if progress.is_done(s_url) or (shard and not shard.owns(s_url)):
+                continue
             # --- YENİLENMİŞ DÖNGÜ MANTIĞI ---
             
-            existing_series = next((s for s in all_series if s['url'] == s_url), None)
+            existing_series = store.get(s_url)
+            card_fp = fingerprint(series_cards[s_url])
+            if state.card_changed(s_url, card_fp):
+                http_cache.mark_active(s_url)
+            
+            # Artımlı mod: liste kartı son çalışmadan beri aynıysa diziyi açma
+            if state.is_unchanged(s_url, card_fp, existing_series):
+                state.skip(existing_series)
+                continue
+            page_changed = True
             
             if existing_series:
                 # GÜNCELLEME MODU
-                known_urls = [ep['url'] for ep in existing_series.get('episodes', []) if 'url' in ep]
-                
-                update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls)
-                
-                # Eğer 403 döndüyse (Çerez bitti)
-                if update_data == "403":
-                    print("🚨 DİZİ İÇİNDE ÇEREZ BİTTİ! Yenilenip tekrar deneniyor...")
-                    cookies, user_agent = get_cookies_and_ua_with_selenium()
-                    # Aynı diziyi tekrar dene
-                    update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls)
-
-                if update_data and update_data != "403" and update_data['episodes']:
-                    count_new = len(update_data['episodes'])
-                    existing_series['episodes'].extend(update_data['episodes'])
-                    print(f"   🆙 GÜNCELLENDİ: {count_new} yeni bölüm -> {existing_series.get('title')}")
-                    
-                    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(all_series, f, ensure_ascii=False, indent=2)
-                else:
-                    pass # Güncel veya hata
+                cookies, user_agent = update_series(store, state, s_url, card_fp, cookies, user_agent)
             
             else:
                 # YENİ DİZİ MODU
@@ -304,15 +373,38 @@ def main():
                     new_details = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=[])
                 
                 if new_details and new_details != "403":
-                    all_series.append(new_details)
+                    complete = not new_details.pop('incomplete', False)
+                    store.upsert(new_details)
                     print(f"   ✅ YENİ DİZİ EKLENDİ: {new_details.get('title')}")
                     
-                    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(all_series, f, ensure_ascii=False, indent=2)
+                    store.checkpoint()
+                    state.visited(s_url, card_fp, complete=complete)
+
+            progress.mark_done(s_url)
 
+        state.page_done(page_num, page_changed)
+        if state.can_stop():
+            print(f"🛑 Son {UNCHANGED_PAGE_LIMIT} sayfada değişiklik yok. Liste taraması bitiriliyor.")
+            break
         page_num += 1
 
-    print(f"\n✅ TAMAMLANDI. {len(all_series)} dizi kaydedildi.")
+    if not state.full_sweep and (not shard or shard.refresh_budget(REFRESH_BUDGET)):
+        cookies, user_agent = refresh_known_series(store, state, progress, cookies, user_agent, shard)
+
+    store.compact()
+    if shard:
+        shard.finish(store, 'series', BASE_DOMAIN)
+    else:
+        export_catalog(store.materialized(), DATA_FILE, 'series')
+        feed.publish(store)
+    state.finish()
+    progress.clear()
+    print(f"\n✅ TAMAMLANDI. {len(store)} dizi kaydedildi.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--full', action='store_true', help="Tüm liste sayfalarını ve dizileri tara")
+    parser.add_argument('--resume', action='store_true', help="Yarım kalan taramaya checkpoint'ten devam et")
+    parser.add_argument('--shard', help="Parça tanımı: pages:1-20 / hash:0/4 (varsayılan: SHARD ortam değişkeni)")
+    args = parser.parse_args()
+    main(full_sweep=args.full, resume=args.resume, shard=args.shard)
@@ -0,0 +1,173 @@
+"""Parçalı taramanın (bkz. shard) çıktılarını ana kataloğa birleştirir.
+
+Parçalar bitiş zamanlarına göre (eşitlikte dosya adına göre) eskiden yeniye
+uygulanır. Parça dosyası kaydın tamamını taşır, ama bir parçadan yalnızca
+ana katalogdaki (taban) halinden farklı olan alanlar / bölümler / sezonlar
+alınır; böylece aynı diziyi açan iki parçadan birinin değiştirmediği alan
+diğerinin değişikliğini ezmez. İkisi de değiştirdiyse en yeni parça kazanır;
+bölüm listeleri birleştirilir (eski sıra korunur, yeni bölümler sona). Sonuç
+girdilerin veriliş sırasından bağımsızdır. Dizi botlarının durum dosyaları
+(crawl_state) da aynı yolla birleştirilir; ardından ön yüz çıktısı ve
+değişiklik akışı tek çalışma gibi yazılır. Birleştirilen parça dosyaları
+(--keep verilmedikçe) silinir.
+
+Kullanım:  python merge_shards.py diziler.jsonl [shards/diziler.h0of4.jsonl ...] [--kind series] [--keep]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from catalog_export import export_catalog
+from catalog_store import CatalogStore, read_compact
+from crawl_state import merge_state
+from delta_feed import DeltaFeed
+from journal import atomic_write_json
+from mirrors import follow_domain, rebase_record, rebase_state
+from shard import MANIFEST_SUFFIX, SHARD_DIR, ShardSpec, read_manifest
+
+
+def find_partials(data_file, shard_dir=SHARD_DIR):
+    """shards/<katalog>.<parça><uzantı> dosyaları."""
+    base, ext = os.path.splitext(os.path.basename(data_file))
+    return sorted(glob.glob(os.path.join(shard_dir, f"{base}.*{ext}")))
+
+
+def ordered(partials):
+    """Eskiden yeniye: (bitiş zamanı, dosya adı)."""
+    return sorted(partials, key=lambda path: (read_manifest(path).get('finished_at', 0), os.path.basename(path)))
+
+
+def changed(base, newer):
+    """newer'ın tabandan (base; yoksa hepsi) farklı anahtarları."""
+    if base is None:
+        return dict(newer)
+    return {key: value for key, value in newer.items() if base.get(key) != value}
+
+
+def merge_episodes(current, fresh):
+    """current sırası korunur, aynı URL'li bölümler fresh'tekiyle değişir, kalanlar sona eklenir."""
+    by_url = {ep.get('url'): ep for ep in fresh}
+    merged = [by_url.pop(ep.get('url'), ep) for ep in current]
+    return merged + [ep for ep in fresh if ep.get('url') in by_url]
+
+
+def merge_record(current, newer, base=None):
+    """Birleştirilmiş kayda (current) bir parçanın sürümünü (newer) uygular; base: ana katalogdaki hali."""
+    merged = {**current, **changed(base, newer)}
+    if 'episodes' in current or 'episodes' in newer:
+        base_eps = {ep.get('url'): ep for ep in (base or {}).get('episodes', [])}
+        fresh = [ep for ep in newer.get('episodes', []) if base_eps.get(ep.get('url')) != ep]
+        merged['episodes'] = merge_episodes(current.get('episodes', []), fresh)
+    if 'seasons' in current or 'seasons' in newer:
+        base_seasons = base.get('seasons') if base else None
+        merged['seasons'] = {**current.get('seasons', {}), **changed(base_seasons, newer.get('seasons', {}))}
+    return merged
+
+
+def merge_into(store, partials, base_domain=None):
+    """Parça kayıtlarını sırayla store'a uygular (base_domain verilirse oraya taşıyarak).
+    {'added', 'updated', 'unchanged'} sayıları döner."""
+    counts = {'added': 0, 'updated': 0, 'unchanged': 0}
+    bases = {}  # url -> birleştirme öncesi (taban) kayıt
+    for path in partials:
+        if not os.path.exists(path):
+            continue
+        for record in read_compact(path)[1]:
+            record = record.materialize()
+            if base_domain:
+                record = rebase_record(record, base_domain)
+            url = record['url']
+            existing = store.get(url)
+            if url not in bases:
+                bases[url] = existing.materialize() if existing is not None else None
+            if existing is not None:
+                record = merge_record(existing.materialize(), record, bases[url])
+            counts[store.upsert(record)] += 1
+    return counts
+
+
+def state_paths(data_file, partials):
+    """(ana durum dosyası, parça durum dosyaları) — parça adları manifest'lerden."""
+    state_file = f"{os.path.splitext(data_file)[0]}.state.json"
+    shards = []
+    for path in partials:
+        spec = ShardSpec.parse(read_manifest(path).get('shard'))
+        if spec:
+            shard_state = os.path.join(os.path.dirname(path), os.path.basename(spec.path(state_file)))
+            if os.path.exists(shard_state):
+                shards.append(shard_state)
+    return state_file, shards
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def legacy_path(data_file):
+    """'diziler.jsonl' -> 'diziler.json' (henüz taşınmamış eski katalog; yoksa None)."""
+    base, ext = os.path.splitext(data_file)
+    return base + '.json' if ext == '.jsonl' else None
+
+
+def merge(data_file, partials=None, kind=None, keep=False, export=True):
+    """Birleştirmenin tamamı; özet sözlüğü döner."""
+    started = time.perf_counter()
+    kind = kind or ('movies' if os.path.basename(data_file).startswith('movies') else 'series')
+    partials = ordered(partials if partials else find_partials(data_file))
+    if not partials:
+        print("🧩 Birleştirilecek parça yok.", flush=True)
+        return None
+    feed = DeltaFeed(data_file, kind) if export else None
+    store = CatalogStore(data_file, legacy_path=legacy_path(data_file), feed=feed).load()
+    # Parçalar yeni bir alan adında çalıştıysa taban da önce oraya taşınır (bkz. mirrors)
+    base_domain = read_manifest(partials[-1]).get('base_domain')
+    state_file, shard_states = state_paths(data_file, partials)
+    base_state = _read_json(state_file)
+    if base_domain:
+        follow_domain(store, base_domain, base_state)
+    counts = merge_into(store, partials, base_domain)
+    store.compact()
+
+    if shard_states:
+        states = [_read_json(p) for p in shard_states]
+        if base_domain:
+            for data in states:
+                rebase_state(data, base_domain)
+        atomic_write_json(state_file, merge_state(base_state, states), indent=None)
+    if export:
+        export_catalog(store.materialized(), data_file, kind)
+        feed.publish(store)
+    if not keep:
+        for path in partials:
+            for leftover in (path, path + MANIFEST_SUFFIX, f"{path}.journal"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+        for path in shard_states:
+            os.remove(path)
+
+    summary = {'partials': len(partials), 'records': len(store), **counts,
+               'states': len(shard_states), 'seconds': round(time.perf_counter() - started, 3)}
+    print(f"🧩 {len(partials)} parça birleştirildi -> {data_file}: +{counts['added']} yeni, "
+          f"~{counts['updated']} güncel, {counts['unchanged']} aynı ({len(store)} kayıt, "
+          f"{summary['seconds']} sn)", flush=True)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('data_file', help="Ana katalog (ör. diziler.jsonl, movies.jsonl)")
+    parser.add_argument('partials', nargs='*', help=f"Parça dosyaları (varsayılan: {SHARD_DIR}/<katalog>.*)")
+    parser.add_argument('--kind', choices=('series', 'movies'), help="Varsayılan: dosya adından")
+    parser.add_argument('--keep', action='store_true', help="Birleştirilen parça dosyalarını silme")
+    args = parser.parse_args()
+    merge(args.data_file, args.partials, args.kind, args.keep)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+import atexit
+import functools
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# --- PERFORMANS ÖLÇÜMÜ ---
+# Ağ isteği, HTML ayrıştırma, alan çıkarımı, JSON yazma ve tarayıcı açılışı
+# aşama (stage) adıyla ölçülür. Her aşama için gecikme histogramı tutulur;
+# HTTP yanıtlarının durum kodu ve bayt sayısı ayrıca sayılır. Bot main()
+# başında begin_run() çağırırsa çalışma sonunda '<katalog>.run_report.json'
+# yazılır (commit edilmez; workflow 'run-report' artifact'ı olarak yükler).
+# Aşamalar iç içe olabilir: get_full_series_details süresi, içindeki http ve
+# parse sürelerini de kapsar; eşzamanlı isteklerin süreleri toplanır.
+# Raporun 'startup' bölümü süreç başlangıcından itibaren içe aktarmaların
+# bitişini (begin_run), ilk HTTP yanıtını ve tarayıcı açılışlarını gösterir.
+
+# Histogram kova üst sınırları (ms); son kova sınırsız
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Süreç yaşı okunamazsa (Linux dışı) başlangıç olarak bu modülün yüklenişi alınır
+_IMPORTED_AT = time.time()
+
+
+def process_started():
+    """Sürecin başladığı an (epoch sn); yorumlayıcının kendi açılışı da dahil."""
+    try:
+        with open('/proc/self/stat', encoding='ascii') as f:
+            ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime', encoding='ascii') as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return _IMPORTED_AT
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, q):
+        """Kova üst sınırı olarak yaklaşık yüzdelik (ms)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                bound = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max
+                return round(min(bound, self.max), 1)
+        return round(self.max, 1)
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total_ms': round(self.total, 1),
+            'mean_ms': round(self.total / self.count, 1) if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max, 1),
+            'buckets_ms': {(f"<={b}" if i < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): n
+                           for i, (b, n) in enumerate(zip(BUCKETS_MS + (None,), self.counts)) if n},
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._registered = False
+        self.reset()
+
+    def reset(self):
+        self.started = time.time()
+        self.marks = {}
+        self.stages = {}
+        self.counters = Counter()
+        self.status = Counter()
+        self.bytes_in = 0
+        self.bytes_written = 0
+        self.notes = {}
+        self.bot = None
+        self.report_path = None
+        self.parsed_before = 0
+
+    # --- Ölçüm ---
+    def observe(self, stage, seconds):
+        hist = self.stages.get(stage)
+        if hist is None:
+            hist = self.stages[stage] = Histogram()
+        hist.add(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def timed(self, stage):
+        """Fonksiyon dekoratörü: her çağrının süresi stage altında toplanır."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def mark(self, name):
+        """Bir başlangıç aşamasının ilk gerçekleştiği anı kaydeder (sonrakiler yok sayılır)."""
+        self.marks.setdefault(name, time.time())
+
+    def response(self, response):
+        self.mark('first_response')
+        self.status[str(response.status_code)] += 1
+        self.bytes_in += len(response.content or b'')
+
+    def written(self, nbytes):
+        self.bytes_written += nbytes
+
+    def note(self, key, value):
+        """Rapora serbest bölüm ekler (ör. artımlı tarama özeti)."""
+        self.notes[key] = value
+
+    # --- Rapor ---
+    def begin_run(self, bot, report_path):
+        import html_backend
+        self.reset()
+        self.mark('imports')
+        self.bot = bot
+        self.report_path = report_path
+        self.parsed_before = html_backend.pages_parsed
+        if not self._registered:
+            atexit.register(self.finish)
+            self._registered = True
+
+    def report(self):
+        import html_backend
+        pages_parsed = html_backend.pages_parsed - self.parsed_before
+        elapsed = max(time.time() - self.started, 1e-9)
+        responses = sum(self.status.values())
+        return {
+            'bot': self.bot,
+            'started_at': int(self.started),
+            'elapsed_s': round(elapsed, 2),
+            'html_parser': html_backend.get_backend(),
+            'http': {
+                'responses': responses,
+                'status': dict(self.status),
+                'bytes_in': self.bytes_in,
+                'pages_per_s': round(responses / elapsed, 3),
+            },
+            'pages_parsed': pages_parsed,
+            'parsed_per_s': round(pages_parsed / elapsed, 3),
+            'bytes_written': self.bytes_written,
+            'counters': dict(self.counters),
+            'catalog_changes': self.catalog_changes(),
+            'startup': self.startup(),
+            'stages': {name: hist.to_dict() for name, hist in sorted(self.stages.items())},
+            **self.notes,
+        }
+
+    def catalog_changes(self):
+        """CatalogStore sayaçlarından gerçek değişiklik / no-op özeti."""
+        c = self.counters
+        return {
+            'changed': c['records_added'] + c['records_updated'] + c['episodes_added'],
+            'noop': c['records_unchanged'] + c['fields_unchanged'],
+        }
+
+    def startup(self):
+        """Süreç başlangıcından içe aktarmaların bitişine / ilk yanıta kadar geçen süre ve tarayıcı açılışları."""
+        origin = process_started()
+        browser = self.stages.get('browser')
+        out = {name + '_ms': round((at - origin) * 1000, 1) for name, at in sorted(self.marks.items())}
+        out['browser_launches'] = browser.count if browser else 0
+        out['browser_ms'] = round(browser.total, 1) if browser else 0.0
+        return out
+
+    def finish(self):
+        """Raporu yazar (begin_run çağrılmadıysa hiçbir şey yapmaz). Bir kez çalışır."""
+        if not self.report_path:
+            return None
+        from journal import atomic_write_json
+        path, self.report_path = self.report_path, None
+        data = self.report()
+        atomic_write_json(path, data)
+        http = data['http']
+        print(f"⏱️ Rapor: {http['responses']} yanıt, {http['bytes_in'] // 1024} KB, "
+              f"{http['pages_per_s']} sayfa/sn, {data['pages_parsed']} ayrıştırma, "
+              f"{data['catalog_changes']['changed']} değişiklik / {data['catalog_changes']['noop']} no-op -> {path}", flush=True)
+        startup = data['startup']
+        browser = (f"{startup['browser_launches']} kez, {startup['browser_ms'] / 1000:.1f} sn"
+                   if startup['browser_launches'] else "açılmadı")
+        print(f"🚀 Başlangıç: içe aktarma {startup.get('imports_ms', 0) / 1000:.2f} sn, "
+              f"ilk yanıt {startup.get('first_response_ms', 0) / 1000:.2f} sn, tarayıcı {browser}", flush=True)
+        return data
+
+
+metrics = Metrics()
+timer = metrics.timer
+timed = metrics.timed
@@ -0,0 +1,186 @@
+"""Ayna (mirror) alan adları arasında katalog anahtarları, URL taşıma ve birleştirme.
+
+Site sık sık alan adı değiştirir (dizipal.cx, dizipal1538.com, ...). Kayıtlar
+URL ile anahtarlandığından alan adı değişince tüm kayıtlar yeni sanılır ve
+her şey baştan çekilirdi. Bu modül:
+  - kayıtlara alan adından bağımsız anahtar verir: dizi / film için URL'nin
+    son yol parçası ('unfamiliar'), bölüm için dizi + sezon + bölüm
+    ('unfamiliar-1-sezon-1-bolum'); ön yüz id'leri de buradan üretilir,
+  - bot açılışında kataloğu ve tarama durumunu BASE_DOMAIN'e toplu taşır
+    (follow_domain): yol yapısı aynı kaldığı sürece alan adı değişikliği
+    hiçbir sayfanın yeniden çekilmesini gerektirmez,
+  - farklı aynaların kataloglarını anahtarlara göre tek katalogda birleştirir.
+Taşıma yalnızca kaydın kendi alan adındaki değerleri değiştirir (poster vb.
+dahil); video sağlayıcıları gibi başka alanlardaki adreslere dokunulmaz.
+
+Kullanım:
+  python mirrors.py rebase diziler.jsonl https://yeni-alan.com [--state diziler.state.json]
+  python mirrors.py merge birlesik.jsonl diziler.jsonl diziler_1538.jsonl [--base https://dizipal.cx]
+"""
+import argparse
+import json
+import os
+import re
+from urllib.parse import unquote, urlsplit
+
+from catalog_store import CatalogStore, stamp
+from journal import atomic_write_json
+
+# Bölüm slug'larının aynaya göre değişen sonekleri
+SLUG_SUFFIXES = ('-izle',)
+EPISODE_RE = re.compile(r'(\d+)-sezon-(\d+)-bolum')
+
+
+# --- Anahtarlar ---
+
+def origin(url):
+    """'https://dizipal.cx/dizi/x/' -> 'https://dizipal.cx'"""
+    parts = urlsplit(url or '')
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else ''
+
+
+def slug_key(url):
+    """Alan adından bağımsız kayıt anahtarı: URL'nin son yol parçası (küçük harf, sonek atılmış)."""
+    segments = [s for s in urlsplit(url or '').path.split('/') if s]
+    slug = unquote(segments[-1]).lower() if segments else ''
+    for suffix in SLUG_SUFFIXES:
+        if slug.endswith(suffix):
+            slug = slug[:-len(suffix)]
+    return slug
+
+
+def episode_key(ep_url, series_url):
+    """Bölüm anahtarı: '<dizi>-<sezon>-sezon-<bölüm>-bolum' (URL'de sezon/bölüm yoksa son yol parçası)."""
+    m = EPISODE_RE.search(ep_url or '')
+    if m:
+        return f"{slug_key(series_url)}-{m.group(1)}-sezon-{m.group(2)}-bolum"
+    return slug_key(ep_url)
+
+
+# --- Taşıma ---
+
+def rebase_value(value, old, new):
+    """old kökenli (alan adı) tüm URL'leri new kökene taşır; iç içe liste / sözlüklerde de."""
+    if isinstance(value, str):
+        if value == old or value.startswith(old + '/'):
+            return new + value[len(old):]
+        return value
+    if isinstance(value, list):
+        return [rebase_value(v, old, new) for v in value]
+    if isinstance(value, dict):
+        return {rebase_value(k, old, new): rebase_value(v, old, new) for k, v in value.items()}
+    return value
+
+
+def rebase_record(record, base_domain):
+    """Kaydı (kendi alan adındaki tüm değerleriyle) base_domain'e taşınmış kopya olarak döner."""
+    old, new = origin(record.get('url')), origin(base_domain)
+    if not old or old == new:
+        return record
+    return rebase_value(record, old, new)
+
+
+def rebase_state(data, base_domain):
+    """crawl_state verisindeki dizi URL'lerini (anahtarlar ve son bölüm) taşır. Taşınan girdi sayısı."""
+    new = origin(base_domain)
+    moved = 0
+    for section in ('listing', 'series'):
+        entries = {}
+        for url, entry in data.get(section, {}).items():
+            old = origin(url)
+            if old and old != new:
+                url, entry = rebase_value(url, old, new), rebase_value(entry, old, new)
+                moved += 1
+            entries[url] = entry
+        data[section] = entries
+    return moved
+
+
+def follow_domain(store, base_domain, state_data=None):
+    """Başka alan adındaki kayıtları (ve tarama durumunu) base_domain'e taşır, kataloğu yazar.
+    Aynı dizi iki alan adında da varsa kayıtlar birleştirilir. Taşınan kayıt sayısı."""
+    new = origin(base_domain)
+    stale = [record.url for record in store if record.url and origin(record.url) != new]
+    for url in stale:
+        moved = rebase_record(store.get(url).materialize(), new)
+        existing = store.get(moved['url'])
+        if existing is not None:
+            moved = union(existing.materialize(), moved)
+        store.rename(url, moved)
+    moved_state = rebase_state(state_data, new) if state_data is not None else 0
+    if stale:
+        store.compact()
+        print(f"🔁 Alan adı değişti: {len(stale)} kayıt ve {moved_state} durum girdisi {new} adresine taşındı "
+              f"(yeniden çekme yok).", flush=True)
+    return len(stale)
+
+
+# --- Aynalar arası birleştirme ---
+
+def union(primary, other):
+    """Aynı dizinin iki aynadaki kaydı: alanlarda primary önceliklidir, other eksikleri doldurur;
+    bölümler anahtara göre birleştirilir (primary sırası, other'a özgü bölümler sona)."""
+    merged = {**other, **primary}
+    if 'episodes' in primary or 'episodes' in other:
+        series_url = primary.get('url')
+        known = {episode_key(ep.get('url'), series_url) for ep in primary.get('episodes', [])}
+        extra = [ep for ep in other.get('episodes', []) if episode_key(ep.get('url'), series_url) not in known]
+        merged['episodes'] = primary.get('episodes', []) + extra
+    if 'seasons' in primary or 'seasons' in other:
+        merged['seasons'] = {**other.get('seasons', {}), **primary.get('seasons', {})}
+    return merged
+
+
+def merge_catalogs(catalogs, base_domain=None):
+    """Kayıt listelerini (öncelik sırasıyla) slug anahtarına göre birleştirir. base_domain verilmezse
+    ilk katalogdaki ilk kaydın alan adı kullanılır. URL sırasına göre kayıt listesi döner."""
+    merged = {}
+    for records in catalogs:
+        for record in records:
+            if not record.get('url'):
+                continue
+            base_domain = base_domain or record['url']
+            record = rebase_record(record, base_domain)
+            key = slug_key(record['url'])
+            merged[key] = union(merged[key], record) if key in merged else record
+    for record in merged.values():
+        stamp(record)
+    return sorted(merged.values(), key=lambda r: r['url'])
+
+
+def _load(path):
+    return list(CatalogStore(path).load().materialized())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest='command', required=True)
+    rebase = sub.add_parser('rebase', help="Kataloğu yeni alan adına taşı")
+    rebase.add_argument('data_file')
+    rebase.add_argument('base_domain')
+    rebase.add_argument('--state', help="Taşınacak tarama durumu dosyası (ör. diziler.state.json)")
+    merge = sub.add_parser('merge', help="Aynaların kataloglarını birleştir")
+    merge.add_argument('output')
+    merge.add_argument('inputs', nargs='+', help="Öncelik sırasıyla katalog dosyaları")
+    merge.add_argument('--base', help="Birleşik kataloğun alan adı (varsayılan: ilk katalogunki)")
+    args = parser.parse_args()
+
+    if args.command == 'rebase':
+        state = None
+        if args.state and os.path.exists(args.state):
+            with open(args.state, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        store = CatalogStore(args.data_file).load()
+        follow_domain(store, args.base_domain, state)
+        if state is not None:
+            atomic_write_json(args.state, state, indent=None)
+    else:
+        catalogs = [_load(path) for path in args.inputs]
+        records = merge_catalogs(catalogs, args.base)
+        CatalogStore.from_records(records, args.output).compact()
+        print(f"🪞 {len(args.inputs)} katalog ({sum(map(len, catalogs))} kayıt) -> {args.output}: "
+              f"{len(records)} kayıt", flush=True)
+
+
+if __name__ == '__main__':
+    main()
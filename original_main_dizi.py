@@ -1,25 +1,49 @@
-from seleniumbase import SB
 from curl_cffi import requests
-from bs4 import BeautifulSoup
-import json
+import argparse
 import time
 import os
-import random
-import re
 from urllib.parse import urljoin
+from catalog_store import CatalogStore
+from catalog_export import export_catalog
+from delta_feed import DeltaFeed
+from http_cache import cache as http_cache
+from extractors import extract_episode_links, extract_video_source_1538
+from fetch_pipeline import fetch_extracted
+from checkpoint import Checkpoint
+from metrics import metrics, timed
+from request_scheduler import scheduler
+from mirrors import follow_domain
+from refresh_scheduler import mark_finished_series
+from crawl_state import (CrawlState, UNCHANGED_PAGE_LIMIT, card_text, drop_failed_seasons, fingerprint,
+                         season_fingerprint, seasons_to_fetch)
 
 # --- AYARLAR ---
-BASE_DOMAIN = "https://dizipal1538.com"
-DATA_FILE = 'diziler_1538.json'
+BASE_DOMAIN = os.environ.get('BASE_DOMAIN', "https://dizipal1538.com")
+# Yerel tekrar oynatma sunucusuna karşı çalışırken tarayıcı açılmaz
+SKIP_BROWSER = os.environ.get('SKIP_BROWSER') == '1'
+# Tarayıcı varsayılan olarak ilk 403'te açılır; 1 ise eskisi gibi ilk istekten önce
+EAGER_BROWSER = os.environ.get('EAGER_BROWSER') == '1'
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+DATA_FILE = 'diziler_1538.jsonl'
+# Eski girintili JSON; varsa ilk çalışmada DATA_FILE'a taşınır (bkz. catalog_format)
+LEGACY_DATA_FILE = 'diziler_1538.json'
+STATE_FILE = 'diziler_1538.state.json'
+CHECKPOINT_FILE = 'diziler_1538.checkpoint.json'
+REPORT_FILE = 'diziler_1538.run_report.json'
 
 # Global Session
 session = requests.Session()
 
+@timed('browser')
 def get_cookies_and_ua_with_selenium():
     """
     Selenium ile Cloudflare'i geçmeye çalışır.
     Yöntem: Klavye (TAB + SPACE) simülasyonu (DÜZELTİLMİŞ).
     """
+    if SKIP_BROWSER:
+        return {'skip_browser': '1'}, DEFAULT_USER_AGENT
+    # seleniumbase ağır bir içe aktarma; yalnızca tarayıcı gerçekten gerektiğinde yüklenir
+    from seleniumbase import SB
     print(f"🔓 Selenium Başlatılıyor: {BASE_DOMAIN} ...", flush=True)
     cookies = {}
     user_agent = ""
@@ -86,70 +110,59 @@ def get_cookies_and_ua_with_selenium():
             
     return cookies, user_agent
 
+def initial_session():
+    """İlk istekler için çerez + User-Agent. Tarayıcı (EAGER_BROWSER değilse) ilk 403'e bırakılır."""
+    if not EAGER_BROWSER:
+        print("⚡ Tarayıcısız başlanıyor; 403 gelirse Selenium açılacak.", flush=True)
+        return {}, DEFAULT_USER_AGENT
+    cookies, user_agent = get_cookies_and_ua_with_selenium()
+    return (cookies, user_agent) if cookies else (None, None)
+
+@timed('get_soup_fast')
 def get_soup_fast(url, cookies, user_agent):
+    cached = http_cache.fresh_page(url)
+    if cached is not None: return cached
     headers = {
         'User-Agent': user_agent,
         'Referer': BASE_DOMAIN,
     }
     try:
-        response = session.get(url, cookies=cookies, headers=headers, impersonate="chrome110", timeout=15)
-        if response.status_code == 200: return BeautifulSoup(response.content, 'html.parser')
-        elif response.status_code == 404: return "404"
-        elif response.status_code == 403: return "403"
+        return http_cache.request(url, headers, lambda h: scheduler.get(
+            session, url, cookies=cookies, headers=h, impersonate="chrome110", timeout=15))
     except Exception as e:
+        metrics.count('http_errors')
         print(f"   ⚠️ Hızlı mod hatası: {e}", flush=True)
     return None
 
+@timed('get_video_source')
 def get_video_source(soup):
-    try:
-        player_area = soup.find('div', class_=lambda x: x and ('video' in x or 'player' in x))
-        if player_area:
-            iframe = player_area.find('iframe')
-            if iframe: return iframe.get('src')
-        
-        iframes = soup.find_all('iframe')
-        for frame in iframes:
-            src = frame.get('src', '')
-            fid = frame.get('id', '')
-            # Reklam filtreleri
-            if 'psContainer' in fid or 'google' in src: continue
-            if 'embed' in src or '.cfd' in src or 'player' in src or 'get_video' in src: return src
-    except: pass
-    return ""
+    return extract_video_source_1538(soup)
 
-def get_episodes_from_page(soup, cookies, user_agent, known_urls=[]):
-    new_episodes = []
-    all_links = soup.find_all('a', href=True)
-    
-    for link in all_links:
-        ep_url = link.get('href')
-        if '/dizi/' in ep_url and 'sezon' in ep_url and 'bolum' in ep_url:
-            full_ep_url = urljoin(BASE_DOMAIN, ep_url)
-            if full_ep_url in known_urls: continue
-            if any(e['url'] == full_ep_url for e in new_episodes): continue
-
-            title = link.get('title') or link.get_text(strip=True)
-            ep_data = {'url': full_ep_url, 'title': title, 'episode_number': ''}
-            
-            try:
-                match = re.search(r'(\d+)-sezon-(\d+)-bolum', full_ep_url)
-                if match: ep_data['episode_number'] = f"S{match.group(1)} E{match.group(2)}"
-            except: pass
+def parse_episode_links(soup, known_urls=frozenset(), seen_urls=None):
+    """Sayfadaki bölüm linklerini okur (ağ isteği yok)."""
+    return extract_episode_links(soup, BASE_DOMAIN, known_urls, seen_urls)
 
-            print(f"      ▶️ {title}", flush=True)
-            ep_soup = get_soup_fast(full_ep_url, cookies, user_agent)
-            
-            if ep_soup == "403":
-                print("      ⚠️ 403 (Atlandı)", flush=True)
-                continue 
-            if ep_soup and ep_soup != "404":
-                video_src = get_video_source(ep_soup)
-                ep_data['video_source'] = video_src
-                print(f"      ✅ KAYNAK: {video_src}", flush=True)
-                new_episodes.append(ep_data)
+def fetch_episode_sources(candidates, cookies, user_agent):
+    """Bölüm sayfalarını eşzamanlı çeker (ayrıştırma parse_pool'da); kaynağı alınamayan bölümler atlanır."""
+    new_episodes = []
+    video_srcs = fetch_extracted([ep['url'] for ep in candidates], 'video_1538', cookies, user_agent, BASE_DOMAIN)
+    for ep_data, video_src in zip(candidates, video_srcs):
+        print(f"      ▶️ {ep_data['title']}", flush=True)
+        if video_src == "403":
+            print("      ⚠️ 403 (Atlandı)", flush=True)
+            continue 
+        if video_src is not None and video_src != "404":
+            ep_data['video_source'] = video_src
+            print(f"      ✅ KAYNAK: {video_src}", flush=True)
+            new_episodes.append(ep_data)
     return new_episodes
 
-def get_full_series_details(url, cookies, user_agent, existing_episodes_list=[]):
+def get_episodes_from_page(soup, cookies, user_agent, known_urls=frozenset()):
+    return fetch_episode_sources(parse_episode_links(soup, known_urls), cookies, user_agent)
+
+@timed('get_full_series_details')
+def get_full_series_details(url, cookies, user_agent, existing_episodes_list=frozenset(), known_seasons=None):
+    """known_seasons verilirse sadece en yeni ve bilinmeyen sezonlar çekilir (bkz. crawl_state)."""
     print(f"   ▶️ Analiz: {url}", flush=True)
     soup = get_soup_fast(url, cookies, user_agent)
     
@@ -179,34 +192,64 @@ def get_full_series_details(url, cookies, user_agent, existing_episodes_list=[])
         if not season_links: season_links.append(url)
         print(f"   📂 {len(season_links)} Sezon.", flush=True)
 
-        for season_url in season_links:
-            if season_url == url: current_season_soup = soup
-            else: current_season_soup = get_soup_fast(season_url, cookies, user_agent)
+        target_seasons = seasons_to_fetch(season_links, known_seasons)
+        other_seasons = [s for s in target_seasons if s != url]
+        fetched = dict(zip(other_seasons, fetch_extracted(other_seasons, 'episode_links', cookies, user_agent, BASE_DOMAIN, BASE_DOMAIN)))
+
+        candidates = []
+        season_of = {}  # aday bölüm url -> sezon url
+        meta['seasons'] = {}
+        for season_url in target_seasons:
+            # Her sezon kendi içinde tekilleştirilir (eski davranış)
+            season_episodes = parse_episode_links(soup) if season_url == url else fetched.get(season_url)
             
-            if current_season_soup and current_season_soup not in ["404", "403"]:
-                season_episodes = get_episodes_from_page(current_season_soup, cookies, user_agent, existing_episodes_list)
-                meta['episodes'].extend(season_episodes)
+            if season_episodes is not None and season_episodes not in ["404", "403"]:
+                season_fp = season_fingerprint([ep['url'] for ep in season_episodes])
+                meta['seasons'][season_url] = season_fp
+                if known_seasons and known_seasons.get(season_url) == season_fp: continue
+                fresh = [ep for ep in season_episodes if ep['url'] not in existing_episodes_list]
+                candidates.extend(fresh)
+                season_of.update((ep['url'], season_url) for ep in fresh)
+        episodes = fetch_episode_sources(candidates, cookies, user_agent)
+        meta['episodes'].extend(episodes)
+        # Kaynağı alınamayan bölümün sezonu parmak izsiz kalır, sonraki çalışmada yeniden denenir
+        if drop_failed_seasons(meta['seasons'], season_of, episodes):
+            meta['incomplete'] = True  # çağıran kayda yazmadan çıkarır (bkz. CrawlState.visited)
     except: pass
     return meta
 
-def main():
+def main(full_sweep=False, resume=False):
     print("🛡️ Dizipal 1538 V3 (Klavye Modu - DÜZELTİLDİ)...", flush=True)
-    cookies, user_agent = get_cookies_and_ua_with_selenium()
+    metrics.begin_run('diziler_1538', REPORT_FILE)
+    cookies, user_agent = initial_session()
     
-    if not cookies:
+    if cookies is None:
         print("❌ Çerez YOK! (GitHub IP'si bloklanmış olabilir)", flush=True)
         return
 
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f: all_series = json.load(f)
-            print(f"📦 Veri: {len(all_series)} dizi.", flush=True)
-        except: all_series = []
-    else: all_series = []
+    feed = DeltaFeed(DATA_FILE, 'series')
+    store = CatalogStore(DATA_FILE, legacy_path=LEGACY_DATA_FILE, feed=feed).load()
+    if len(store): print(f"📦 Veri: {len(store)} dizi.", flush=True)
 
+    state = CrawlState(STATE_FILE)
+    # Alan adı değiştiyse katalog ve liste parmak izleri yeni adrese taşınır (yeniden çekme yok)
+    follow_domain(store, BASE_DOMAIN, state.data)
+    finished = mark_finished_series(http_cache, store, state.data['series'])
+    if finished: print(f"💤 {finished} bitmiş dizi önbellekte uzun süre tutulacak.", flush=True)
     page_num = 1
     empty_page_count = 0 
 
+    progress = Checkpoint(CHECKPOINT_FILE)
+    if resume and progress.load():
+        page_num = progress.page
+        full_sweep = progress.extra.get('full_sweep', full_sweep)
+    else:
+        progress.clear()
+        full_sweep = state.should_full_sweep(full_sweep)
+    progress.extra['full_sweep'] = full_sweep
+    state.begin(full_sweep)
+    print(f"🧭 Mod: {state.report['mode']}", flush=True)
+
     while True:
         target_url = f"{BASE_DOMAIN}/diziler/page/{page_num}/" if page_num > 1 else f"{BASE_DOMAIN}/diziler/"
         print(f"\n--- SAYFA {page_num} ---", flush=True)
@@ -221,15 +264,15 @@ def main():
         if not soup or soup == "404": break
         
         links = soup.find_all('a', href=True)
-        series_urls = []
+        series_cards = {}
         for link in links:
             href = link['href']
             if '/dizi/' in href and href.count('/') > 3 and 'sezon' not in href and 'bolum' not in href:
                 full_url = urljoin(BASE_DOMAIN, href)
                 clean_url = full_url.split('?')[0]
-                if clean_url not in series_urls: series_urls.append(clean_url)
+                series_cards.setdefault(clean_url, []).append(card_text(link))
         
-        series_urls = list(set(series_urls))
+        series_urls = list(series_cards)
         if not series_urls:
             empty_page_count += 1
             if empty_page_count >= 2: break
@@ -238,24 +281,40 @@ def main():
         
         empty_page_count = 0
         print(f"   🔍 {len(series_urls)} dizi.", flush=True)
+        page_changed = False
+        progress.start_page(page_num, series_urls)
 
         for s_url in series_urls:
-            existing_series = next((s for s in all_series if s['url'] == s_url), None)
+            if progress.is_done(s_url): continue
+            existing_series = store.get(s_url)
+            card_fp = fingerprint(series_cards[s_url])
+            if state.card_changed(s_url, card_fp):
+                http_cache.mark_active(s_url)
+            if state.is_unchanged(s_url, card_fp, existing_series):
+                state.skip(existing_series)
+                continue
+            page_changed = True
             
             if existing_series:
-                known_urls = [ep['url'] for ep in existing_series.get('episodes', []) if 'url' in ep]
-                update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls)
+                known_urls = store.known_episode_urls(s_url)
+                known_seasons = None if state.full_sweep else existing_series.get('seasons', {})
+                update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls, known_seasons=known_seasons)
                 
                 if update_data == "403":
                     cookies, user_agent = get_cookies_and_ua_with_selenium()
-                    if cookies: update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls)
+                    if cookies: update_data = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=known_urls, known_seasons=known_seasons)
 
+                complete = not (update_data and update_data != "403" and update_data.pop('incomplete', False))
                 if update_data and update_data != "403" and update_data['episodes']:
-                    existing_series['episodes'].extend(update_data['episodes'])
-                    print(f"   🆙 +{len(update_data['episodes'])} bölüm.", flush=True)
-                    with open(DATA_FILE, 'w', encoding='utf-8') as f: json.dump(all_series, f, ensure_ascii=False, indent=2)
+                    count_new = store.add_episodes(s_url, update_data['episodes'])
+                    print(f"   🆙 +{count_new} bölüm.", flush=True)
+                    store.checkpoint()
                 else:
                     print(f"   ⏭️ {existing_series.get('title')}", flush=True)
+                if update_data and update_data != "403":
+                    if update_data.get('seasons'):
+                        store.update_fields(s_url, {'seasons': {**existing_series.get('seasons', {}), **update_data['seasons']}})
+                    state.visited(s_url, card_fp, complete=complete)
             else:
                 new_details = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=[])
                 if new_details == "403":
@@ -263,13 +322,30 @@ def main():
                     if cookies: new_details = get_full_series_details(s_url, cookies, user_agent, existing_episodes_list=[])
                 
                 if new_details and new_details != "403":
-                    all_series.append(new_details)
+                    complete = not new_details.pop('incomplete', False)
+                    store.upsert(new_details)
                     print(f"   ✅ {new_details.get('title')}", flush=True)
-                    with open(DATA_FILE, 'w', encoding='utf-8') as f: json.dump(all_series, f, ensure_ascii=False, indent=2)
+                    store.checkpoint()
+                    state.visited(s_url, card_fp, complete=complete)
+
+            progress.mark_done(s_url)
 
+        state.page_done(page_num, page_changed)
+        if state.can_stop():
+            print(f"🛑 Son {UNCHANGED_PAGE_LIMIT} sayfada değişiklik yok.", flush=True)
+            break
         page_num += 1
 
-    print(f"\n🎉 Bitti. Toplam: {len(all_series)}")
+    store.compact()
+    export_catalog(store.materialized(), DATA_FILE, 'series')
+    feed.publish(store)
+    state.finish()
+    progress.clear()
+    print(f"\n🎉 Bitti. Toplam: {len(store)}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--full', action='store_true', help="Tüm liste sayfalarını ve dizileri tara")
+    parser.add_argument('--resume', action='store_true', help="Yarım kalan taramaya checkpoint'ten devam et")
+    args = parser.parse_args()
+    main(full_sweep=args.full, resume=args.resume)
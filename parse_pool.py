@@ -0,0 +1,78 @@
+import asyncio
+import atexit
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+import html_backend
+from extractors import (extract_episode_items, extract_episode_links, extract_movie_details,
+                        extract_series_details, extract_video_source, extract_video_source_1538)
+from metrics import metrics
+
+# --- AYRIŞTIRMA İŞÇİLERİ ---
+# fetch_pipeline indirdiği ham gövdeleri buraya verir; BeautifulSoup ayrıştırması
+# ve alan çıkarımı ayrı süreçlerde (ProcessPoolExecutor) yapılır, geri yalnızca
+# düz sözlük / liste döner. Böylece ağ beklerken CPU, ayrıştırırken ağ boşta kalmaz.
+# İşçiler (spawn) bu modülü yeniden içe aktarır: burada yan etkili modül (http_cache
+# gibi) içe aktarılmaz; çıkarım önbelleği yalnızca ana süreçte (fetch_pipeline) kullanılır.
+# PARSE_WORKERS=0 (veya 1) işçisiz çalışır: ayrıştırma ana süreçte yapılır.
+PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', str(os.cpu_count() or 1)))
+
+# Tür adı -> (soup, url, base_domain) alan çıkarıcı. Türler HTTP önbelleğindeki
+# çıkarım anahtarlarıyla aynıdır (cached_extract).
+EXTRACTORS = {
+    'movie': lambda soup, url, base: extract_movie_details(soup, url),
+    'series': lambda soup, url, base: extract_series_details(soup, url, base),
+    'video': lambda soup, url, base: extract_video_source(soup),
+    'video_1538': lambda soup, url, base: extract_video_source_1538(soup),
+    'episode_items': lambda soup, url, base: extract_episode_items(soup),
+    'episode_links': lambda soup, url, base: extract_episode_links(soup, base),
+}
+
+
+def run_extractor(kind, url, content, base_domain='', backend=None):
+    """İşçide çalışır: gövdeyi ayrıştırıp çıkarır. (sonuç, süre sn) döner."""
+    started = time.perf_counter()
+    soup = BeautifulSoup(content, backend or html_backend.get_backend())
+    result = EXTRACTORS[kind](soup, url, base_domain)
+    return result, time.perf_counter() - started
+
+
+_pool = None
+
+
+def get_pool(workers=None):
+    """Paylaşılan işçi havuzu; işçi sayısı 1 veya altındaysa None."""
+    global _pool
+    workers = PARSE_WORKERS if workers is None else workers
+    if workers <= 1:
+        return None
+    if _pool is None:
+        # spawn: işçiler ağ / sunucu thread'lerini kopyalamadan temiz başlar
+        _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        atexit.register(_pool.shutdown)
+    return _pool
+
+
+def _record(seconds):
+    metrics.observe('parse_extract', seconds)
+    html_backend.count_parsed()
+
+
+async def extract_page(kind, page, base_domain=''):
+    """fetch_pipeline sayfasını (LazySoup / "404" / "403" / None) çıkarım sonucuna çevirir.
+    İşçiye yalnızca ham gövde ve düz argümanlar gider."""
+    if not isinstance(page, html_backend.LazySoup):
+        return page
+
+    pool = get_pool()
+    args = (kind, page.url, page.content, base_domain, html_backend.get_backend())
+    if pool is None:
+        result, seconds = run_extractor(*args)
+    else:
+        result, seconds = await asyncio.get_running_loop().run_in_executor(pool, run_extractor, *args)
+    _record(seconds)
+    return result
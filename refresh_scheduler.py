@@ -0,0 +1,137 @@
+import math
+import os
+import time
+import zlib
+
+from crawl_state import TIMESTAMP_STEP, estimated_visit_cost
+
+# --- ÖNCELİKLİ YENİLEME ---
+# Liste taraması yalnızca kartı değişen dizileri açar; kartı aynı kalan ya da
+# taranmayan sayfalardaki diziler bir sonraki tam taramaya kadar beklerdi.
+# Artımlı çalışmanın sonunda bu çalışmada açılmamış kayıtlı diziler, yeni
+# bölüm çıkarma olasılığına göre puanlanır ve REFRESH_BUDGET istek bütçesi
+# en yüksek puanlılardan başlanarak harcanır:
+#  - son yeni bölümden beri geçen süre (yakın zamanda bölüm çıkan dizi sürüyordur)
+#  - geçmiş yayın sıklığı (bir sonraki bölümün vakti geldi mi?)
+#  - yayın yılı (eski diziler büyük olasılıkla bitmiştir)
+#  - liste 1. sayfasında görünmesi
+#  - son kontrolden beri geçen süre (her şey zamanla öne çıkar)
+# REFRESH_MIN_DAYS'ten uzun süredir kontrol edilmeyen diziler bütçeden bağımsız
+# her zaman açılır. Hiç kontrol zamanı olmayan dizilerin zamanı URL'ye göre
+# aralığa yayılır; hepsi aynı gün vadesi dolmuş sayılmasın.
+
+REFRESH_BUDGET = int(os.environ.get('REFRESH_BUDGET', '60'))  # istek / çalışma
+REFRESH_MIN_DAYS = float(os.environ.get('REFRESH_MIN_DAYS', '7'))
+DAY = 86400
+# Son 1. sayfa görünmesinin "yeni" sayıldığı süre
+PAGE1_WINDOW = DAY
+# Bu kadar gün (ve yayın aralığının 3 katı) yeni bölüm çıkmayan dizi bitmiş sayılır;
+# sayfası HTTP önbelleğinde uzun TTL ile tutulur (bkz. http_cache 'finished_series')
+FINISHED_AFTER_DAYS = float(os.environ.get('FINISHED_AFTER_DAYS', '60'))
+
+
+def _days(seconds):
+    return seconds / DAY
+
+
+def cadence_days(new_at):
+    """Yeni bölüm bulunan anlar arasındaki ortanca aralık (gün); en az iki kayıt gerekir."""
+    gaps = sorted(b - a for a, b in zip(new_at, new_at[1:]) if b > a)
+    if not gaps:
+        return None
+    return max(_days(gaps[len(gaps) // 2]), 0.5)
+
+
+def checked_at(url, entry, now, min_days=REFRESH_MIN_DAYS):
+    """Son kontrol zamanı; bilinmiyorsa URL'ye göre son min_days içine yayılmış sabit bir an."""
+    if entry.get('checked_at'):
+        return entry['checked_at']
+    spread = (zlib.crc32(url.encode('utf-8')) % 1000) / 1000
+    return now - spread * min_days * DAY
+
+
+def score(url, entry, record, now, min_days=REFRESH_MIN_DAYS):
+    """Yeni bölüm olasılığı puanı (büyük = önce)."""
+    new_at = entry.get('new_at', [])
+    value = 0.0
+    if new_at:
+        since_new = _days(now - new_at[-1])
+        value += 2.0 / (1.0 + since_new / 7.0)
+        cadence = cadence_days(new_at)
+        if cadence:
+            # Beklenen bölüm zamanına yaklaştıkça artar, çok geçince (dizi bitti?) söner
+            due = since_new / cadence
+            value += 2.0 * (min(due, 1.0) if due <= 3 else math.exp(3 - due))
+    try:
+        age = time.gmtime(now).tm_year - int(str(record.get('year', ''))[:4])
+        value += 1.0 if age <= 0 else 0.5 / age
+    except ValueError:
+        pass
+    # page1_at en fazla TIMESTAMP_STEP'te bir ilerletilir (bkz. crawl_state), pencere o kadar geniş
+    if now - entry.get('page1_at', 0) <= PAGE1_WINDOW + TIMESTAMP_STEP:
+        value += 3.0
+    value += _days(now - checked_at(url, entry, now, min_days)) / min_days
+    return value
+
+
+def plan_refresh(store, series_state, skip=(), now=None, min_days=REFRESH_MIN_DAYS):
+    """(zorunlu, isteğe bağlı) URL listeleri. Zorunlular vadesi geçenler, diğerleri puana göre sıralı."""
+    now = now or time.time()
+    mandatory, optional = [], []
+    for record in store:
+        url = record.get('url')
+        if not url or url in skip:
+            continue
+        entry = series_state.get(url, {})
+        if now - checked_at(url, entry, now, min_days) >= min_days * DAY:
+            mandatory.append((checked_at(url, entry, now, min_days), url))
+        else:
+            optional.append((-score(url, entry, record, now, min_days), url))
+    return [url for _, url in sorted(mandatory)], [url for _, url in sorted(optional)]
+
+
+def is_finished(entry, record, now, after_days=FINISHED_AFTER_DAYS):
+    """Dizi büyük olasılıkla bitti mi? Yeni bölüm geçmişi varsa son bölümden beri geçen süreye bakılır.
+    Hiç yeni bölüm görülmemişse yayın yılı ancak after_days boyunca yayılmış değişmeyen
+    kontrollerden sonra hesaba katılır (tam taramada ilk kez görülen, hâlâ süren dizi bitmiş sayılmasın)."""
+    new_at = entry.get('new_at', [])
+    if new_at:
+        since_new = _days(now - new_at[-1])
+        return since_new > max(after_days, 3 * (cadence_days(new_at) or 0))
+    first, last = entry.get('first_checked_at'), entry.get('checked_at')
+    if not first or not last or _days(last - first) < after_days:
+        return False
+    try:
+        return time.gmtime(now).tm_year - int(str(record.get('year', ''))[:4]) >= 2
+    except ValueError:
+        return False
+
+
+def mark_finished_series(cache, store, series_state, now=None):
+    """Bitmiş görünen dizilerin sayfalarını önbelleğin uzun TTL sınıfına alır. Sayıyı döner.
+    Liste kartı değişen dizi bu çalışmada cache.mark_active ile normal TTL'e döner."""
+    now = now or time.time()
+    count = 0
+    for record in store:
+        url = record.get('url')
+        if url and is_finished(series_state.get(url, {}), record, now):
+            cache.mark_finished(url)
+            count += 1
+    return count
+
+
+class RefreshBudget:
+    """Bütçeyi gerçek istek sayısıyla izler (sayaç: çağıranın verdiği toplam istek sayısı)."""
+
+    def __init__(self, budget, requests_made):
+        self.budget = budget
+        self.requests_made = requests_made
+        self.start = requests_made()
+
+    @property
+    def spent(self):
+        return self.requests_made() - self.start
+
+    def allows(self, record):
+        """Dizinin tahmini maliyeti bütçeye sığıyor mu?"""
+        return self.spent + estimated_visit_cost(record) <= self.budget
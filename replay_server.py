@@ -0,0 +1,172 @@
+"""Kayıtlı derlemi (fixtures.py) yerel HTTP sunucusu olarak yeniden sunar.
+
+Botlar BASE_DOMAIN=http://127.0.0.1:<port> ve SKIP_BROWSER=1 ile canlı siteye
+dokunmadan uçtan uca çalıştırılabilir. ETag / Last-Modified koşullu
+istekleri 304 ile cevaplanır. Gövdelerdeki asıl alan adı sunucunun
+adresiyle değiştirilir. Gecikme ve hata enjeksiyonu (403 / 404 / 429 / 503 /
+zaman aşımı) ayarlanabilir; 429 ve 503 yanıtları Retry-After taşır. --max-rps
+verilirse sunucu saniyedeki istek sınırını aşan her isteğe 429 döner.
+
+Kullanım:  python replay_server.py --corpus fixtures/site --port 8800 --latency 50 --error-403 0.01
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fixtures import FixtureCorpus, page_key
+
+
+class ReplayConfig:
+    def __init__(self, latency_ms=0, jitter_ms=0, error_403=0.0, error_404=0.0,
+                 timeout_rate=0.0, timeout_s=20, seed=None, error_429=0.0, error_503=0.0,
+                 retry_after_s=1, max_rps=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_403 = error_403
+        self.error_404 = error_404
+        self.timeout_rate = timeout_rate
+        self.timeout_s = timeout_s
+        self.error_429 = error_429
+        self.error_503 = error_503
+        self.retry_after_s = retry_after_s
+        self.max_rps = max_rps
+        self.random = random.Random(seed)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, corpus, config=None, host='127.0.0.1', port=0):
+        super().__init__((host, port), ReplayHandler)
+        self.corpus = corpus
+        self.config = config or ReplayConfig()
+        self.stats = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._window = (0, 0)  # (saniye, o saniyedeki istek sayısı)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, status, size=0):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats[status] += 1
+            self.bytes_sent += size
+
+    def over_limit(self):
+        """max_rps aşıldı mı? (sabit bir saniyelik pencere)"""
+        if not self.config.max_rps:
+            return False
+        with self._lock:
+            second = int(time.monotonic())
+            start, count = self._window
+            count = count + 1 if start == second else 1
+            self._window = (second, count)
+            return count > self.config.max_rps
+
+    def start_background(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        cfg = server.config
+        with server._lock:
+            roll = cfg.random.random()
+            delay = cfg.latency_ms + cfg.random.uniform(0, cfg.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+        if roll < cfg.timeout_rate:
+            server.count('timeout')
+            time.sleep(cfg.timeout_s)
+            return
+        roll -= cfg.timeout_rate
+        if roll < cfg.error_403:
+            return self._send(403, {}, b'')
+        roll -= cfg.error_403
+        if roll < cfg.error_404:
+            return self._send(404, {}, b'')
+        roll -= cfg.error_404
+        retry_after = {'Retry-After': str(cfg.retry_after_s)}
+        if roll < cfg.error_429 or server.over_limit():
+            return self._send(429, retry_after, b'')
+        roll -= cfg.error_429
+        if roll < cfg.error_503:
+            return self._send(503, retry_after, b'')
+
+        key = page_key(self.path)
+        entry = server.corpus.pages.get(key)
+        if entry is None:
+            return self._send(404, {}, b'')
+        headers = entry.get('headers', {})
+        if self._not_modified(headers):
+            return self._send(304, {}, b'')
+        body = server.corpus.body(key)
+        if server.corpus.origin and body:
+            body = body.replace(server.corpus.origin.encode(), server.base_url.encode())
+        self._send(entry['status'], headers, body)
+
+    def _not_modified(self, headers):
+        lowered = {k.lower(): v for k, v in headers.items()}
+        etag = lowered.get('etag')
+        modified = lowered.get('last-modified')
+        if etag and self.headers.get('If-None-Match') == etag:
+            return True
+        return bool(modified and self.headers.get('If-Modified-Since') == modified)
+
+    def _send(self, status, headers, body):
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() != 'content-length':
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self.server.count(status, len(body))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', required=True)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency', type=float, default=0, help="ms")
+    parser.add_argument('--jitter', type=float, default=0, help="ms")
+    parser.add_argument('--error-403', type=float, default=0.0)
+    parser.add_argument('--error-404', type=float, default=0.0)
+    parser.add_argument('--error-429', type=float, default=0.0)
+    parser.add_argument('--error-503', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=1, help="429 / 503 yanıtlarındaki Retry-After (sn)")
+    parser.add_argument('--max-rps', type=float, default=0, help="Saniyede en fazla istek (0 = sınırsız)")
+    parser.add_argument('--timeouts', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    config = ReplayConfig(args.latency, args.jitter, args.error_403, args.error_404, args.timeouts, seed=args.seed,
+                          error_429=args.error_429, error_503=args.error_503,
+                          retry_after_s=args.retry_after, max_rps=args.max_rps)
+    server = ReplayServer(FixtureCorpus(args.corpus), config, args.host, args.port)
+    print(f"🎞️ {len(server.corpus.pages)} sayfa sunuluyor: {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"📊 {dict(server.stats)}", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from metrics import metrics
+
+# --- İSTEK ZAMANLAYICI ---
+# Tüm istekler (get_soup_fast ve fetch_pipeline) buradan geçer. Her sunucunun
+# kendi token kovası vardır: saniyede 'rate' istek, en fazla BURST birikim.
+# Zaman aşımı ve 5xx hatalarında üstel bekleme (tam jitter) ile tekrar denenir;
+# 429 / 503 yanıtındaki Retry-After süresi kadar o sunucuya hiç istek atılmaz.
+# Hız AIMD ile ayarlanır: her başarılı yanıtta +RATE_STEP, hata / yavaş yanıtta
+# çarpanla düşer. Böylece sunucunun kaldırdığı en yüksek hıza yaklaşılır.
+RATE = float(os.environ.get('FETCH_RATE', '8'))            # başlangıç, istek/sn
+MIN_RATE = float(os.environ.get('FETCH_MIN_RATE', '0.5'))
+MAX_RATE = float(os.environ.get('FETCH_MAX_RATE', '32'))
+BURST = int(os.environ.get('FETCH_BURST', '4'))
+RATE_STEP = 0.5
+MAX_RETRIES = int(os.environ.get('FETCH_RETRIES', '4'))
+BACKOFF_BASE = 0.5   # sn
+BACKOFF_MAX = 30     # sn
+RETRY_AFTER_MAX = 120  # daha uzun bir Retry-After'ı beklemek yerine vazgeç
+LATENCY_TARGET = float(os.environ.get('FETCH_LATENCY_TARGET', '3'))  # sn; üstü "yavaş"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value):
+    """Retry-After başlığı (saniye veya HTTP tarihi) -> saniye. Okunamazsa None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate=RATE, burst=BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self):
+        """Bir jeton ayırır; isteğin atılabilmesi için beklenmesi gereken süreyi döner.
+
+        Jeton sayısı eksiye düşebilir: ardışık çağrılar sırayla gelecekteki
+        boş aralıklara yerleşir.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def pause(self, seconds):
+        """Retry-After: sunucuya bu süre boyunca istek atılmaz."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class RequestScheduler:
+    def __init__(self, rate=RATE, burst=BURST, max_retries=MAX_RETRIES, seed=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.buckets = {}
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        host = urlparse(url).netloc
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def wait_time(self, url):
+        with self._lock:
+            return self._bucket(url).reserve()
+
+    def backoff(self, attempt):
+        return self.random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    def after(self, url, attempt, latency, response=None, error=None):
+        """Hızı günceller. Tekrar denenecekse beklenecek süreyi, değilse None döner."""
+        status = response.status_code if response is not None else None
+        retry = error is not None or status in RETRY_STATUSES
+        with self._lock:
+            bucket = self._bucket(url)
+            if retry:
+                # Aynı Retry-After penceresinde gelen diğer hatalar hızı tekrar düşürmez
+                if time.monotonic() >= bucket.blocked_until:
+                    bucket.rate = max(MIN_RATE, bucket.rate / 2)
+            elif latency > LATENCY_TARGET:
+                bucket.rate = max(MIN_RATE, bucket.rate * 0.8)
+            else:
+                bucket.rate = min(MAX_RATE, bucket.rate + RATE_STEP)
+            metrics.note('host_rates', {host: round(b.rate, 2) for host, b in self.buckets.items()})
+
+            if not retry or attempt >= self.max_retries:
+                if retry:
+                    metrics.count('http_gave_up')
+                return None
+            delay = self.backoff(attempt)
+            if status in (429, 503):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    if retry_after > RETRY_AFTER_MAX:
+                        metrics.count('http_gave_up')
+                        return None
+                    delay = retry_after
+                    bucket.pause(retry_after)
+        metrics.count(f"http_retry_{status or 'error'}")
+        return delay
+
+    # --- İstek ---
+    def get(self, session, url, **kwargs):
+        """session.get'in tekrar denemeli hali. Son yanıtı döner ya da son hatayı fırlatır."""
+        attempt = 0
+        while True:
+            time.sleep(self.wait_time(url))
+            started = time.perf_counter()
+            response = error = None
+            try:
+                with metrics.timer('http'):
+                    response = session.get(url, **kwargs)
+            except Exception as e:
+                error = e
+            delay = self.after(url, attempt, time.perf_counter() - started, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            print(f"   ⏳ Tekrar denenecek ({attempt + 1}/{self.max_retries}, {delay:.1f} sn): {url}", flush=True)
+            time.sleep(delay)
+            attempt += 1
+
+    async def get_async(self, session, url, slot=None, **kwargs):
+        """AsyncSession için get(); slot() her denemede alınan eşzamanlılık kilididir."""
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.wait_time(url))
+            started = time.perf_counter()
+            response = error = None
+            try:
+                if slot is None:
+                    with metrics.timer('http'):
+                        response = await session.get(url, **kwargs)
+                else:
+                    async with slot():
+                        started = time.perf_counter()
+                        with metrics.timer('http'):
+                            response = await session.get(url, **kwargs)
+            except Exception as e:
+                error = e
+            delay = self.after(url, attempt, time.perf_counter() - started, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+scheduler = RequestScheduler()
@@ -0,0 +1,121 @@
+import base64
+import re
+
+# --- ARAMA VE FİLTRE İNDEKSİ ---
+# catalog_export, özetle birlikte '<katalog>.index.json' yazar. index.html
+# arama ve tür / yıl / platform filtrelerini tüm kayıtları taramadan buradan
+# cevaplar. Kayıtlar özet dosyasındaki sıralarıyla (0..count-1) anılır.
+#  - tokens:   katlanmış (fold) başlık kelimeleri, sıralı. Sıralı dizi düz bir
+#              önek ağacı (trie) gibi kullanılır: bir önekin eşleştiği kelimeler
+#              ikili aramayla bulunan ardışık bir aralıktır.
+#  - postings: her kelimenin geçtiği kayıt sıraları, fark (delta) kodlu.
+#  - facets:   alan -> değer -> base64 bit eşlem (bit i = i. kayıt).
+# Arama kelime başı eşleşmesidir: "dün" -> "Dünya", "yeni dünya" -> iki kelime de.
+
+FACET_FIELDS = ('genres', 'year', 'platform')
+
+# Türkçe büyük/küçük harf ve aksan katlama: İ/I/ı -> i, ş -> s ... (index.html'deki fold ile aynı)
+_FOLD = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i', 'Î': 'i', 'î': 'i',
+    'Ş': 's', 'ş': 's', 'Ğ': 'g', 'ğ': 'g', 'Ü': 'u', 'ü': 'u', 'Û': 'u', 'û': 'u',
+    'Ö': 'o', 'ö': 'o', 'Ç': 'c', 'ç': 'c', 'Â': 'a', 'â': 'a',
+})
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def fold(text):
+    return (text or '').translate(_FOLD).lower()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(fold(text))
+
+
+def _facet_values(record, field):
+    value = record.get(field)
+    if not value:
+        return []
+    if field == 'platform' and value == 'Platform Dışı':
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _bitmap(ordinals, count):
+    bits = bytearray((count + 7) // 8)
+    for i in ordinals:
+        bits[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(bits)).decode('ascii')
+
+
+def _delta(ordinals):
+    out, prev = [], 0
+    for i in ordinals:
+        out.append(i - prev)
+        prev = i
+    return out
+
+
+def build_index(records):
+    """records: özet dosyasındaki sırayla kayıtlar. JSON'a yazılabilir indeks sözlüğü döner."""
+    postings = {}
+    facets = {field: {} for field in FACET_FIELDS}
+    for i, record in enumerate(records):
+        for token in set(tokenize(record.get('title'))):
+            postings.setdefault(token, []).append(i)
+        for field in FACET_FIELDS:
+            for value in _facet_values(record, field):
+                facets[field].setdefault(str(value), []).append(i)
+
+    tokens = sorted(postings)
+    count = len(records)
+    return {
+        'version': 1,
+        'count': count,
+        'tokens': tokens,
+        'postings': [_delta(postings[t]) for t in tokens],
+        'facets': {field: {value: _bitmap(ords, count) for value, ords in sorted(values.items())}
+                   for field, values in facets.items() if values},
+    }
+
+
+# --- Sorgu (index.html'deki search() ile aynı mantık; benchmark ve kontrol için) ---
+
+def _decode(deltas):
+    out, acc = [], 0
+    for d in deltas:
+        acc += d
+        out.append(acc)
+    return out
+
+
+def _prefix_matches(index, prefix):
+    from bisect import bisect_left
+    tokens = index['tokens']
+    result = set()
+    pos = bisect_left(tokens, prefix)
+    while pos < len(tokens) and tokens[pos].startswith(prefix):
+        result.update(_decode(index['postings'][pos]))
+        pos += 1
+    return result
+
+
+def search(index, query='', **facets):
+    """Sorgu kelimelerinin hepsiyle başlayan kelime içeren ve tüm filtrelere uyan kayıt sıraları."""
+    result = None
+    for word in tokenize(query):
+        matches = _prefix_matches(index, word)
+        result = matches if result is None else result & matches
+        if not result:
+            return []
+    for field, value in facets.items():
+        if not value:
+            continue
+        encoded = index['facets'].get(field, {}).get(str(value))
+        if encoded is None:
+            return []
+        bits = base64.b64decode(encoded)
+        candidates = result if result is not None else range(index['count'])
+        result = {i for i in candidates if bits[i >> 3] & (1 << (i & 7))}
+    if result is None:
+        return list(range(index['count']))
+    return sorted(result)
@@ -0,0 +1,122 @@
+import json
+import math
+import os
+import re
+import time
+import zlib
+
+from journal import atomic_write_json
+from mirrors import slug_key
+
+# --- PARÇALI (SHARD) TARAMA ---
+# Büyük katalogda tek iş tüm liste sayfalarını sırayla gezer; süre katalogla
+# doğrusal büyür. --shard (veya SHARD ortam değişkeni) ile bot işin bir
+# parçasını yapar ve sonucunu SHARD_DIR altındaki parça dosyasına yazar:
+#   pages:1-20   liste sayfaları 1..20 (pages:21- : 21'den sona kadar)
+#   hash:0/4     tüm liste sayfaları gezilir, yalnızca crc32(slug) % 4 == 0
+#                olan kayıtlar açılır (liste sayfası ucuz, detay sayfası pahalı;
+#                slug alan adından bağımsızdır, bkz. mirrors)
+# Parça dosyası yalnızca bu parçanın eklediği / değiştirdiği kayıtları tutar;
+# ana katalog salt okunur taban olarak okunur (CatalogStore base_path).
+# Parçalar merge_shards.py ile ana kataloğa birleştirilir; yan dosyadaki
+# '<parça>.shard.json' bitiş zamanı, aynı kaydı taşıyan parçalardan hangisinin
+# daha yeni olduğunu belirler.
+
+SHARD_DIR = os.environ.get('SHARD_DIR', 'shards')
+MANIFEST_SUFFIX = '.shard.json'
+
+_SPEC_RE = re.compile(r'^(?:pages:(\d+)-(\d*)|hash:(\d+)/(\d+))$')
+
+
+class ShardSpec:
+    """Parça tanımı: liste sayfası aralığı ya da URL hash'i mod N."""
+
+    def __init__(self, first_page=1, last_page=None, index=0, count=1):
+        self.first_page = first_page
+        self.last_page = last_page
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, text):
+        """'pages:A-B' / 'pages:A-' / 'hash:K/N'; boş metin için None (parçasız çalışma)."""
+        text = (text or '').strip()
+        if not text:
+            return None
+        m = _SPEC_RE.match(text)
+        if not m:
+            raise ValueError(f"Geçersiz parça tanımı: {text!r} (örnek: pages:1-20, hash:0/4)")
+        if m.group(1):
+            first, last = int(m.group(1)), int(m.group(2)) if m.group(2) else None
+            if first < 1 or (last is not None and last < first):
+                raise ValueError(f"Geçersiz sayfa aralığı: {text!r}")
+            return cls(first_page=first, last_page=last)
+        index, count = int(m.group(3)), int(m.group(4))
+        if not 0 <= index < count:
+            raise ValueError(f"Geçersiz hash parçası: {text!r}")
+        return cls(index=index, count=count)
+
+    @property
+    def by_hash(self):
+        return self.count > 1
+
+    @property
+    def name(self):
+        if self.by_hash:
+            return f"h{self.index}of{self.count}"
+        return f"p{self.first_page}-{self.last_page or ''}"
+
+    def __str__(self):
+        if self.by_hash:
+            return f"hash:{self.index}/{self.count}"
+        return f"pages:{self.first_page}-{self.last_page or ''}"
+
+    # --- Kapsam ---
+    def has_page(self, page_num):
+        return self.last_page is None or page_num <= self.last_page
+
+    def owns(self, url):
+        """Kayıt (dizi / film URL'si) bu parçanın mı? Sayfa parçalarında sayfadaki her kayıt."""
+        if not self.by_hash:
+            return True
+        return zlib.crc32(slug_key(url).encode('utf-8')) % self.count == self.index
+
+    def refresh_budget(self, budget):
+        """Öncelikli yenileme bütçesinden bu parçanın payı; parçaların toplamı tek işinkine eşit kalır.
+        Sayfa parçalarında yenilemeyi yalnızca 1. sayfayı tarayan parça yapar."""
+        if self.by_hash:
+            return math.ceil(budget / self.count)
+        return budget if self.first_page == 1 else 0
+
+    # --- Çıktılar ---
+    def path(self, filename):
+        """'diziler.jsonl' -> 'shards/diziler.h0of4.jsonl'"""
+        base, ext = os.path.splitext(os.path.basename(filename))
+        return os.path.join(SHARD_DIR, f"{base}.{self.name}{ext}")
+
+    def finish(self, store, kind, base_domain=None):
+        """Parça dosyasının yanına birleştirmede kullanılan bilgileri yazar."""
+        atomic_write_json(store.path + MANIFEST_SUFFIX, {
+            'shard': str(self),
+            'kind': kind,
+            'base_domain': base_domain,
+            'finished_at': time.time(),
+            'records': store.touched_count(),
+        })
+        print(f"🧩 Parça {self} bitti: {store.touched_count()} kayıt -> {store.path}", flush=True)
+
+
+def from_env(text=None):
+    """Komut satırındaki tanım, yoksa SHARD ortam değişkeni."""
+    spec = ShardSpec.parse(text if text is not None else os.environ.get('SHARD', ''))
+    if spec:
+        os.makedirs(SHARD_DIR, exist_ok=True)
+    return spec
+
+
+def read_manifest(partial_path):
+    try:
+        with open(partial_path + MANIFEST_SUFFIX, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}